@@ -5,6 +5,11 @@ from typing import Optional
 
 import typer
 
+from robinhood_core.cache import InstrumentCache, OptionInstrumentCache
+from robinhood_core.candles import CandleStore
+from robinhood_core.journal import OrderJournal
+from robinhood_core.policy import CallPolicy
+from robinhood_core.ratelimit import RateLimiter
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import AuthRequiredError
 from robinhood_cli.output import console, error
@@ -42,7 +47,11 @@ def get_client(session_dir: Path = DEFAULT_SESSION_DIR) -> RobinhoodClient:
         error("Not logged in. Run 'rh login' to authenticate.")
         raise typer.Exit(1)
 
-    client = RobinhoodClient(session_path=str(session_dir))
+    client = RobinhoodClient(
+        session_path=str(session_dir),
+        rate_limiter=RateLimiter(),
+        call_policy=CallPolicy(),
+    )
     try:
         client.ensure_session()
     except AuthRequiredError:
@@ -52,6 +61,28 @@ def get_client(session_dir: Path = DEFAULT_SESSION_DIR) -> RobinhoodClient:
     return client
 
 
+def get_instrument_cache(session_dir: Path = DEFAULT_SESSION_DIR) -> InstrumentCache:
+    """Return the on-disk instrument cache stored next to the session."""
+    return InstrumentCache.open(session_dir)
+
+
+def get_option_instrument_cache(
+    session_dir: Path = DEFAULT_SESSION_DIR,
+) -> OptionInstrumentCache:
+    """Return the on-disk option instrument cache stored next to the session."""
+    return OptionInstrumentCache.open(session_dir)
+
+
+def get_order_journal(session_dir: Path = DEFAULT_SESSION_DIR) -> OrderJournal:
+    """Return the on-disk order journal stored next to the session."""
+    return OrderJournal.open(session_dir)
+
+
+def get_candle_store(session_dir: Path = DEFAULT_SESSION_DIR) -> CandleStore:
+    """Return the on-disk candle store kept next to the session."""
+    return CandleStore.open(session_dir)
+
+
 # ── CLI commands ──────────────────────────────────────────────────────────────
 
 def login_command() -> None:
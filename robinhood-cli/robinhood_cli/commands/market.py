@@ -4,7 +4,7 @@ import typer
 from rich.table import Table
 
 from robinhood_core.services.market_data import MarketDataService
-from robinhood_cli.auth import get_client
+from robinhood_cli.auth import get_candle_store, get_client
 from robinhood_cli.output import (
     console,
     format_currency,
@@ -84,7 +84,7 @@ def history_command(
 ) -> None:
     """Historical OHLCV price data."""
     client = get_client()
-    svc = MarketDataService(client)
+    svc = MarketDataService(client, candle_store=get_candle_store())
     candles = svc.get_price_history(symbol, interval, span, bounds)
 
     if json_output:
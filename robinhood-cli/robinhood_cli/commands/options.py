@@ -1,10 +1,10 @@
-from typing import Annotated, Optional
+from typing import Annotated, List, Optional
 
 import typer
 from rich.table import Table
 
 from robinhood_core.services.options import OptionsService
-from robinhood_cli.auth import get_client
+from robinhood_cli.auth import get_client, get_option_instrument_cache
 from robinhood_cli.output import console, format_currency, print_json
 
 
@@ -26,12 +26,15 @@ def options_chain_command(
     expiry: Annotated[Optional[str], typer.Option("--expiry", help="Expiration date YYYY-MM-DD")] = None,
     option_type: Annotated[Optional[str], typer.Option("--type", help="call or put")] = None,
     strike: Annotated[Optional[str], typer.Option("--strike", help="Strike price for full Greeks lookup")] = None,
+    strikes: Annotated[Optional[List[str]], typer.Option("--strikes", help="Several strikes for full Greeks (repeatable)")] = None,
+    atm: Annotated[Optional[int], typer.Option("--atm", help="Full Greeks for the N strikes nearest the money")] = None,
+    greeks: Annotated[bool, typer.Option("--greeks", help="Full Greeks for every contract in the chain listing")] = False,
     json_output: Annotated[bool, typer.Option("--json", help="Output raw JSON")] = False,
 ) -> None:
-    """Options chain (add --strike for full Greeks and bid/ask)."""
+    """Options chain (add --strike, --strikes, --atm, or --greeks for full Greeks and bid/ask)."""
     client = get_client()
     svc = OptionsService(client)
-    contracts = svc.get_options_chain(symbol, expiry, option_type, strike)
+    contracts = svc.get_options_chain(symbol, expiry, option_type, strike, strikes, atm, greeks)
 
     if json_output:
         print_json([c.model_dump() for c in contracts])
@@ -63,7 +66,7 @@ def options_chain_command(
 
     console.print(table)
     if not has_greeks:
-        console.print(f"[dim]Tip: use --strike <price> to fetch full Greeks and bid/ask[/dim]")
+        console.print(f"[dim]Tip: use --strike <price>, --atm <n> or --greeks to fetch full Greeks and bid/ask[/dim]")
 
 
 def options_positions_command(
@@ -71,7 +74,9 @@ def options_positions_command(
 ) -> None:
     """Open options positions."""
     client = get_client()
-    svc = OptionsService(client)
+    svc = OptionsService(
+        client, option_instrument_cache=get_option_instrument_cache()
+    )
     positions = svc.get_option_positions()
 
     if json_output:
@@ -5,20 +5,26 @@ import typer
 from rich.table import Table
 
 from robinhood_core.services.orders import OrdersService
-from robinhood_cli.auth import get_client
-from robinhood_cli.output import console, format_currency, print_json, POSITIVE, NEGATIVE
+from robinhood_cli.auth import get_client, get_instrument_cache, get_order_journal
+from robinhood_cli.output import console, error, format_currency, print_json, POSITIVE, NEGATIVE
 
 
 def orders_command(
     order_type: Annotated[str, typer.Option("--type", help="stock, option, crypto, or all")] = "all",
     symbol: Annotated[Optional[str], typer.Option("--symbol", help="Filter by symbol")] = None,
     since: Annotated[Optional[str], typer.Option("--since", help="Start date YYYY-MM-DD")] = None,
+    limit: Annotated[Optional[int], typer.Option("--limit", help="Newest N orders per type")] = None,
+    journal: Annotated[bool, typer.Option("--journal", help="Sync a local order journal and query it")] = False,
     json_output: Annotated[bool, typer.Option("--json", help="Output raw JSON")] = False,
 ) -> None:
     """Order history (stock, option, crypto)."""
     client = get_client()
-    svc = OrdersService(client)
-    history = asyncio.run(asyncio.to_thread(svc.get_order_history, order_type, symbol, since))
+    svc = OrdersService(
+        client,
+        instrument_cache=get_instrument_cache(),
+        journal=get_order_journal() if journal else None,
+    )
+    history = asyncio.run(asyncio.to_thread(svc.get_order_history, order_type, symbol, since, limit))
 
     if json_output:
         print_json(history.model_dump())
@@ -70,6 +76,7 @@ def orders_command(
     if history.crypto_orders:
         table = Table(show_header=True, header_style="bold", title="Crypto Orders")
         table.add_column("Date")
+        table.add_column("Symbol")
         table.add_column("Side")
         table.add_column("State")
         table.add_column("Qty", justify="right")
@@ -80,6 +87,7 @@ def orders_command(
             side_color = "green" if o.side == "buy" else "red"
             table.add_row(
                 date,
+                o.symbol or o.currency_pair_id or "—",
                 f"[{side_color}]{o.side or '—'}[/{side_color}]",
                 o.state or "—",
                 f"{o.cumulative_quantity:.4g}" if o.cumulative_quantity else "—",
@@ -87,8 +95,11 @@ def orders_command(
             )
         console.print(table)
 
+    for category, message in history.errors.items():
+        error(f"Could not load {category} orders: {message}")
+
     total = len(history.stock_orders) + len(history.option_orders) + len(history.crypto_orders)
-    if total == 0:
+    if total == 0 and not history.errors:
         console.print("No orders found.")
 
 
@@ -5,7 +5,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from robinhood_core.services.portfolio import PortfolioService
-from robinhood_cli.auth import get_client
+from robinhood_cli.auth import get_client, get_instrument_cache
 from robinhood_cli.output import (
     console,
     format_currency,
@@ -58,7 +58,7 @@ def positions_command(
 ) -> None:
     """Open stock positions."""
     client = get_client()
-    svc = PortfolioService(client)
+    svc = PortfolioService(client, instrument_cache=get_instrument_cache())
     positions = svc.get_positions(symbols)
 
     if json_output:
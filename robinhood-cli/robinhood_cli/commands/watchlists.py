@@ -4,7 +4,7 @@ import typer
 from rich.table import Table
 
 from robinhood_core.services.watchlists import WatchlistsService
-from robinhood_cli.auth import get_client
+from robinhood_cli.auth import get_client, get_instrument_cache
 from robinhood_cli.output import console, print_json
 
 
@@ -17,7 +17,7 @@ def watchlists_command(
 ) -> None:
     """List all watchlists."""
     client = get_client()
-    svc = WatchlistsService(client)
+    svc = WatchlistsService(client, instrument_cache=get_instrument_cache())
     watchlists = svc.get_watchlists()
 
     if json_output:
@@ -0,0 +1,25 @@
+"""Async variants of the Robinhood services.
+
+Requires the ``async`` extra (httpx).  The services return the same
+models as ``robinhood_core.services`` and share the sync client's login.
+"""
+
+from .fundamentals import AsyncFundamentalsService
+from .http import AsyncRobinhoodHTTP
+from .market_data import AsyncMarketDataService
+from .news import AsyncNewsService
+from .options import AsyncOptionsService
+from .orders import AsyncOrdersService
+from .portfolio import AsyncPortfolioService
+from .watchlists import AsyncWatchlistsService
+
+__all__ = [
+    "AsyncRobinhoodHTTP",
+    "AsyncFundamentalsService",
+    "AsyncMarketDataService",
+    "AsyncNewsService",
+    "AsyncOptionsService",
+    "AsyncOrdersService",
+    "AsyncPortfolioService",
+    "AsyncWatchlistsService",
+]
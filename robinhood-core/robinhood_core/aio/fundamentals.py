@@ -0,0 +1,42 @@
+# robinhood_core/aio/fundamentals.py
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import Fundamentals
+from robinhood_core.services.fundamentals import FundamentalsService
+
+
+class AsyncFundamentalsService:
+    """Async variant of ``FundamentalsService``."""
+
+    def __init__(self, http: AsyncRobinhoodHTTP):
+        self.http = http
+
+    async def get_fundamentals(self, symbol: str) -> Fundamentals:
+        """Get fundamentals for a symbol."""
+        if not symbol:
+            raise InvalidArgumentError("Symbol is required")
+
+        await self.http.ensure_session()
+
+        try:
+            data = await self.http.results(
+                urls.fundamentals_url(), {"symbols": symbol.upper().strip()}
+            )
+            if not data:
+                # Return empty fundamentals for invalid symbols
+                return Fundamentals()
+            return FundamentalsService._build_fundamentals(data[0])
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch fundamentals: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch fundamentals: {e}") from e
@@ -0,0 +1,307 @@
+# robinhood_core/aio/http.py
+import asyncio
+import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from robin_stocks.robinhood import globals as rh_globals
+from robin_stocks.robinhood import urls
+
+from robinhood_core.cache import INSTRUMENT_CHUNK_SIZE, InstrumentCache, _SQLiteCache
+from robinhood_core.client import DEFAULT_POOL_MAXSIZE, RobinhoodClient
+from robinhood_core.errors import RobinhoodAPIError
+from robinhood_core.policy import RETRY_STATUSES, CircuitOpenError
+from robinhood_core.ratelimit import endpoint_family
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover - optional dependency
+    raise ImportError(
+        "robinhood_core.aio requires httpx; install robinhood-core[async]"
+    ) from e
+
+logger = logging.getLogger(__name__)
+
+# Read timeout used when the client has no call policy.
+_DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=3.05)
+
+
+class AsyncRobinhoodHTTP:
+    """Async HTTP client that shares the robin_stocks login.
+
+    Requests carry the headers of the global robin_stocks session, read at
+    send time, so the bearer token from ``RobinhoodClient.ensure_session``
+    (or a later re-login) is reused without a second login.  The client's
+    ``rate_limiter`` and ``call_policy`` apply exactly as they do in
+    ``RobinhoodAdapter``: per-family budgets, timeouts, retries for reads,
+    and circuit breaking.
+
+    The underlying ``httpx.AsyncClient`` is created on first use and bound
+    to the running event loop; close it with ``aclose`` (or use the object
+    as an async context manager) before the loop ends.
+
+    Args:
+        client: Robinhood client holding the session and request policies.
+        max_connections: Connection pool size.
+        transport: Optional httpx transport, for tests.
+        max_throttle_retries: Retries of a throttled (429) request.
+        sleep: Coroutine used to wait, for tests.
+    """
+
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        max_connections: int = DEFAULT_POOL_MAXSIZE,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_throttle_retries: int = 2,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.client = client
+        self.max_connections = max_connections
+        self.max_throttle_retries = max_throttle_retries
+        self._transport = transport
+        self._sleep = sleep
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def __aenter__(self) -> "AsyncRobinhoodHTTP":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _session(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                follow_redirects=True,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def ensure_session(self) -> None:
+        """Log in through the sync client, off the event loop, if needed."""
+        if not self.client.authenticated:
+            await asyncio.to_thread(self.client.ensure_session)
+
+    async def get(self, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+        """GET ``url`` and return the decoded JSON body.
+
+        Raises ``httpx.HTTPStatusError`` for error responses that are not
+        retried, and ``CircuitOpenError`` while the family's breaker is open.
+        """
+        policy = self.client.call_policy
+        limiter = self.client.rate_limiter
+        breaker = policy.breaker(url) if policy is not None else None
+        if policy is not None:
+            connect, read = policy.timeout(url)
+            timeout = httpx.Timeout(read, connect=connect)
+        else:
+            timeout = _DEFAULT_TIMEOUT
+
+        # As in ``RobinhoodAdapter``, the breaker sees one outcome per call.
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                f"Robinhood {endpoint_family(url)} requests are "
+                "failing; not retrying until the circuit resets"
+            )
+
+        attempt = 0
+        throttled = 0
+        while True:
+            if limiter is not None:
+                wait = limiter.bucket(url).reserve()
+                if wait > 0:
+                    await self._sleep(wait)
+
+            try:
+                response = await self._session().get(
+                    url,
+                    params=params,
+                    headers=dict(rh_globals.SESSION.headers),
+                    timeout=timeout,
+                )
+            except httpx.TransportError:
+                if policy is None or not policy.should_retry("GET", attempt):
+                    if breaker is not None:
+                        breaker.record_failure()
+                    raise
+                attempt += 1
+                logger.debug("Retrying failed request (attempt %d)", attempt)
+                await self._sleep(policy.delay(attempt))
+                continue
+
+            if limiter is not None:
+                limiter.observe(
+                    url, response.status_code, response.headers.get("Retry-After")
+                )
+
+            if policy is not None and response.status_code in RETRY_STATUSES:
+                if policy.should_retry("GET", attempt):
+                    attempt += 1
+                    logger.debug(
+                        "Retrying HTTP %d response (attempt %d)",
+                        response.status_code,
+                        attempt,
+                    )
+                    await self._sleep(policy.delay(attempt))
+                    continue
+                breaker.record_failure()
+            elif breaker is not None:
+                breaker.record_success()
+
+            if (
+                limiter is not None
+                and response.status_code == 429
+                and throttled < self.max_throttle_retries
+            ):
+                throttled += 1
+                logger.debug("Retrying throttled request (attempt %d)", throttled)
+                continue
+
+            response.raise_for_status()
+            return response.json()
+
+    async def results(
+        self, url: str, params: Optional[Dict[str, str]] = None
+    ) -> List[dict]:
+        """GET ``url`` and return its ``results`` list."""
+        data = await self.get(url, params)
+        if not isinstance(data, dict):
+            return []
+        return [item for item in data.get("results") or [] if item]
+
+    async def iter_pages(
+        self, url: str, params: Optional[Dict[str, str]] = None
+    ) -> AsyncIterator[List[dict]]:
+        """Yield the results of a paginated endpoint one page at a time.
+
+        The next page is only requested once the caller asks for it.  A
+        page that is not a JSON object raises ``RobinhoodAPIError`` instead
+        of silently ending the results early.
+        """
+        async for _, page, _ in self.iter_page_links(url, params):
+            yield page
+
+    async def iter_page_links(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        resume_url: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[Optional[str], List[dict], Optional[str]]]:
+        """Like ``iter_pages``, with each page's URL and ``next`` link.
+
+        Matches ``OrdersService._iter_order_pages``: the first page's URL is
+        ``None``, and ``resume_url`` starts at a later page.
+        """
+        page_url: Optional[str] = resume_url
+        if resume_url:
+            # The ``next`` link already carries the query string.
+            params = None
+        while True:
+            request_url = page_url or url
+            data = await self.get(request_url, params)
+            params = None
+            if not isinstance(data, dict):
+                raise RobinhoodAPIError(f"Failed to load page: {request_url}")
+            next_url = data.get("next")
+            yield (
+                page_url,
+                [item for item in data.get("results") or [] if item],
+                next_url,
+            )
+            if not next_url:
+                return
+            page_url = next_url
+
+    async def paginate(
+        self, url: str, params: Optional[Dict[str, str]] = None
+    ) -> List[dict]:
+        """GET every page of a paginated endpoint and join the results."""
+        items: List[dict] = []
+        async for page in self.iter_pages(url, params):
+            items.extend(page)
+        return items
+
+    async def resolve(self, cache: _SQLiteCache, key: str, url: str) -> Optional[dict]:
+        """Async counterpart of ``_SQLiteCache.resolve``: GET ``url`` on a miss.
+
+        The caches are backed by SQLite, so their reads and writes run in a
+        worker thread rather than blocking the event loop.
+        """
+        value = await asyncio.to_thread(cache.get, key)
+        if value is not None:
+            return value
+        fetched = await self.get(url)
+        if not fetched or not isinstance(fetched, dict):
+            return None
+        await asyncio.to_thread(cache.put, key, fetched)
+        return fetched
+
+    async def symbol_for(
+        self, cache: InstrumentCache, url: Optional[str]
+    ) -> Optional[str]:
+        """Async counterpart of ``InstrumentCache.symbol_for``."""
+        if not url:
+            return None
+        instrument = await self.resolve(cache, url, url)
+        return instrument.get("symbol") if instrument else None
+
+    async def url_for_symbol(
+        self, cache: InstrumentCache, symbol: str
+    ) -> Optional[str]:
+        """Async counterpart of ``InstrumentCache.url_for_symbol``."""
+        url = await asyncio.to_thread(cache.url_for_symbol, symbol)
+        if url is not None:
+            return url
+        instruments = await self.results(
+            urls.instruments_url(), {"symbol": symbol.upper().strip()}
+        )
+        instrument = instruments[0] if instruments else None
+        if not instrument or not instrument.get("url"):
+            return None
+        await asyncio.to_thread(cache.put, instrument["url"], instrument)
+        return instrument["url"]
+
+    async def prefetch_instruments(
+        self, cache: InstrumentCache, instrument_urls: Iterable[Optional[str]]
+    ) -> None:
+        """Async counterpart of ``InstrumentCache.prefetch``.
+
+        Chunks of ids are requested concurrently.  Failed chunks are left
+        for ``symbol_for`` to resolve one by one.
+        """
+        pending = await asyncio.to_thread(cache.unresolved, list(instrument_urls))
+        ids = list(pending)
+        chunks = [
+            ids[i : i + INSTRUMENT_CHUNK_SIZE]
+            for i in range(0, len(ids), INSTRUMENT_CHUNK_SIZE)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self.results(urls.instruments_url(), {"ids": ",".join(chunk)})
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        for page in pages:
+            if isinstance(page, Exception):
+                logger.debug("Bulk instrument lookup failed: %s", page)
+                continue
+            await asyncio.to_thread(cache.store, pending, page)
@@ -0,0 +1,102 @@
+# robinhood_core/aio/market_data.py
+from typing import List, Optional
+
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.cache import QUOTE_CHUNK_SIZE, QuoteCache
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import Candle, Quote
+from robinhood_core.services.market_data import MarketDataService
+
+
+async def fetch_quotes(
+    http: AsyncRobinhoodHTTP, quote_cache: QuoteCache, symbols: List[str]
+) -> dict:
+    """Return raw quotes keyed by symbol, fetching only missing ones.
+
+    Async counterpart of ``QuoteCache.get_quotes``; misses are fetched
+    ``QUOTE_CHUNK_SIZE`` symbols per request.
+    """
+    wanted = list(dict.fromkeys(s.upper() for s in symbols if s))
+    found, missing = quote_cache.lookup(wanted)
+    for i in range(0, len(missing), QUOTE_CHUNK_SIZE):
+        chunk = missing[i : i + QUOTE_CHUNK_SIZE]
+        data = await http.results(urls.quotes_url(), {"symbols": ",".join(chunk)})
+        stored = quote_cache.store(data)
+        found.update((s, stored[s]) for s in chunk if s in stored)
+    return {s: found[s] for s in wanted if s in found}
+
+
+class AsyncMarketDataService:
+    """Async variant of ``MarketDataService``.
+
+    Historical bars are always fetched from Robinhood; the candle store
+    is only used by the sync service.
+    """
+
+    def __init__(
+        self,
+        http: AsyncRobinhoodHTTP,
+        quote_cache: Optional[QuoteCache] = None,
+    ):
+        self.http = http
+        self.quote_cache = quote_cache or QuoteCache()
+
+    async def get_current_price(self, symbols: List[str]) -> List[Quote]:
+        """Get current price quotes for symbols."""
+        if not symbols:
+            raise InvalidArgumentError("At least one symbol is required")
+
+        await self.http.ensure_session()
+
+        try:
+            data = await fetch_quotes(self.http, self.quote_cache, symbols)
+            return [MarketDataService._build_quote(item) for item in data.values()]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch quotes: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch quotes: {e}") from e
+
+    async def get_price_history(
+        self,
+        symbol: str,
+        interval: str = "hour",
+        span: str = "week",
+        bounds: str = "regular",
+    ) -> List[Candle]:
+        """Get historical price data for a symbol."""
+        MarketDataService._validate_history_args(symbol, interval, span, bounds)
+
+        await self.http.ensure_session()
+
+        try:
+            results = await self.http.results(
+                urls.historicals_url(),
+                {
+                    "symbols": symbol.upper().strip(),
+                    "interval": interval,
+                    "span": span,
+                    "bounds": bounds,
+                },
+            )
+            return [
+                MarketDataService._build_candle(bar)
+                for item in results
+                for bar in item.get("historicals") or []
+                if bar
+            ]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch price history: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch price history: {e}") from e
@@ -0,0 +1,43 @@
+# robinhood_core/aio/news.py
+from typing import List
+
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import NewsItem
+from robinhood_core.services.news import NewsService
+
+
+class AsyncNewsService:
+    """Async variant of ``NewsService``."""
+
+    def __init__(self, http: AsyncRobinhoodHTTP):
+        self.http = http
+
+    async def get_news(self, symbol: str) -> List[NewsItem]:
+        """Get news for a symbol."""
+        if not symbol:
+            raise InvalidArgumentError("A stock symbol is required to fetch news.")
+
+        await self.http.ensure_session()
+
+        try:
+            data = await self.http.results(urls.news_url(symbol.upper().strip()))
+            return [
+                NewsService._build_news_item(item)
+                for item in data
+                if isinstance(item, dict)
+            ]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
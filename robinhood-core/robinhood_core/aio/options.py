@@ -0,0 +1,302 @@
+# robinhood_core/aio/options.py
+import asyncio
+import logging
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.aio.market_data import fetch_quotes
+from robinhood_core.cache import OptionInstrumentCache, QuoteCache
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import OptionContract, OptionPosition
+from robinhood_core.services.options import MARKET_DATA_CHUNK_SIZE, OptionsService
+
+logger = logging.getLogger(__name__)
+
+# robin_stocks' chains_url() looks up the chain id with a blocking request,
+# so the async service builds the URL itself.
+_CHAINS_URL = "https://api.robinhood.com/options/chains/{0}/"
+
+
+class AsyncOptionsService:
+    """Async variant of ``OptionsService``.
+
+    Uses the same three strategies (chain listing, targeted lookup, strike
+    ladder).  A targeted lookup fetches the call and put instruments in one
+    request and their market data in one more.
+    """
+
+    def __init__(
+        self,
+        http: AsyncRobinhoodHTTP,
+        option_instrument_cache: Optional[OptionInstrumentCache] = None,
+        quote_cache: Optional[QuoteCache] = None,
+    ):
+        self.http = http
+        self.option_instrument_cache = (
+            option_instrument_cache or OptionInstrumentCache()
+        )
+        self.quote_cache = quote_cache or QuoteCache()
+        # symbol -> (day fetched, expiration dates from the chain)
+        self._expirations: Dict[str, Tuple[date, List[str]]] = {}
+
+    async def get_options_chain(
+        self,
+        symbol: str,
+        expiration_date: Optional[str] = None,
+        option_type: Optional[str] = None,
+        strike_price: Optional[str] = None,
+        strike_prices: Optional[List[str]] = None,
+        strikes_around_atm: Optional[int] = None,
+        with_market_data: bool = False,
+    ) -> List[OptionContract]:
+        """Get options chain for a symbol.
+
+        Arguments match ``OptionsService.get_options_chain``.
+        """
+        if not symbol:
+            raise InvalidArgumentError("Symbol is required")
+        if strikes_around_atm is not None and strikes_around_atm < 1:
+            raise InvalidArgumentError("strikes_around_atm must be at least 1")
+
+        await self.http.ensure_session()
+
+        try:
+            symbol = symbol.upper().strip()
+            if not expiration_date:
+                expiration_date = await self._nearest_expiration(symbol)
+                if not expiration_date:
+                    return []
+            exp = str(expiration_date)
+
+            if strike_prices or strikes_around_atm:
+                return await self._strike_ladder(
+                    symbol, exp, option_type, strike_prices, strikes_around_atm
+                )
+            if strike_price:
+                return await self._targeted_lookup(
+                    symbol, exp, strike_price, option_type
+                )
+            return await self._chain_listing(symbol, exp, option_type, with_market_data)
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch options chain: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch options chain: {e}") from e
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    async def _chain_id(self, symbol: str) -> Optional[str]:
+        instruments = await self.http.results(
+            urls.instruments_url(), {"symbol": symbol}
+        )
+        return instruments[0].get("tradable_chain_id") if instruments else None
+
+    async def _nearest_expiration(self, symbol: str) -> Optional[str]:
+        """Return the nearest expiration date, fetched once per day."""
+        today = date.today()
+        cached = self._expirations.get(symbol)
+        if cached is not None:
+            fetched_on, expirations = cached
+            if fetched_on == today and expirations[0] >= today.isoformat():
+                return expirations[0]
+
+        chain_id = await self._chain_id(symbol)
+        if not chain_id:
+            return None
+        chain = await self.http.get(_CHAINS_URL.format(chain_id))
+        if not chain or not isinstance(chain, dict):
+            return None
+        expirations = [str(e) for e in chain.get("expiration_dates") or []]
+        if not expirations:
+            return None
+
+        self._expirations[symbol] = (today, expirations)
+        return expirations[0]
+
+    async def _tradable_options(
+        self,
+        symbol: str,
+        exp: str,
+        option_type: Optional[str],
+        strike_price: Optional[str] = None,
+    ) -> List[dict]:
+        """Async ``find_tradable_options``: active instruments for ``exp``."""
+        chain_id = await self._chain_id(symbol)
+        if not chain_id:
+            return []
+        params = {
+            "chain_id": chain_id,
+            "chain_symbol": symbol,
+            "state": "active",
+            "expiration_dates": exp,
+        }
+        if strike_price:
+            params["strike_price"] = str(strike_price)
+        if option_type:
+            params["type"] = option_type
+        items = await self.http.paginate(urls.option_instruments_url(), params)
+        return [item for item in items if isinstance(item, dict)]
+
+    async def _market_data_by_ids(self, ids: List[str]) -> Dict[str, dict]:
+        """Fetch option market data for many ids, chunks concurrently."""
+        chunks = [
+            ids[start : start + MARKET_DATA_CHUNK_SIZE]
+            for start in range(0, len(ids), MARKET_DATA_CHUNK_SIZE)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self.http.results(
+                    urls.marketdata_options_url(), {"ids": ",".join(chunk)}
+                )
+                for chunk in chunks
+            )
+        )
+        by_id: Dict[str, dict] = {}
+        for results in pages:
+            OptionsService._index_market_data(results, by_id)
+        return by_id
+
+    async def _with_market_data(
+        self, symbol: str, exp: str, instruments: List[dict]
+    ) -> List[OptionContract]:
+        market_data = await self._market_data_by_ids(
+            [item["id"] for item in instruments if item.get("id")]
+        )
+        return [
+            # Instrument fields (strike/type/expiration) win over market data.
+            OptionsService._build_contract(
+                {**market_data.get(item.get("id"), {}), **item}, symbol, exp
+            )
+            for item in instruments
+        ]
+
+    async def _get_current_price(self, symbol: str) -> Optional[float]:
+        try:
+            quote = (await fetch_quotes(self.http, self.quote_cache, [symbol])).get(
+                symbol
+            )
+            if quote:
+                price = quote.get("last_extended_hours_trade_price") or quote.get(
+                    "last_trade_price"
+                )
+                if price:
+                    return float(price)
+        except Exception:
+            pass
+        return None
+
+    async def _targeted_lookup(
+        self,
+        symbol: str,
+        exp: str,
+        strike_price: str,
+        option_type: Optional[str],
+    ) -> List[OptionContract]:
+        instruments = await self._tradable_options(
+            symbol, exp, option_type, strike_price
+        )
+        instruments.sort(key=lambda item: 0 if item.get("type") == "call" else 1)
+        return await self._with_market_data(symbol, exp, instruments)
+
+    async def _strike_ladder(
+        self,
+        symbol: str,
+        exp: str,
+        option_type: Optional[str],
+        strike_prices: Optional[List[str]],
+        strikes_around_atm: Optional[int],
+    ) -> List[OptionContract]:
+        instruments = [
+            item
+            for item in await self._tradable_options(symbol, exp, option_type)
+            if item.get("id")
+        ]
+        if not instruments:
+            return []
+
+        current_price = None
+        if strikes_around_atm:
+            current_price = await self._get_current_price(symbol)
+            if current_price is None:
+                raise RobinhoodAPIError(
+                    f"Could not determine current price for {symbol}"
+                )
+        selected = OptionsService._select_strikes(
+            instruments, strike_prices, strikes_around_atm, current_price
+        )
+        return await self._with_market_data(symbol, exp, selected)
+
+    async def _chain_listing(
+        self,
+        symbol: str,
+        exp: str,
+        option_type: Optional[str],
+        with_market_data: bool = False,
+    ) -> List[OptionContract]:
+        options_data, current_price = await asyncio.gather(
+            self._tradable_options(symbol, exp, option_type),
+            self._get_current_price(symbol),
+        )
+        selected = [
+            item
+            for item in options_data
+            if OptionsService._near_the_money(item, current_price)
+        ]
+        if with_market_data:
+            return await self._with_market_data(symbol, exp, selected)
+        return [OptionsService._build_contract(item, symbol, exp) for item in selected]
+
+    async def get_option_positions(self) -> List[OptionPosition]:
+        """Get all open option positions for the account."""
+        await self.http.ensure_session()
+
+        try:
+            positions_data = [
+                item
+                for item in await self.http.paginate(
+                    urls.option_positions_url(None), {"nonzero": "True"}
+                )
+                if isinstance(item, dict)
+            ]
+            instruments = await asyncio.gather(
+                *(
+                    self._option_instrument(item.get("option"))
+                    for item in positions_data
+                )
+            )
+            return [
+                OptionsService._build_option_position(item, instrument)
+                for item, instrument in zip(positions_data, instruments)
+            ]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch option positions: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch option positions: {e}") from e
+
+    async def _option_instrument(self, option_url: Optional[str]) -> Optional[dict]:
+        if not option_url:
+            return None
+        option_id = option_url.rstrip("/").split("/")[-1]
+        try:
+            return await self.http.resolve(
+                self.option_instrument_cache,
+                option_id,
+                urls.option_instruments_url(option_id),
+            )
+        except Exception:
+            logger.debug("Failed to resolve option instrument: %s", option_url)
+            return None
@@ -0,0 +1,226 @@
+# robinhood_core/aio/orders.py
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.cache import CryptoPairTable, InstrumentCache
+from robinhood_core.errors import InvalidArgumentError
+from robinhood_core.models.orders import (
+    CryptoOrder,
+    OptionOrder,
+    OrderHistory,
+    StockOrder,
+)
+from robinhood_core.services.orders import CursorEntry, OrdersService
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOrdersService:
+    """Async variant of ``OrdersService``.
+
+    Always reads order history from Robinhood; the order journal is only
+    used by the sync service.  Categories are paged concurrently, newest
+    first, stopping once ``limit`` orders match; a failing category is
+    reported in ``OrderHistory.errors`` as in the sync service.
+    """
+
+    def __init__(
+        self,
+        http: AsyncRobinhoodHTTP,
+        instrument_cache: Optional[InstrumentCache] = None,
+        crypto_pairs: Optional[CryptoPairTable] = None,
+    ):
+        self.http = http
+        self.instrument_cache = instrument_cache or InstrumentCache()
+        self.crypto_pairs = crypto_pairs or CryptoPairTable()
+
+    async def get_order_history(
+        self,
+        order_type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        start_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> OrderHistory:
+        """Arguments match ``OrdersService.get_order_history``."""
+        if limit is not None and limit < 1:
+            raise InvalidArgumentError("limit must be at least 1")
+
+        await self.http.ensure_session()
+
+        order_type = OrdersService._validate_order_type(order_type)
+        positions = OrdersService._page_positions(order_type, cursor)
+
+        fetchers = {}
+        if "stock" in positions:
+            fetchers["stock"] = self._get_stock_orders(
+                symbol, start_date, limit, end_date, state, positions["stock"]
+            )
+        if "option" in positions:
+            fetchers["option"] = self._get_option_orders(
+                symbol, start_date, limit, end_date, state, positions["option"]
+            )
+        if "crypto" in positions:
+            fetchers["crypto"] = self._get_crypto_orders(
+                start_date, limit, end_date, state, positions["crypto"]
+            )
+        if not fetchers:
+            return OrderHistory()
+
+        outcomes = await asyncio.gather(*fetchers.values(), return_exceptions=True)
+        results: Dict[str, list] = {}
+        pending: Dict[str, CursorEntry] = {}
+        errors: Dict[str, Exception] = {}
+        for name, outcome in zip(fetchers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Failed to fetch %s orders: %s", name, outcome)
+                errors[name] = outcome
+                continue
+            results[name], resume = outcome
+            if resume is not None:
+                pending[name] = resume
+
+        return OrdersService._assemble_history(results, errors, pending, positions)
+
+    async def _get_stock_orders(
+        self,
+        symbol: Optional[str],
+        start_date: Optional[str],
+        limit: Optional[int],
+        end_date: Optional[str],
+        state: Optional[str],
+        position: CursorEntry,
+    ) -> Tuple[List[StockOrder], CursorEntry]:
+        url = urls.orders_url(start_date=start_date)
+        page_url, skip = OrdersService._resume(position, url)
+
+        params = None
+        if symbol:
+            instrument_url = await self.http.url_for_symbol(
+                self.instrument_cache, symbol
+            )
+            if instrument_url is None:
+                return [], None
+            params = {"instrument": instrument_url}
+
+        orders: List[StockOrder] = []
+        pages = self.http.iter_page_links(url, params, page_url)
+        async for page_url, page, next_url in pages:
+            wanted = [
+                index
+                for index in range(skip, len(page))
+                if isinstance(page[index], dict)
+                and OrdersService._in_page(page[index], end_date, state)
+            ]
+            skip = 0
+            await self.http.prefetch_instruments(
+                self.instrument_cache,
+                [page[index].get("instrument") for index in wanted],
+            )
+            order_symbols = await asyncio.gather(
+                *(self._resolve_stock_symbol(page[index]) for index in wanted)
+            )
+            for index, order_symbol in zip(wanted, order_symbols):
+                if symbol and order_symbol and order_symbol.upper() != symbol.upper():
+                    continue
+                orders.append(
+                    OrdersService._build_stock_order(page[index], order_symbol)
+                )
+                if limit and len(orders) >= limit:
+                    await pages.aclose()
+                    return orders, OrdersService._resume_at(
+                        page_url, page, index, next_url
+                    )
+        return orders, None
+
+    async def _get_option_orders(
+        self,
+        symbol: Optional[str],
+        start_date: Optional[str],
+        limit: Optional[int],
+        end_date: Optional[str],
+        state: Optional[str],
+        position: CursorEntry,
+    ) -> Tuple[List[OptionOrder], CursorEntry]:
+        url = urls.option_orders_url(start_date=start_date)
+        page_url, skip = OrdersService._resume(position, url)
+
+        orders: List[OptionOrder] = []
+        pages = self.http.iter_page_links(url, None, page_url)
+        async for page_url, page, next_url in pages:
+            for index in range(skip, len(page)):
+                item = page[index]
+                if not isinstance(item, dict):
+                    continue
+                if not OrdersService._in_page(item, end_date, state):
+                    continue
+                chain_symbol = item.get("chain_symbol")
+                if symbol and chain_symbol and chain_symbol.upper() != symbol.upper():
+                    continue
+                orders.append(OrdersService._build_option_order(item))
+                if limit and len(orders) >= limit:
+                    await pages.aclose()
+                    return orders, OrdersService._resume_at(
+                        page_url, page, index, next_url
+                    )
+            skip = 0
+        return orders, None
+
+    async def _get_crypto_orders(
+        self,
+        start_date: Optional[str],
+        limit: Optional[int],
+        end_date: Optional[str],
+        state: Optional[str],
+        position: CursorEntry,
+    ) -> Tuple[List[CryptoOrder], CursorEntry]:
+        url = urls.crypto_orders_url()
+        page_url, skip = OrdersService._resume(position, url)
+        await self._load_crypto_pairs()
+
+        orders: List[CryptoOrder] = []
+        pages = self.http.iter_page_links(url, None, page_url)
+        async for page_url, page, next_url in pages:
+            for index in range(skip, len(page)):
+                item = page[index]
+                if not isinstance(item, dict):
+                    continue
+                if start_date and str(item.get("created_at") or "") < start_date:
+                    await pages.aclose()
+                    return orders, None
+                if not OrdersService._in_page(item, end_date, state):
+                    continue
+                pair_symbol = self.crypto_pairs.symbol_for(item.get("currency_pair_id"))
+                orders.append(OrdersService._build_crypto_order(item, pair_symbol))
+                if limit and len(orders) >= limit:
+                    await pages.aclose()
+                    return orders, OrdersService._resume_at(
+                        page_url, page, index, next_url
+                    )
+            skip = 0
+        return orders, None
+
+    async def _load_crypto_pairs(self) -> None:
+        if not self.crypto_pairs.due:
+            return
+        try:
+            self.crypto_pairs.load(
+                await self.http.results(urls.crypto_currency_pairs_url())
+            )
+        except Exception as e:
+            logger.debug("Crypto pair lookup failed: %s", e)
+            self.crypto_pairs.failed()
+
+    async def _resolve_stock_symbol(self, item: dict) -> Optional[str]:
+        instrument_url = item.get("instrument")
+        try:
+            return await self.http.symbol_for(self.instrument_cache, instrument_url)
+        except Exception:
+            logger.debug("Failed to resolve instrument: %s", instrument_url)
+        return None
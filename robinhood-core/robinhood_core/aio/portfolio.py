@@ -0,0 +1,98 @@
+# robinhood_core/aio/portfolio.py
+import asyncio
+from typing import List, Optional
+
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.aio.market_data import fetch_quotes
+from robinhood_core.cache import InstrumentCache, QuoteCache
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import PortfolioSummary, Position
+from robinhood_core.services.portfolio import PortfolioService
+
+
+class AsyncPortfolioService:
+    """Async variant of ``PortfolioService``.
+
+    Independent requests (the two profiles, instrument lookups) are
+    issued concurrently on the event loop.
+    """
+
+    def __init__(
+        self,
+        http: AsyncRobinhoodHTTP,
+        instrument_cache: Optional[InstrumentCache] = None,
+        quote_cache: Optional[QuoteCache] = None,
+    ):
+        self.http = http
+        self.instrument_cache = instrument_cache or InstrumentCache()
+        self.quote_cache = quote_cache or QuoteCache()
+
+    async def get_portfolio_summary(self) -> PortfolioSummary:
+        """Get portfolio summary."""
+        await self.http.ensure_session()
+
+        try:
+            portfolios, accounts = await asyncio.gather(
+                self.http.results(urls.portfolio_profile_url()),
+                self.http.results(urls.account_profile_url()),
+            )
+            portfolio = portfolios[0] if portfolios else {}
+            account = accounts[0] if accounts else {}
+            return PortfolioService._build_summary(portfolio, account)
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch portfolio: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch portfolio: {e}") from e
+
+    async def get_positions(
+        self, symbols: Optional[List[str]] = None
+    ) -> List[Position]:
+        """Get portfolio positions, optionally filtered by symbols."""
+        await self.http.ensure_session()
+
+        try:
+            positions_data = await self.http.paginate(
+                urls.positions_url(), {"nonzero": "true"}
+            )
+            instrument_urls = [item.get("instrument") for item in positions_data]
+            await self.http.prefetch_instruments(self.instrument_cache, instrument_urls)
+            position_symbols = await asyncio.gather(
+                *(
+                    self.http.symbol_for(self.instrument_cache, url)
+                    for url in instrument_urls
+                )
+            )
+
+            resolved = []
+            for item, symbol in zip(positions_data, position_symbols):
+                if symbols and symbol not in symbols:
+                    continue
+                resolved.append((symbol or "UNKNOWN", item))
+
+            known_symbols = [s for s, _ in resolved if s != "UNKNOWN"]
+            quotes_map: dict = {}
+            if known_symbols:
+                quotes_map = await fetch_quotes(
+                    self.http, self.quote_cache, known_symbols
+                )
+
+            return [
+                PortfolioService._build_position(symbol, item, quotes_map.get(symbol))
+                for symbol, item in resolved
+            ]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch positions: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch positions: {e}") from e
@@ -0,0 +1,75 @@
+# robinhood_core/aio/watchlists.py
+import asyncio
+from typing import List, Optional
+
+import httpx
+import requests
+from robin_stocks.robinhood import urls
+
+from robinhood_core.aio.http import AsyncRobinhoodHTTP
+from robinhood_core.cache import InstrumentCache
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.models import Watchlist
+
+
+class AsyncWatchlistsService:
+    """Async variant of ``WatchlistsService``.
+
+    The items of every watchlist are fetched concurrently.
+    """
+
+    def __init__(
+        self,
+        http: AsyncRobinhoodHTTP,
+        instrument_cache: Optional[InstrumentCache] = None,
+    ):
+        self.http = http
+        self.instrument_cache = instrument_cache or InstrumentCache()
+
+    async def get_watchlists(self) -> List[Watchlist]:
+        """Get all watchlists with their symbols."""
+        await self.http.ensure_session()
+
+        try:
+            results = await self.http.results(urls.watchlists_url())
+            symbols = await asyncio.gather(
+                *(self._get_watchlist_symbols(item.get("id", "")) for item in results)
+            )
+            return [
+                Watchlist(
+                    id=item.get("id", ""),
+                    name=item.get("display_name", ""),
+                    symbols=list_symbols,
+                )
+                for item, list_symbols in zip(results, symbols)
+            ]
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (httpx.HTTPError, requests.RequestException) as e:
+            raise RobinhoodAPIError(f"Failed to fetch watchlists: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch watchlists: {e}") from e
+
+    async def _get_watchlist_symbols(self, list_id: str) -> List[str]:
+        """Fetch symbols for a watchlist by id."""
+        try:
+            entries = await self.http.results(
+                urls.watchlists_url(name=list_id), {"list_id": list_id}
+            )
+            instrument_urls = [
+                entry.get("instrument") for entry in entries if isinstance(entry, dict)
+            ]
+            await self.http.prefetch_instruments(self.instrument_cache, instrument_urls)
+            symbols = await asyncio.gather(
+                *(
+                    self.http.symbol_for(self.instrument_cache, url)
+                    for url in instrument_urls
+                )
+            )
+            return [symbol for symbol in symbols if symbol]
+        except Exception:
+            return []
@@ -0,0 +1,702 @@
+# robinhood_core/cache.py
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from datetime import time as dt_time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import robin_stocks.robinhood as rh
+
+logger = logging.getLogger(__name__)
+
+# SQLite file created next to the robin_stocks pickle in the session directory.
+_CACHE_FILENAME = "cache.sqlite3"
+
+# Quotes move during the trading day (including extended hours) and are
+# static overnight and on weekends.
+_SESSION_OPEN = dt_time(4, 0)
+_SESSION_CLOSE = dt_time(20, 0)
+try:
+    _EASTERN: Optional[ZoneInfo] = ZoneInfo("America/New_York")
+except ZoneInfoNotFoundError:  # pragma: no cover - missing tzdata
+    _EASTERN = None
+
+
+def market_is_active(now: Optional[datetime] = None) -> bool:
+    """Whether US equity quotes may currently be changing.
+
+    True on weekdays between 04:00 and 20:00 US/Eastern, which covers
+    pre-market, the regular session, and after-hours trading.  Market
+    holidays are not tracked.  When timezone data is unavailable this
+    conservatively returns True.
+    """
+    if _EASTERN is None:
+        return True
+    now = (now or datetime.now(_EASTERN)).astimezone(_EASTERN)
+    return now.weekday() < 5 and _SESSION_OPEN <= now.time() < _SESSION_CLOSE
+
+
+class _SQLiteCache:
+    """Bounded in-memory LRU in front of a single SQLite table.
+
+    Subclasses define the table schema and how rows map to dicts.  When
+    ``path`` is ``None`` the cache lives in an in-memory database and is
+    lost when the process exits.  The database file is opened lazily on
+    first use, so constructing a cache never touches the filesystem.
+
+    All public methods are safe to call from multiple threads.
+    """
+
+    _TABLE = ""
+    _SCHEMA = ""
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_entries: int = 2048,
+    ):
+        self._path = Path(path) if path else None
+        self._max_entries = max_entries
+        self._lru: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def open(cls, session_dir: Union[str, Path], **kwargs):
+        """Create a cache stored in ``session_dir``."""
+        return cls(Path(session_dir) / _CACHE_FILENAME, **kwargs)
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            if self._path is None:
+                target = ":memory:"
+            else:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                target = str(self._path)
+            self._db = sqlite3.connect(target, check_same_thread=False)
+            self._db.execute(self._SCHEMA)
+            self._on_open(self._db)
+            self._db.commit()
+        return self._db
+
+    def _on_open(self, db: sqlite3.Connection) -> None:
+        """Hook run once after the database is opened."""
+
+    def _is_fresh(self, value: dict) -> bool:
+        """Whether a stored value may still be served."""
+        return True
+
+    def _forget(self, key: str) -> None:
+        self._lru.pop(key, None)
+        try:
+            db = self._conn()
+            db.execute(f"DELETE FROM {self._TABLE} WHERE key = ?", (key,))
+            db.commit()
+        except sqlite3.Error as e:
+            logger.debug("Cache delete failed for %s: %s", key, e)
+
+    def _remember(self, key: str, value: dict) -> None:
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for ``key`` or ``None``.
+
+        Checks the in-memory LRU first, then SQLite.  Stale entries are
+        dropped and reported as misses.  Updates the hit/miss counters.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        """``get`` without touching the counters.  Caller holds the lock."""
+        value = self._lru.get(key)
+        if value is not None and not self._is_fresh(value):
+            self._forget(key)
+            return None
+        if value is not None:
+            self._lru.move_to_end(key)
+            return value
+
+        try:
+            row = (
+                self._conn()
+                .execute(f"SELECT data FROM {self._TABLE} WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            logger.debug("Cache read failed for %s: %s", key, e)
+            row = None
+
+        if row is None:
+            return None
+
+        value = json.loads(row[0])
+        if not self._is_fresh(value):
+            self._forget(key)
+            return None
+        self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        """Store ``value`` under ``key`` in both tiers."""
+        self.put_many([(key, value)])
+
+    def put_many(self, entries: Iterable[Tuple[str, dict]]) -> None:
+        """Store several ``(key, value)`` pairs in one SQLite transaction."""
+        rows = []
+        with self._lock:
+            for key, value in entries:
+                self._remember(key, value)
+                rows.append(self._columns(key, value))
+            if not rows:
+                return
+            columns = list(rows[0])
+            try:
+                db = self._conn()
+                db.executemany(
+                    f"INSERT OR REPLACE INTO {self._TABLE} "
+                    f"({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(row.values()) for row in rows],
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.debug("Cache write failed for %d entries: %s", len(rows), e)
+
+    def _columns(self, key: str, value: dict) -> Dict[str, object]:
+        return {"key": key, "data": json.dumps(value)}
+
+    def resolve(
+        self, key: str, fetch: Callable[[str], Optional[dict]]
+    ) -> Optional[dict]:
+        """Return the cached value for ``key``, fetching and storing on a miss.
+
+        ``fetch`` is only called on a miss.  Falsy or non-dict results are
+        returned as ``None`` and are not cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        fetched = fetch(key)
+        if not fetched or not isinstance(fetched, dict):
+            return None
+        self.put(key, fetched)
+        return fetched
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current LRU size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_entries": len(self._lru),
+            }
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._lru.clear()
+            try:
+                db = self._conn()
+                db.execute(f"DELETE FROM {self._TABLE}")
+                db.commit()
+            except sqlite3.Error as e:
+                logger.debug("Cache clear failed: %s", e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+# Instrument ids per request to the instruments endpoint.
+INSTRUMENT_CHUNK_SIZE = 40
+
+InstrumentsFetch = Callable[[List[str]], Optional[list]]
+
+
+def fetch_instruments_by_ids(ids: List[str]) -> Optional[list]:
+    """Fetch the instruments for ``ids`` with one instruments/?ids= request."""
+    return rh.request_get(rh.urls.instruments_url(), "results", {"ids": ",".join(ids)})
+
+
+def instrument_id(url: Optional[str]) -> Optional[str]:
+    """Return the instrument id at the end of an instrument URL."""
+    if not url:
+        return None
+    return url.rstrip("/").split("/")[-1] or None
+
+
+class InstrumentCache(_SQLiteCache):
+    """Persistent cache of stock instrument URL -> instrument data.
+
+    Instrument records (symbol, id, name, ...) practically never change,
+    so entries never expire.  Shared by every service that has to turn an
+    instrument URL from a position, order, or watchlist into a symbol.
+    """
+
+    _TABLE = "instruments"
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS instruments ("
+        "key TEXT PRIMARY KEY, id TEXT, symbol TEXT, data TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL)"
+    )
+
+    def _columns(self, key: str, value: dict) -> Dict[str, object]:
+        return {
+            "key": key,
+            "id": value.get("id"),
+            "symbol": value.get("symbol"),
+            "data": json.dumps(value),
+            "fetched_at": time.time(),
+        }
+
+    def symbol_for(
+        self, url: Optional[str], fetch: Callable[[str], Optional[dict]]
+    ) -> Optional[str]:
+        """Resolve an instrument URL to its ticker symbol."""
+        if not url:
+            return None
+        instrument = self.resolve(url, fetch)
+        return instrument.get("symbol") if instrument else None
+
+    def url_for_symbol(
+        self,
+        symbol: str,
+        fetch: Optional[Callable[[str], Optional[dict]]] = None,
+    ) -> Optional[str]:
+        """Resolve a ticker symbol to its instrument URL.
+
+        Cached instruments are searched by symbol first.  On a miss
+        ``fetch(symbol)`` returns the instrument, which is cached under
+        its ``url``; without ``fetch`` a miss returns ``None``.
+        """
+        symbol = symbol.upper().strip()
+        with self._lock:
+            try:
+                row = (
+                    self._conn()
+                    .execute(
+                        "SELECT key FROM instruments WHERE symbol = ? "
+                        "ORDER BY fetched_at DESC LIMIT 1",
+                        (symbol,),
+                    )
+                    .fetchone()
+                )
+            except sqlite3.Error as e:
+                logger.debug("Cache read failed for %s: %s", symbol, e)
+                row = None
+            if row is not None:
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+
+        if fetch is None:
+            return None
+        instrument = fetch(symbol)
+        if not instrument or not isinstance(instrument, dict):
+            return None
+        url = instrument.get("url")
+        if not url:
+            return None
+        self.put(url, instrument)
+        return url
+
+    def unresolved(self, urls: Iterable[Optional[str]]) -> Dict[str, str]:
+        """Map instrument id to URL for every URL not in the cache."""
+        pending: Dict[str, str] = {}
+        with self._lock:
+            for url in urls:
+                key = instrument_id(url)
+                if key and key not in pending and self._lookup(url) is None:
+                    pending[key] = url
+        return pending
+
+    def store(self, pending: Dict[str, str], instruments: Optional[list]) -> int:
+        """Cache fetched instruments under the URLs they were requested for.
+
+        Returns the number of instruments stored.  All of them are written
+        in a single transaction.
+        """
+        entries = []
+        for item in instruments or []:
+            if not item or not isinstance(item, dict):
+                continue
+            url = pending.get(str(item.get("id")))
+            if url is not None:
+                entries.append((url, item))
+        self.put_many(entries)
+        return len(entries)
+
+    def prefetch(
+        self,
+        urls: Iterable[Optional[str]],
+        fetch_by_ids: Optional[InstrumentsFetch] = None,
+        chunk_size: int = INSTRUMENT_CHUNK_SIZE,
+    ) -> int:
+        """Resolve every uncached URL in ``urls`` with bulk requests.
+
+        ``fetch_by_ids`` receives up to ``chunk_size`` instrument ids and
+        returns their instrument dicts; it defaults to
+        ``fetch_instruments_by_ids``.  Call this with all the URLs of a
+        response before resolving rows one by one with ``symbol_for``;
+        instruments a bulk request did not return are left for
+        ``symbol_for`` to fetch individually.  Returns the number of
+        instruments fetched.
+        """
+        fetch_by_ids = fetch_by_ids or fetch_instruments_by_ids
+        pending = self.unresolved(urls)
+        ids = list(pending)
+        stored = 0
+        for i in range(0, len(ids), chunk_size):
+            try:
+                data = fetch_by_ids(ids[i : i + chunk_size])
+            except Exception as e:
+                logger.debug("Bulk instrument lookup failed: %s", e)
+                break
+            stored += self.store(pending, data)
+        if ids:
+            logger.debug("Prefetched %d of %d instruments", stored, len(ids))
+        return stored
+
+
+class OptionInstrumentCache(_SQLiteCache):
+    """Persistent cache of option id -> option instrument data.
+
+    Strike, expiration, and type are fixed for the life of a contract, so
+    entries are served until the contract expires.  Expired contracts are
+    evicted on read and purged whenever the database is opened.
+    """
+
+    _TABLE = "option_instruments"
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS option_instruments ("
+        "key TEXT PRIMARY KEY, expiration_date TEXT, data TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL)"
+    )
+
+    def _columns(self, key: str, value: dict) -> Dict[str, object]:
+        return {
+            "key": key,
+            "expiration_date": value.get("expiration_date"),
+            "data": json.dumps(value),
+            "fetched_at": time.time(),
+        }
+
+    def _on_open(self, db: sqlite3.Connection) -> None:
+        db.execute(
+            "DELETE FROM option_instruments WHERE expiration_date < ?",
+            (date.today().isoformat(),),
+        )
+
+    def _is_fresh(self, value: dict) -> bool:
+        expiration = value.get("expiration_date")
+        if not expiration:
+            return True
+        return str(expiration) >= date.today().isoformat()
+
+
+class CryptoPairTable:
+    """In-memory table of crypto currency pair id -> pair data.
+
+    Robinhood lists a few dozen currency pairs and they rarely change, so
+    the whole table is loaded with one request on first use and kept for
+    the life of the process.  A load that fails or returns nothing is not
+    retried for ``retry_interval`` seconds, so a page of crypto orders
+    makes at most one pairs request even while the endpoint is down.
+
+    All public methods are safe to call from multiple threads.
+    """
+
+    def __init__(
+        self,
+        retry_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pairs: Optional[Dict[str, dict]] = None
+        self._failed_at: Optional[float] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._pairs is not None
+
+    @property
+    def due(self) -> bool:
+        """Whether the table should be (re)loaded now."""
+        if self._pairs is not None:
+            return False
+        return (
+            self._failed_at is None
+            or self._clock() - self._failed_at >= self.retry_interval
+        )
+
+    def load(self, pairs: Optional[list]) -> int:
+        """Replace the table with ``pairs``; returns the number loaded.
+
+        An empty result counts as a failed load.
+        """
+        table = {
+            str(pair["id"]): pair
+            for pair in pairs or []
+            if pair and isinstance(pair, dict) and pair.get("id")
+        }
+        if table:
+            self._pairs = table
+            self._failed_at = None
+        else:
+            self.failed()
+        return len(table)
+
+    def failed(self) -> None:
+        """Record a failed load; lookups wait ``retry_interval`` to retry."""
+        self._failed_at = self._clock()
+
+    def symbol_for(
+        self,
+        pair_id: Optional[str],
+        fetch: Optional[Callable[[], Optional[list]]] = None,
+    ) -> Optional[str]:
+        """Resolve a currency pair id to its symbol, e.g. ``BTC-USD``.
+
+        ``fetch`` returns every currency pair and is only called while the
+        table is ``due`` for a load.
+        """
+        if not pair_id:
+            return None
+        with self._lock:
+            if fetch is not None and self.due:
+                try:
+                    self.load(fetch())
+                except Exception as e:
+                    logger.debug("Crypto pair lookup failed: %s", e)
+                    self.failed()
+            pair = (self._pairs or {}).get(pair_id)
+        return pair.get("symbol") if pair else None
+
+
+# Symbols per rh.get_quotes request made by QuoteBatcher.
+QUOTE_CHUNK_SIZE = 100
+
+QuoteFetch = Callable[[List[str]], Optional[list]]
+
+
+class _QuoteBatch:
+    __slots__ = ("symbols", "fetch", "done", "quotes", "error")
+
+    def __init__(self, fetch: QuoteFetch):
+        self.symbols: Dict[str, None] = {}
+        self.fetch = fetch
+        self.done = threading.Event()
+        self.quotes: Dict[str, dict] = {}
+        self.error: Optional[Exception] = None
+
+
+class QuoteBatcher:
+    """Merge quote requests from concurrent threads into shared batches.
+
+    Batches are kept per ``fetch`` callable, so callers only share a
+    request when they would have made the same one.  A caller that finds
+    no batch open for its ``fetch`` opens one.  If no other batch for that
+    ``fetch`` is in flight it fetches at once: nobody else is asking for
+    quotes, so waiting would only add latency.  Otherwise it waits
+    ``window`` seconds, and symbols requested by other threads during that
+    time join its batch.  The leader then fetches every symbol,
+    ``chunk_size`` per request, and each caller gets back only the quotes
+    it asked for.  If the fetch fails, every caller in the batch sees the
+    same exception.
+    """
+
+    def __init__(self, window: float = 0.005, chunk_size: int = QUOTE_CHUNK_SIZE):
+        self.window = window
+        self.chunk_size = chunk_size
+        self._open: Dict[QuoteFetch, _QuoteBatch] = {}
+        self._in_flight: Dict[QuoteFetch, int] = {}
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+
+    def get_quotes(self, symbols: Iterable[str], fetch: QuoteFetch) -> List[dict]:
+        """Return raw quote dicts for ``symbols``, batched with other callers.
+
+        Only callers passing the same ``fetch`` share a batch.
+        """
+        wanted = [s.upper() for s in symbols if s]
+        if not wanted:
+            return []
+
+        with self._lock:
+            batch = self._open.get(fetch)
+            leader = batch is None
+            if leader:
+                batch = self._open[fetch] = _QuoteBatch(fetch)
+                busy = self._in_flight.get(fetch, 0) > 0
+            batch.symbols.update(dict.fromkeys(wanted))
+
+        if leader:
+            if busy and self.window > 0:
+                time.sleep(self.window)
+            with self._lock:
+                del self._open[fetch]
+                self._in_flight[fetch] = self._in_flight.get(fetch, 0) + 1
+            try:
+                self._run(batch)
+            finally:
+                with self._lock:
+                    self._in_flight[fetch] -= 1
+                    if not self._in_flight[fetch]:
+                        del self._in_flight[fetch]
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return [batch.quotes[s] for s in dict.fromkeys(wanted) if s in batch.quotes]
+
+    def _run(self, batch: _QuoteBatch) -> None:
+        symbols = list(batch.symbols)
+        try:
+            for i in range(0, len(symbols), self.chunk_size):
+                data = batch.fetch(symbols[i : i + self.chunk_size])
+                with self._lock:
+                    self.requests += 1
+                if isinstance(data, dict):
+                    data = [data]
+                for item in data or []:
+                    if item and isinstance(item, dict) and item.get("symbol"):
+                        batch.quotes[str(item["symbol"]).upper()] = item
+            with self._lock:
+                self.batches += 1
+        except Exception as e:
+            batch.error = e
+        finally:
+            batch.done.set()
+
+
+class QuoteCache:
+    """In-memory per-symbol quote cache with a short TTL.
+
+    Each symbol carries the time it was fetched.  ``get_quotes`` serves
+    fresh entries from memory and fetches every missing or stale symbol in
+    a single batch.  ``ttl`` applies while the market is active and
+    ``closed_ttl`` overnight and on weekends, when quotes do not move.
+
+    Shared by every service that needs current prices so that one batch
+    serves all callers.  With a ``batcher``, misses from concurrent
+    callers are merged into shared ``get_quotes`` requests.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 2.0,
+        closed_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        batcher: Optional[QuoteBatcher] = None,
+    ):
+        self.ttl = ttl
+        self.closed_ttl = closed_ttl
+        self._clock = clock
+        self._batcher = batcher
+        self._quotes: Dict[str, Tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _current_ttl(self) -> float:
+        return self.ttl if market_is_active() else self.closed_ttl
+
+    def get_quotes(
+        self,
+        symbols: Iterable[str],
+        fetch: QuoteFetch,
+    ) -> Dict[str, dict]:
+        """Return raw quote dicts keyed by upper-case symbol.
+
+        ``fetch`` receives the list of missing or stale symbols and is
+        called at most once (per chunk when batching).  Symbols with no
+        quote are omitted.
+        """
+        wanted = list(dict.fromkeys(s.upper() for s in symbols if s))
+        found, missing = self.lookup(wanted)
+
+        if missing:
+            if self._batcher is not None:
+                data = self._batcher.get_quotes(missing, fetch)
+            else:
+                data = fetch(missing)
+            stored = self.store(data)
+            found.update((s, stored[s]) for s in missing if s in stored)
+
+        return {s: found[s] for s in wanted if s in found}
+
+    def lookup(self, symbols: Iterable[str]) -> Tuple[Dict[str, dict], List[str]]:
+        """Split ``symbols`` into fresh cached quotes and symbols to fetch.
+
+        Returns ``(quotes keyed by upper-case symbol, missing symbols)`` and
+        updates the hit/miss counters.  Used by callers that fetch misses
+        themselves, such as the async services.
+        """
+        wanted = list(dict.fromkeys(s.upper() for s in symbols if s))
+        now = self._clock()
+        ttl = self._current_ttl()
+
+        found: Dict[str, dict] = {}
+        with self._lock:
+            for symbol in wanted:
+                entry = self._quotes.get(symbol)
+                if entry is not None and now - entry[0] < ttl:
+                    found[symbol] = entry[1]
+            self.hits += len(found)
+            missing = [s for s in wanted if s not in found]
+            self.misses += len(missing)
+        return found, missing
+
+    def store(self, data: Optional[Union[list, dict]]) -> Dict[str, dict]:
+        """Cache fetched quote dicts and return them keyed by symbol."""
+        if isinstance(data, dict):
+            data = [data]
+        fetched_at = self._clock()
+        stored: Dict[str, dict] = {}
+        with self._lock:
+            for item in data or []:
+                if not item or not isinstance(item, dict):
+                    continue
+                symbol = str(item.get("symbol") or "").upper()
+                if not symbol:
+                    continue
+                self._quotes[symbol] = (fetched_at, item)
+                stored[symbol] = item
+        return stored
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of cached symbols."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "symbols": len(self._quotes),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._quotes.clear()
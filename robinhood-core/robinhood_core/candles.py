@@ -0,0 +1,301 @@
+# robinhood_core/candles.py
+import logging
+import os
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from robinhood_core.cache import _EASTERN
+
+logger = logging.getLogger(__name__)
+
+# Directory created next to the robin_stocks pickle in the session directory.
+_CANDLES_DIRNAME = "candles"
+
+# File layout: header, then one packed column per field.
+_MAGIC = b"RHC1"
+_HEADER = struct.Struct("<4sIi")
+_FLOAT_COLUMNS = ("open_price", "high_price", "low_price", "close_price")
+
+# Spans in increasing order with the calendar days each one reaches back.
+_SPAN_DAYS = {
+    "day": 1,
+    "week": 7,
+    "month": 31,
+    "3month": 92,
+    "year": 366,
+    "5year": 1827,
+}
+_SPAN_RANK = {span: rank for rank, span in enumerate(_SPAN_DAYS)}
+
+# Spans Robinhood accepts for each interval, smallest first.  Used to pick
+# the shortest request that still reaches back to the last stored bar; the
+# requested span itself is always a candidate too.
+_TAIL_SPANS = {
+    "5minute": ("day", "week"),
+    "10minute": ("day", "week"),
+    "hour": ("week", "month"),
+    "day": ("month", "3month", "year", "5year"),
+    "week": ("year", "5year"),
+}
+
+HistoricalsFetch = Callable[[str], Optional[list]]
+# (open, high, low, close, volume)
+Bar = Tuple[float, float, float, float, int]
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _format_timestamp(ts: int) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _parse_bars(data: Optional[list]) -> Dict[int, Bar]:
+    """Map epoch seconds to OHLCV for every well-formed historicals row."""
+    bars: Dict[int, Bar] = {}
+    for item in data or []:
+        if not item or not isinstance(item, dict):
+            continue
+        ts = _parse_timestamp(item.get("begins_at"))
+        try:
+            values = tuple(float(item[name]) for name in _FLOAT_COLUMNS)
+            volume = int(float(item.get("volume") or 0))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if ts is not None:
+            bars[ts] = (*values, volume)
+    return bars
+
+
+class _Series:
+    """Columnar bars for one (symbol, interval, bounds), sorted by time."""
+
+    __slots__ = ("begins_at", "columns", "volume", "covered_rank")
+
+    def __init__(self):
+        self.begins_at = array("q")
+        self.columns = {name: array("d") for name in _FLOAT_COLUMNS}
+        self.volume = array("q")
+        # Rank of the longest span fetched in full; -1 when empty.
+        self.covered_rank = -1
+
+    def __len__(self) -> int:
+        return len(self.begins_at)
+
+    def merge(self, bars: Dict[int, Bar]) -> None:
+        """Replace stored bars from the first new bar onwards.
+
+        Bars before the first fetched bar are final and kept as-is; the
+        fetched bars supersede everything after, including a bar that was
+        still forming when it was stored.
+        """
+        if not bars:
+            return
+
+        cut = bisect_left(self.begins_at, min(bars))
+        del self.begins_at[cut:]
+        del self.volume[cut:]
+        for column in self.columns.values():
+            del column[cut:]
+        for ts in sorted(bars):
+            *values, volume = bars[ts]
+            self.begins_at.append(ts)
+            for column, value in zip(self.columns.values(), values):
+                column.append(value)
+            self.volume.append(volume)
+
+    def rows(self, start: int = 0) -> List[dict]:
+        """Return bars from index ``start`` as robin_stocks-shaped dicts."""
+        return [
+            {
+                "begins_at": _format_timestamp(self.begins_at[i]),
+                **{name: column[i] for name, column in self.columns.items()},
+                "volume": self.volume[i],
+            }
+            for i in range(start, len(self))
+        ]
+
+    def dump(self, path: Path) -> None:
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self), self.covered_rank))
+            self.begins_at.tofile(f)
+            for column in self.columns.values():
+                column.tofile(f)
+            self.volume.tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "_Series":
+        series = cls()
+        with open(path, "rb") as f:
+            magic, count, covered_rank = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"Not a candle file: {path}")
+            series.begins_at.fromfile(f, count)
+            for column in series.columns.values():
+                column.fromfile(f, count)
+            series.volume.fromfile(f, count)
+        series.covered_rank = covered_rank
+        return series
+
+
+class CandleStore:
+    """Local columnar store of historical bars.
+
+    Bars are kept per (symbol, interval, bounds) as packed ``array``
+    columns (epoch seconds, OHLC doubles, volume), one file per key under
+    ``directory``.  Bars before the most recent fetch are treated as final,
+    so a repeat request only fetches the shortest span that reaches back
+    to the last stored bar and merges it in.  The requested span is then
+    sliced from the stored series.
+
+    When ``directory`` is ``None`` bars are kept in memory only.  Nothing
+    touches the filesystem until the first write.  All methods are
+    thread-safe.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._directory = Path(directory) if directory else None
+        self._clock = clock
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, session_dir: Union[str, Path], **kwargs) -> "CandleStore":
+        """Create a store kept in ``session_dir``."""
+        return cls(Path(session_dir) / _CANDLES_DIRNAME, **kwargs)
+
+    def _file(self, key: Tuple[str, str, str]) -> Optional[Path]:
+        if self._directory is None:
+            return None
+        return self._directory / f"{'-'.join(key)}.bin"
+
+    def _load(self, key: Tuple[str, str, str]) -> _Series:
+        series = self._series.get(key)
+        if series is not None:
+            return series
+        path = self._file(key)
+        series = _Series()
+        if path is not None and path.exists():
+            try:
+                series = _Series.load(path)
+            except (OSError, ValueError, EOFError, struct.error) as e:
+                logger.debug("Ignoring unreadable candle file %s: %s", path, e)
+        self._series[key] = series
+        return series
+
+    def _save(self, key: Tuple[str, str, str], series: _Series) -> None:
+        path = self._file(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            series.dump(path)
+        except OSError as e:
+            logger.debug("Candle write failed for %s: %s", path, e)
+
+    def _tail_span(self, interval: str, span: str, last: int) -> Optional[str]:
+        """Shortest span, no longer than ``span``, that reaches back to ``last``.
+
+        The choice is only an estimate: Robinhood's spans follow trading
+        sessions, so ``history`` still checks that the tail overlaps.
+        """
+        age_days = (self._clock() - last) / 86400
+        candidates = {*_TAIL_SPANS.get(interval, ()), span}
+        for tail in sorted(candidates, key=_SPAN_RANK.__getitem__):
+            if _SPAN_RANK[tail] > _SPAN_RANK[span]:
+                break
+            if _SPAN_DAYS[tail] >= age_days:
+                return tail
+        return None
+
+    def history(
+        self,
+        symbol: str,
+        interval: str,
+        span: str,
+        bounds: str,
+        fetch: HistoricalsFetch,
+    ) -> List[dict]:
+        """Return bars for ``span`` as robin_stocks-shaped dicts.
+
+        ``fetch`` receives the span to request from Robinhood.  It is called
+        with a short tail span when the stored series already covers
+        ``span``, and with ``span`` itself otherwise.  A tail is only merged
+        when it reaches back to the last stored bar; one that starts later
+        would leave a gap, so ``span`` is fetched in full instead.
+        """
+        key = (symbol.upper(), interval, bounds)
+        rank = _SPAN_RANK[span]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Different keys sync concurrently; the same key syncs once at a time.
+        with key_lock:
+            series = self._load(key)
+            tail = None
+            if len(series) and series.covered_rank >= rank:
+                tail = self._tail_span(interval, span, series.begins_at[-1])
+
+            bars = _parse_bars(fetch(tail)) if tail else {}
+            if bars and min(bars) <= series.begins_at[-1]:
+                series.merge(bars)
+            else:
+                if tail != span:
+                    bars = _parse_bars(fetch(span))
+                if not bars:
+                    return []
+                if not len(series) or min(bars) > series.begins_at[-1]:
+                    # No overlap with what is stored: start a fresh series.
+                    series = self._series[key] = _Series()
+                series.merge(bars)
+                series.covered_rank = max(series.covered_rank, rank)
+            self._save(key, series)
+
+            return series.rows(self._span_start(series, span))
+
+    @staticmethod
+    def _span_start(series: _Series, span: str) -> int:
+        if not len(series):
+            return 0
+        last = series.begins_at[-1]
+        if span == "day" and _EASTERN is not None:
+            # A one-day span is the last trading session, not 24 hours.
+            last_day = datetime.fromtimestamp(last, _EASTERN).date()
+            start = int(
+                datetime.combine(last_day, datetime.min.time(), _EASTERN).timestamp()
+            )
+        else:
+            start = last - int(timedelta(days=_SPAN_DAYS[span]).total_seconds())
+        return bisect_left(series.begins_at, start)
+
+    def clear(self) -> None:
+        """Drop every stored series from memory and disk."""
+        with self._lock:
+            self._series.clear()
+            self._key_locks.clear()
+            if self._directory is not None and self._directory.exists():
+                for path in self._directory.glob("*.bin"):
+                    path.unlink(missing_ok=True)
@@ -2,10 +2,14 @@
 import contextlib
 import logging
 import os
+import threading
 from typing import Optional
 from pathlib import Path
 import robin_stocks.robinhood as rh
 from robinhood_core.errors import AuthRequiredError, NetworkError
+from robinhood_core.policy import CallPolicy
+from robinhood_core.ratelimit import RateLimiter
+from robinhood_core.transport import RobinhoodAdapter, install_adapter
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +19,30 @@ logger = logging.getLogger(__name__)
 # With pickle_name: {pickle_path}/robinhood{pickle_name}.pickle
 _PICKLE_FILENAME = "robinhood.pickle"
 
+# Connection pool defaults for the robin_stocks session.  requests'
+# default of 10 connections per host caps concurrent fan-out.
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def _pool_size(name: str, value: Optional[int], env_var: str, default: int) -> int:
+    """Resolve a pool size from an argument, then ``env_var``, then ``default``.
+
+    Raises ``ValueError`` unless the result is an integer of at least 1.
+    """
+    if value is None:
+        raw = os.getenv(env_var)
+        if raw is None:
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ValueError(f"{env_var} must be an integer, got {raw!r}") from None
+        name = env_var
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1, got {value}")
+    return value
+
 
 class RobinhoodClient:
     """Manages Robinhood authentication and session state.
@@ -25,6 +53,18 @@ class RobinhoodClient:
     requested directory.
 
     Args take priority over environment variables.
+
+    ``ensure_session`` is safe to call from many threads at once: only one
+    login runs at a time and callers that arrive during it share its
+    result instead of logging in again.
+
+    On construction a ``RobinhoodAdapter`` is mounted on the robin_stocks
+    session.  Its connection pool keeps up to ``pool_maxsize`` warm
+    connections per host so concurrent lookups reuse TLS connections.
+    ``rate_limiter`` and ``call_policy``, when given, make every request
+    rate limited and give it timeouts, retries, and circuit breaking.
+    ``keep_alive`` and ``gzip`` set the session's ``Connection`` and
+    ``Accept-Encoding`` headers.  Pool sizes below 1 raise ``ValueError``.
     """
 
     def __init__(
@@ -33,8 +73,17 @@ class RobinhoodClient:
         password: Optional[str] = None,
         session_path: Optional[str] = None,
         allow_mfa: Optional[bool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        call_policy: Optional[CallPolicy] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: Optional[bool] = None,
+        gzip: Optional[bool] = None,
     ):
         self._authenticated = False
+        self._login_lock = threading.Lock()
+        self._login_attempts = 0
+        self._login_error: Optional[Exception] = None
         self._username = username or os.getenv("RH_USERNAME")
         self._password = password or os.getenv("RH_PASSWORD")
         self._session_path = session_path or os.getenv("RH_SESSION_PATH")
@@ -43,6 +92,49 @@ class RobinhoodClient:
             if allow_mfa is not None
             else os.getenv("RH_ALLOW_MFA", "0") == "1"
         )
+        self._pool_connections = _pool_size(
+            "pool_connections",
+            pool_connections,
+            "RH_POOL_CONNECTIONS",
+            DEFAULT_POOL_CONNECTIONS,
+        )
+        self._pool_maxsize = _pool_size(
+            "pool_maxsize", pool_maxsize, "RH_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE
+        )
+        self._keep_alive = (
+            keep_alive
+            if keep_alive is not None
+            else os.getenv("RH_KEEP_ALIVE", "1") != "0"
+        )
+        self._gzip = gzip if gzip is not None else os.getenv("RH_GZIP", "1") != "0"
+        self.rate_limiter = rate_limiter
+        self.call_policy = call_policy
+        install_adapter(
+            RobinhoodAdapter(
+                rate_limiter=rate_limiter,
+                policy=call_policy,
+                pool_connections=self._pool_connections,
+                pool_maxsize=self._pool_maxsize,
+            ),
+            keep_alive=self._keep_alive,
+            gzip=self._gzip,
+        )
+
+    @property
+    def authenticated(self) -> bool:
+        """Whether a login has succeeded in this process."""
+        return self._authenticated
+
+    @property
+    def session_dir(self) -> Path:
+        """Directory holding the session pickle and on-disk caches.
+
+        Mirrors robin_stocks' default of ``~/.tokens`` when no
+        ``session_path`` is configured.
+        """
+        if self._session_path:
+            return Path(self._session_path)
+        return Path.home() / ".tokens"
 
     def ensure_session(self, mfa_code: Optional[str] = None) -> "RobinhoodClient":
         """Ensure we have a valid session, authenticating if needed.
@@ -59,6 +151,27 @@ class RobinhoodClient:
             logger.debug("Session already active, skipping login")
             return self
 
+        attempt = self._login_attempts
+        with self._login_lock:
+            if self._authenticated:
+                logger.debug("Session established by a concurrent caller")
+                return self
+            if self._login_attempts != attempt and self._login_error is not None:
+                # A login finished while we waited and failed; share its result.
+                raise self._login_error
+            try:
+                self._login(mfa_code)
+            except (AuthRequiredError, NetworkError) as e:
+                self._login_error = e
+                raise
+            finally:
+                # Counts finished attempts so waiters can tell one completed.
+                self._login_attempts += 1
+            self._login_error = None
+            return self
+
+    def _login(self, mfa_code: Optional[str]) -> None:
+        """Run one login attempt.  Caller must hold ``_login_lock``."""
         if not self._username or not self._password:
             # When no credentials are provided, try to restore from a saved pickle.
             # robin_stocks will use the stored token if still valid.
@@ -76,7 +189,7 @@ class RobinhoodClient:
                     if login_result:
                         self._authenticated = True
                         logger.info("Restored session from saved pickle")
-                        return self
+                        return
                 except Exception as e:
                     logger.debug("Failed to restore saved session: %s", e)
 
@@ -111,7 +224,7 @@ class RobinhoodClient:
             if login_result:
                 self._authenticated = True
                 logger.info("Authentication successful for user %s", self._username)
-                return self
+                return
             else:
                 logger.warning("Authentication failed for user %s", self._username)
                 raise AuthRequiredError(
@@ -138,7 +251,8 @@ class RobinhoodClient:
             rh.logout()
         except Exception:
             pass
-        self._authenticated = False
+        with self._login_lock:
+            self._authenticated = False
         # robin_stocks.logout() only clears in-memory state.
         # Also remove the persisted pickle file so next start is clean.
         if self._session_path:
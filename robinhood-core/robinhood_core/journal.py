@@ -0,0 +1,230 @@
+# robinhood_core/journal.py
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from robinhood_core.cache import _CACHE_FILENAME
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS orders ("
+    "category TEXT NOT NULL, id TEXT NOT NULL, symbol TEXT, "
+    "created_at TEXT, updated_at TEXT, data TEXT NOT NULL, "
+    "PRIMARY KEY (category, id))",
+    "CREATE INDEX IF NOT EXISTS orders_by_symbol "
+    "ON orders (category, symbol, updated_at)",
+    "CREATE INDEX IF NOT EXISTS orders_by_updated "
+    "ON orders (category, updated_at)",
+    "CREATE TABLE IF NOT EXISTS order_sync ("
+    "category TEXT PRIMARY KEY, high_water_mark TEXT NOT NULL)",
+)
+
+# A journaled order: (id, symbol, raw order dict).
+JournalRow = Tuple[str, Optional[str], dict]
+
+# Order states that never change again.
+FINAL_STATES = ("filled", "cancelled", "rejected", "failed")
+
+# How long to wait for another connection's write before failing with
+# "database is locked".
+BUSY_TIMEOUT_MS = 5000
+
+
+class OrderJournal:
+    """Local SQLite copy of the account's order history.
+
+    Orders are stored per category ("stock", "option", "crypto") keyed by
+    order id, together with the latest ``updated_at`` seen for that
+    category (the high-water mark).  ``OrdersService`` syncs each category
+    by fetching only orders updated at or after the mark and answers
+    symbol/date filters from indexed local tables.
+
+    When ``path`` is ``None`` the journal is kept in memory.  The database
+    is opened lazily on first use.  All methods are thread-safe.
+
+    The file is shared with the instrument caches and with other processes,
+    so it is opened in WAL mode with a busy timeout.  ``sqlite3.Error`` is
+    still raised when the database stays locked or is unreadable; writes
+    are rolled back first, so a failed ``record`` changes nothing.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self._path = Path(path) if path else None
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    @classmethod
+    def open(cls, session_dir: Union[str, Path]) -> "OrderJournal":
+        """Create a journal stored in ``session_dir``."""
+        return cls(Path(session_dir) / _CACHE_FILENAME)
+
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            if self._path is None:
+                target = ":memory:"
+            else:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                target = str(self._path)
+            db = sqlite3.connect(target, check_same_thread=False)
+            try:
+                db.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+                if self._path is not None:
+                    db.execute("PRAGMA journal_mode = WAL")
+                for statement in _SCHEMA:
+                    db.execute(statement)
+                db.commit()
+            except sqlite3.Error:
+                db.close()
+                raise
+            self._db = db
+        return self._db
+
+    def high_water_mark(self, category: str) -> Optional[str]:
+        """Latest ``updated_at`` journaled for ``category``, or ``None``."""
+        with self._lock:
+            row = (
+                self._conn()
+                .execute(
+                    "SELECT high_water_mark FROM order_sync WHERE category = ?",
+                    (category,),
+                )
+                .fetchone()
+            )
+            return row[0] if row else None
+
+    def record(self, category: str, rows: Iterable[JournalRow]) -> int:
+        """Upsert orders and advance the high-water mark.
+
+        Returns the number of orders written.  Nothing is written when any
+        row fails.
+        """
+        with self._lock:
+            db = self._conn()
+            mark = self.high_water_mark(category)
+            count = 0
+            try:
+                for order_id, symbol, item in rows:
+                    updated_at = item.get("updated_at")
+                    db.execute(
+                        "INSERT OR REPLACE INTO orders "
+                        "(category, id, symbol, created_at, updated_at, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            category,
+                            order_id,
+                            symbol.upper() if symbol else None,
+                            item.get("created_at"),
+                            updated_at,
+                            json.dumps(item),
+                        ),
+                    )
+                    if updated_at and (mark is None or updated_at > mark):
+                        mark = updated_at
+                    count += 1
+                if mark is not None:
+                    db.execute(
+                        "INSERT OR REPLACE INTO order_sync "
+                        "(category, high_water_mark) VALUES (?, ?)",
+                        (category, mark),
+                    )
+                db.commit()
+            except sqlite3.Error:
+                db.rollback()
+                raise
+            return count
+
+    def oldest_open(self, category: str) -> Optional[str]:
+        """``created_at`` of the oldest journaled order not in a final state."""
+        placeholders = ", ".join("?" * len(FINAL_STATES))
+        with self._lock:
+            row = (
+                self._conn()
+                .execute(
+                    "SELECT MIN(created_at) FROM orders WHERE category = ? "
+                    "AND coalesce(json_extract(data, '$.state'), '') "
+                    f"NOT IN ({placeholders})",
+                    (category, *FINAL_STATES),
+                )
+                .fetchone()
+            )
+            return row[0] if row else None
+
+    def mark_synced(self, category: str, mark: str) -> None:
+        """Record a high-water mark for a category with no orders yet."""
+        with self._lock:
+            db = self._conn()
+            db.execute(
+                "INSERT OR IGNORE INTO order_sync (category, high_water_mark) "
+                "VALUES (?, ?)",
+                (category, mark),
+            )
+            db.commit()
+
+    def query(
+        self,
+        category: str,
+        symbol: Optional[str] = None,
+        start_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None,
+        created_since: Optional[str] = None,
+    ) -> List[Tuple[Optional[str], dict]]:
+        """Return ``(symbol, order)`` pairs, newest first.
+
+        ``start_date`` keeps orders updated on or after that date, matching
+        the ``updated_at[gte]`` filter used by Robinhood; ``created_since``
+        keeps orders created on or after that date.  ``end_date`` keeps
+        orders created on or before that date.  ``after`` is the
+        ``(created_at, id)`` of the last order of a previous page; only
+        older orders are returned.  ``limit`` caps the number of rows.
+        """
+        sql = "SELECT symbol, data FROM orders WHERE category = ?"
+        params: list = [category]
+        if symbol:
+            # Orders whose symbol could not be resolved are kept, matching
+            # the live filter in OrdersService.
+            sql += " AND (symbol = ? OR symbol IS NULL)"
+            params.append(symbol.upper())
+        if start_date:
+            sql += " AND updated_at >= ?"
+            params.append(start_date)
+        if created_since:
+            sql += " AND created_at >= ?"
+            params.append(created_since)
+        if end_date:
+            sql += " AND substr(created_at, 1, ?) <= ?"
+            params.extend([len(end_date), end_date])
+        if state:
+            sql += " AND json_extract(data, '$.state') = ?"
+            params.append(state)
+        if after:
+            sql += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+            params.extend([after[0], after[0], after[1]])
+        sql += " ORDER BY created_at DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn().execute(sql, params).fetchall()
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def clear(self) -> None:
+        """Drop every journaled order and high-water mark."""
+        with self._lock:
+            db = self._conn()
+            db.execute("DELETE FROM orders")
+            db.execute("DELETE FROM order_sync")
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
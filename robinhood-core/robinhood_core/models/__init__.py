@@ -1,6 +1,6 @@
 from .market import Quote, Candle
 from .options import OptionContract, OptionPosition
-from .portfolio import PortfolioSummary, Position
+from .portfolio import PortfolioSnapshot, PortfolioSummary, Position
 from .watchlists import Watchlist
 from .news import NewsItem
 from .fundamentals import Fundamentals
@@ -11,6 +11,7 @@ __all__ = [
     "Candle",
     "OptionContract",
     "OptionPosition",
+    "PortfolioSnapshot",
     "PortfolioSummary",
     "Position",
     "Watchlist",
@@ -1,4 +1,4 @@
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, field_validator
 
@@ -110,6 +110,7 @@ class CryptoOrder(BaseModel):
 
     id: Optional[str] = None
     currency_pair_id: Optional[str] = None
+    symbol: Optional[str] = None  # e.g. "BTC-USD"
     side: Optional[str] = None  # "buy" or "sell"
     type: Optional[str] = None
     state: Optional[str] = None
@@ -140,8 +141,16 @@ class CryptoOrder(BaseModel):
 
 
 class OrderHistory(BaseModel):
-    """Unified order history response."""
+    """Unified order history response.
+
+    ``errors`` maps a category ("stock", "option", "crypto") to the error
+    that prevented it from loading; the other categories are still returned.
+    ``next_cursor`` is set when a limited request may have more orders;
+    pass it back as ``cursor`` to fetch the next page.
+    """
 
     stock_orders: List[StockOrder] = []
     option_orders: List[OptionOrder] = []
     crypto_orders: List[CryptoOrder] = []
+    errors: Dict[str, str] = {}
+    next_cursor: Optional[str] = None
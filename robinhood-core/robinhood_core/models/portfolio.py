@@ -1,6 +1,7 @@
 from pydantic import BaseModel, field_validator
-from typing import Optional
+from typing import List, Optional
 from .base import coerce_numeric
+from .options import OptionPosition
 
 
 class PortfolioSummary(BaseModel):
@@ -34,3 +35,11 @@ class Position(BaseModel):
     @classmethod
     def validate_quantity(cls, v):
         return coerce_numeric(v)
+
+
+class PortfolioSnapshot(BaseModel):
+    """Portfolio summary, stock positions and option positions in one view."""
+
+    summary: PortfolioSummary
+    positions: List[Position] = []
+    option_positions: List[OptionPosition] = []
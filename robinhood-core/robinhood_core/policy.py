@@ -0,0 +1,178 @@
+# robinhood_core/policy.py
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from robinhood_core.ratelimit import DEFAULT_FAMILY, endpoint_family
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds per endpoint family.  Order history
+# pages are large, so orders get the longest read timeout.
+DEFAULT_TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "quotes": (3.05, 5.0),
+    "instruments": (3.05, 10.0),
+    "orders": (3.05, 20.0),
+    "options_market_data": (3.05, 10.0),
+    DEFAULT_FAMILY: (3.05, 15.0),
+}
+
+# Responses that count as upstream failures and are retried for reads.
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Methods that are safe to send twice.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without sending a request while a circuit breaker is open.
+
+    Subclasses ``requests.ConnectionError`` so services report it like any
+    other network failure.
+    """
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` failures in a row the breaker opens and
+    rejects requests for ``reset_timeout`` seconds.  It then lets a single
+    trial request through: success closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return "open"
+            return "half_open"
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = self._clock()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            # Half-open: one trial at a time.  A trial that never reported
+            # back is abandoned after another reset_timeout.
+            if (
+                self._trial_started is not None
+                and now - self._trial_started < self.reset_timeout
+            ):
+                return False
+            self._trial_started = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_started = None
+            if (
+                self._opened_at is not None
+                or self._failures >= self.failure_threshold
+            ):
+                if self._opened_at is None:
+                    logger.warning(
+                        "Circuit opened after %d consecutive failures",
+                        self._failures,
+                    )
+                self._opened_at = self._clock()
+
+
+class CallPolicy:
+    """Timeouts, retries, and circuit breaking for Robinhood requests.
+
+    Applied by ``RobinhoodAdapter`` to every request robin_stocks sends:
+
+    * Requests without an explicit timeout get the ``(connect, read)``
+      timeout of their endpoint family.
+    * Idempotent requests that fail with a connection error, a timeout,
+      or a 5xx response are retried up to ``retries`` times after a
+      full-jitter exponential backoff.
+    * Each endpoint family has a ``CircuitBreaker``.  While it is open,
+      requests fail fast with ``CircuitOpenError``.  A request counts as
+      one failure, and only once its retries are exhausted.
+
+    Args:
+        timeouts: ``{family: (connect, read)}`` overriding
+            ``DEFAULT_TIMEOUTS``.
+        retries: Extra attempts for idempotent requests.
+        backoff: Base delay in seconds; attempt ``n`` sleeps a random
+            time up to ``backoff * 2 ** n`` (capped at ``max_backoff``).
+        failure_threshold: Consecutive failures that open a breaker.
+        reset_timeout: Seconds a breaker stays open before a trial.
+    """
+
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, Tuple[float, float]]] = None,
+        retries: int = 2,
+        backoff: float = 0.25,
+        max_backoff: float = 4.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float, float], float] = random.uniform,
+    ):
+        self.timeouts = {**DEFAULT_TIMEOUTS, **(timeouts or {})}
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.sleep = sleep
+        self._jitter = jitter
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def timeout(self, url: str) -> Tuple[float, float]:
+        family = endpoint_family(url)
+        return self.timeouts.get(family) or self.timeouts[DEFAULT_FAMILY]
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        family = endpoint_family(url)
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = self._breakers[family] = CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout, clock=self._clock
+                )
+            return breaker
+
+    def should_retry(self, method: Optional[str], attempt: int) -> bool:
+        """Whether attempt number ``attempt`` (0-based) may be retried."""
+        return (method or "").upper() in _IDEMPOTENT_METHODS and attempt < self.retries
+
+    def delay(self, attempt: int) -> float:
+        """Jittered backoff before retry number ``attempt`` (1-based)."""
+        return self._jitter(0.0, min(self.max_backoff, self.backoff * 2**attempt))
@@ -0,0 +1,185 @@
+# robinhood_core/ratelimit.py
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# URL path fragments mapped to endpoint families, checked in order.
+_FAMILY_RULES: Tuple[Tuple[str, str], ...] = (
+    ("/marketdata/options/", "options_market_data"),
+    ("/marketdata/quotes/", "quotes"),
+    ("/quotes/", "quotes"),
+    ("/orders/", "orders"),
+    ("/instruments/", "instruments"),
+)
+DEFAULT_FAMILY = "default"
+
+# (requests per second, burst) per endpoint family.
+DEFAULT_BUDGETS: Dict[str, Tuple[float, int]] = {
+    "quotes": (5.0, 10),
+    "instruments": (10.0, 20),
+    "orders": (2.0, 5),
+    "options_market_data": (5.0, 10),
+    DEFAULT_FAMILY: (5.0, 10),
+}
+
+# Pause applied after a 429 without a usable Retry-After header.
+_DEFAULT_BACKOFF = 1.0
+_MAX_BACKOFF = 60.0
+
+
+def endpoint_family(url: str) -> str:
+    """Return the rate-limit family for a Robinhood URL."""
+    path = urlparse(url).path
+    for fragment, family in _FAMILY_RULES:
+        if fragment in path:
+            return family
+    return DEFAULT_FAMILY
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Parse a ``Retry-After`` header into seconds, or ``None``."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts to throttling.
+
+    ``reserve`` always takes a token and returns how long the caller must
+    wait before using it, so waiting happens outside the lock.  ``throttle``
+    halves the rate and pauses the bucket; each successful response then
+    restores a twentieth of the configured rate.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._backoff = _DEFAULT_BACKOFF
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._paused_until - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a 429 response."""
+        with self._lock:
+            now = self._clock()
+            if retry_after is None:
+                retry_after = self._backoff
+                self._backoff = min(_MAX_BACKOFF, self._backoff * 2)
+            self._refill(now)
+            self._paused_until = max(
+                self._paused_until, now + min(retry_after, _MAX_BACKOFF)
+            )
+            self._tokens = min(self._tokens, 0.0)
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def recover(self) -> None:
+        """Speed back up after a successful response."""
+        with self._lock:
+            self._backoff = _DEFAULT_BACKOFF
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class RateLimiter:
+    """Process-wide request budget per Robinhood endpoint family.
+
+    Every request takes a token from its family's bucket before it is
+    sent (see ``RobinhoodAdapter``).  A 429 response halves that family's
+    rate and pauses it for ``Retry-After`` seconds; successful responses
+    raise the rate back towards its budget.
+
+    Args:
+        budgets: ``{family: (requests_per_second, burst)}`` overriding
+            ``DEFAULT_BUDGETS``.
+        clock: Monotonic clock, for tests.
+        sleep: Sleep function, for tests.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, Tuple[float, int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        merged = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self._buckets = {
+            family: TokenBucket(rate, burst, clock=clock)
+            for family, (rate, burst) in merged.items()
+        }
+        self._sleep = sleep
+
+    def bucket(self, url: str) -> TokenBucket:
+        family = endpoint_family(url)
+        return self._buckets.get(family) or self._buckets[DEFAULT_FAMILY]
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to ``url`` fits the budget."""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            logger.debug(
+                "Rate limit: waiting %.3fs for %s", wait, endpoint_family(url)
+            )
+            self._sleep(wait)
+
+    def observe(
+        self, url: str, status_code: int, retry_after: Optional[str] = None
+    ) -> None:
+        """Adapt the budget for ``url`` to the response status."""
+        bucket = self.bucket(url)
+        if status_code == 429:
+            delay = parse_retry_after(retry_after)
+            logger.warning(
+                "Robinhood throttled %s requests (Retry-After: %s)",
+                endpoint_family(url),
+                retry_after,
+            )
+            bucket.throttle(delay)
+        elif status_code < 400:
+            bucket.recover()
+
+    def rates(self) -> Dict[str, float]:
+        """Return the current requests-per-second rate of every family."""
+        return {family: bucket.rate for family, bucket in self._buckets.items()}
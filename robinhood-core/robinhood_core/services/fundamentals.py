@@ -32,16 +32,20 @@ class FundamentalsService:
                     return Fundamentals()
                 data = data[0]
 
-            return Fundamentals(
-                market_cap=data.get("market_cap"),
-                pe_ratio=data.get("pe_ratio"),
-                dividend_yield=data.get("dividend_yield"),
-                week_52_high=data.get("high_52_weeks"),
-                week_52_low=data.get("low_52_weeks"),
-            )
+            return self._build_fundamentals(data)
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
             raise RobinhoodAPIError(f"Failed to fetch fundamentals: {e}") from e
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch fundamentals: {e}") from e
+
+    @staticmethod
+    def _build_fundamentals(data: dict) -> Fundamentals:
+        return Fundamentals(
+            market_cap=data.get("market_cap"),
+            pe_ratio=data.get("pe_ratio"),
+            dividend_yield=data.get("dividend_yield"),
+            week_52_high=data.get("high_52_weeks"),
+            week_52_low=data.get("low_52_weeks"),
+        )
@@ -1,7 +1,9 @@
-from typing import List
+from typing import List, Optional
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import Quote, Candle
+from robinhood_core.cache import QuoteCache
+from robinhood_core.candles import CandleStore
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -13,58 +15,31 @@ from robinhood_core.errors import (
 class MarketDataService:
     """Service for market data operations."""
 
-    def __init__(self, client: RobinhoodClient):
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        quote_cache: Optional[QuoteCache] = None,
+        candle_store: Optional[CandleStore] = None,
+    ):
         self.client = client
+        self.quote_cache = quote_cache or QuoteCache()
+        self.candle_store = candle_store
 
     def get_current_price(self, symbols: List[str]) -> List[Quote]:
-        """Get current price quotes for symbols."""
+        """Get current price quotes for symbols.
+
+        Fresh quotes are served from ``quote_cache``; missing or stale
+        symbols are fetched together in one ``rh.get_quotes`` batch.
+        """
         if not symbols:
             raise InvalidArgumentError("At least one symbol is required")
 
         self.client.ensure_session()
 
         try:
-            # Handle single symbol vs list
-            if len(symbols) == 1:
-                data = rh.get_quotes(symbols[0])
-            else:
-                data = rh.get_quotes(symbols)
-
-            if not data:
-                return []
-
-            # Ensure list format
-            if not isinstance(data, list):
-                data = [data]
-
-            quotes = []
-            for item in data:
-                # Compute change_percent from last_trade_price and previous_close
-                # since robin_stocks API does not return change_percent directly.
-                last_trade_price = item.get("last_trade_price")
-                previous_close = item.get("previous_close")
-                change_percent = None
-                if last_trade_price is not None and previous_close is not None:
-                    try:
-                        ltp = float(last_trade_price)
-                        pc = float(previous_close)
-                        if pc != 0:
-                            change_percent = ((ltp - pc) / pc) * 100
-                    except (ValueError, TypeError):
-                        change_percent = None
-
-                quote = Quote(
-                    symbol=item.get("symbol", ""),
-                    last_price=last_trade_price,
-                    bid=item.get("bid_price"),
-                    ask=item.get("ask_price"),
-                    timestamp=item.get("updated_at"),
-                    previous_close=previous_close,
-                    change_percent=change_percent,
-                )
-                quotes.append(quote)
+            data = self.quote_cache.get_quotes(symbols, rh.get_quotes)
 
-            return quotes
+            return [self._build_quote(item) for item in data.values()]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
@@ -72,18 +47,13 @@ class MarketDataService:
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch quotes: {e}") from e
 
-    def get_price_history(
-        self,
-        symbol: str,
-        interval: str = "hour",
-        span: str = "week",
-        bounds: str = "regular",
-    ) -> List[Candle]:
-        """Get historical price data for a symbol."""
+    @staticmethod
+    def _validate_history_args(
+        symbol: str, interval: str, span: str, bounds: str
+    ) -> None:
         if not symbol:
             raise InvalidArgumentError("Symbol is required")
 
-        # Validate inputs
         valid_intervals = ["5minute", "10minute", "hour", "day", "week"]
         valid_spans = ["day", "week", "month", "3month", "year", "5year"]
         valid_bounds = ["extended", "trading", "regular"]
@@ -93,35 +63,85 @@ class MarketDataService:
                 f"Invalid interval. Must be one of: {valid_intervals}"
             )
         if span not in valid_spans:
-            raise InvalidArgumentError(f"Invalid span. Must be one of: {valid_spans}")
+            raise InvalidArgumentError(
+                f"Invalid span. Must be one of: {valid_spans}"
+            )
         if bounds not in valid_bounds:
             raise InvalidArgumentError(
                 f"Invalid bounds. Must be one of: {valid_bounds}"
             )
 
+    @staticmethod
+    def _build_quote(item: dict) -> Quote:
+        """Build a Quote from a robin_stocks quote dict."""
+        # Compute change_percent from last_trade_price and previous_close
+        # since robin_stocks API does not return change_percent directly.
+        last_trade_price = item.get("last_trade_price")
+        previous_close = item.get("previous_close")
+        change_percent = None
+        if last_trade_price is not None and previous_close is not None:
+            try:
+                ltp = float(last_trade_price)
+                pc = float(previous_close)
+                if pc != 0:
+                    change_percent = ((ltp - pc) / pc) * 100
+            except (ValueError, TypeError):
+                change_percent = None
+
+        return Quote(
+            symbol=item.get("symbol", ""),
+            last_price=last_trade_price,
+            bid=item.get("bid_price"),
+            ask=item.get("ask_price"),
+            timestamp=item.get("updated_at"),
+            previous_close=previous_close,
+            change_percent=change_percent,
+        )
+
+    @staticmethod
+    def _build_candle(item: dict) -> Candle:
+        return Candle(
+            timestamp=item.get("begins_at"),
+            open=item.get("open_price"),
+            high=item.get("high_price"),
+            low=item.get("low_price"),
+            close=item.get("close_price"),
+            volume=item.get("volume"),
+        )
+
+    def get_price_history(
+        self,
+        symbol: str,
+        interval: str = "hour",
+        span: str = "week",
+        bounds: str = "regular",
+    ) -> List[Candle]:
+        """Get historical price data for a symbol.
+
+        With a ``candle_store``, stored bars are reused and only the recent
+        tail is fetched from Robinhood.
+        """
+        self._validate_history_args(symbol, interval, span, bounds)
+
         self.client.ensure_session()
 
         try:
-            data = rh.get_stock_historicals(
-                symbol, interval=interval, span=span, bounds=bounds
-            )
+            def fetch(fetch_span: str) -> Optional[list]:
+                return rh.get_stock_historicals(
+                    symbol, interval=interval, span=fetch_span, bounds=bounds
+                )
+
+            if self.candle_store is not None:
+                data = self.candle_store.history(
+                    symbol, interval, span, bounds, fetch
+                )
+            else:
+                data = fetch(span)
 
             if not data:
                 return []
 
-            candles = []
-            for item in data:
-                candle = Candle(
-                    timestamp=item.get("begins_at"),
-                    open=item.get("open_price"),
-                    high=item.get("high_price"),
-                    low=item.get("low_price"),
-                    close=item.get("close_price"),
-                    volume=item.get("volume"),
-                )
-                candles.append(candle)
-
-            return candles
+            return [self._build_candle(item) for item in data]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
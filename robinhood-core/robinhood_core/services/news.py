@@ -36,24 +36,25 @@ class NewsService:
             if not news_data:
                 return []
 
-            items = []
-            for item in news_data:
-                if not isinstance(item, dict):
-                    continue
-                news_item = NewsItem(
-                    id=item.get("uuid", ""),
-                    headline=item.get("title", ""),
-                    summary=item.get("summary", ""),
-                    source=item.get("source", ""),
-                    url=item.get("url", ""),
-                    published_at=item.get("published_at"),
-                )
-                items.append(news_item)
-
-            return items
+            return [
+                self._build_news_item(item)
+                for item in news_data
+                if isinstance(item, dict)
+            ]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
             raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
+
+    @staticmethod
+    def _build_news_item(item: dict) -> NewsItem:
+        return NewsItem(
+            id=item.get("uuid", ""),
+            headline=item.get("title", ""),
+            summary=item.get("summary", ""),
+            source=item.get("source", ""),
+            url=item.get("url", ""),
+            published_at=item.get("published_at"),
+        )
@@ -1,11 +1,15 @@
 # robin_stocks_mcp/services/options.py
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, List, Optional, Tuple
 
 import requests
 import robin_stocks.robinhood as rh
 
 from robinhood_core.models import OptionContract, OptionPosition
+from robinhood_core.cache import OptionInstrumentCache, QuoteCache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -15,6 +19,11 @@ from robinhood_core.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Instrument ids per request to the option market data endpoint.
+MARKET_DATA_CHUNK_SIZE = 40
+# Upper bound on concurrent market data requests for a single call.
+MAX_MARKET_DATA_WORKERS = 4
+
 
 class OptionsService:
     """Service for options operations.
@@ -23,27 +32,56 @@ class OptionsService:
 
     1. **Chain listing** (no strike_price): ``find_tradable_options`` makes a
        single paginated API call to Robinhood.  This is fast but returns only
-       instrument data (strike, type, expiration) — no bid/ask or greeks.
+       instrument data (strike, type, expiration) — no bid/ask or greeks —
+       unless ``with_market_data`` is set, in which case market data for the
+       near-the-money contracts is fetched in bulk as for a strike ladder.
 
     2. **Targeted lookup** (strike_price provided): ``get_option_market_data``
        returns full market data (bid/ask, greeks, profitability) for the
        specific (symbol, expiration, strike, type) combination.
 
+    3. **Strike ladder** (strike_prices or strikes_around_atm provided):
+       instrument ids come from one ``find_tradable_options`` call and market
+       data is fetched in bulk by id, ``MARKET_DATA_CHUNK_SIZE`` contracts
+       per request.
+
     The slow ``find_options_by_expiration`` helper is intentionally avoided
     because it makes one HTTP request *per contract* to fetch market data,
     which easily exceeds the 60-second MCP timeout for chains with many
     strikes.
     """
 
-    def __init__(self, client: RobinhoodClient):
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        option_instrument_cache: Optional[OptionInstrumentCache] = None,
+        quote_cache: Optional[QuoteCache] = None,
+    ):
         self.client = client
+        self.option_instrument_cache = (
+            option_instrument_cache or OptionInstrumentCache()
+        )
+        self.quote_cache = quote_cache or QuoteCache()
+        # symbol -> (day fetched, expiration dates from get_chains)
+        self._expirations: Dict[str, Tuple[date, List[str]]] = {}
+        self._expirations_lock = threading.Lock()
 
     def _get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current stock price for near-the-money filtering."""
+        """Get current stock price for near-the-money filtering.
+
+        Prefers the extended-hours price when present, matching
+        ``rh.get_latest_price``.
+        """
         try:
-            prices = rh.get_latest_price(symbol)
-            if prices and prices[0]:
-                return float(prices[0])
+            quote = self.quote_cache.get_quotes([symbol], rh.get_quotes).get(
+                symbol.upper()
+            )
+            if quote:
+                price = quote.get("last_extended_hours_trade_price") or quote.get(
+                    "last_trade_price"
+                )
+                if price:
+                    return float(price)
         except Exception:
             pass
         return None
@@ -83,6 +121,9 @@ class OptionsService:
         expiration_date: Optional[str] = None,
         option_type: Optional[str] = None,
         strike_price: Optional[str] = None,
+        strike_prices: Optional[List[str]] = None,
+        strikes_around_atm: Optional[int] = None,
+        with_market_data: bool = False,
     ) -> List[OptionContract]:
         """Get options chain for a symbol.
 
@@ -93,25 +134,35 @@ class OptionsService:
             strike_price: Specific strike price. When provided,
                 returns 1-2 contracts with full greeks via
                 ``get_option_market_data``.
+            strike_prices: Several strikes to return with full greeks.
+            strikes_around_atm: Number of strikes closest to the current
+                price to return with full greeks.
+            with_market_data: Add bid/ask and greeks to the chain listing
+                (when no strike is given), fetched in bulk by instrument id.
         """
         if not symbol:
             raise InvalidArgumentError("Symbol is required")
+        if strikes_around_atm is not None and strikes_around_atm < 1:
+            raise InvalidArgumentError("strikes_around_atm must be at least 1")
 
         self.client.ensure_session()
 
         try:
             # Resolve expiration date if not provided
             if not expiration_date:
-                chains_data = rh.get_chains(symbol)
-                if not chains_data or not isinstance(chains_data, dict):
+                expiration_date = self._nearest_expiration(symbol)
+                if not expiration_date:
                     return []
-                expirations = chains_data.get("expiration_dates", [])
-                if not expirations:
-                    return []
-                expiration_date = str(expirations[0])
 
             exp = str(expiration_date)
 
+            # --- Strike ladder (several strikes or N around the money) ---
+            # Uses find_tradable_options + bulk market data by instrument id.
+            if strike_prices or strikes_around_atm:
+                return self._strike_ladder(
+                    symbol, exp, option_type, strike_prices, strikes_around_atm
+                )
+
             # --- Targeted lookup (strike_price provided) ---
             # Uses get_option_market_data for full greeks.
             if strike_price:
@@ -119,7 +170,7 @@ class OptionsService:
 
             # --- Chain listing (no strike_price) ---
             # Uses find_tradable_options (single paginated call).
-            return self._chain_listing(symbol, exp, option_type)
+            return self._chain_listing(symbol, exp, option_type, with_market_data)
 
         except (
             RobinhoodAPIError,
@@ -140,6 +191,32 @@ class OptionsService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _nearest_expiration(self, symbol: str) -> Optional[str]:
+        """Return the nearest expiration date for ``symbol``.
+
+        ``get_chains`` is called at most once per symbol per day.  A cached
+        list is dropped early once its nearest expiration has passed.
+        """
+        key = symbol.upper()
+        today = date.today()
+        with self._expirations_lock:
+            cached = self._expirations.get(key)
+        if cached is not None:
+            fetched_on, expirations = cached
+            if fetched_on == today and expirations[0] >= today.isoformat():
+                return expirations[0]
+
+        chains_data = rh.get_chains(symbol)
+        if not chains_data or not isinstance(chains_data, dict):
+            return None
+        expirations = [str(e) for e in chains_data.get("expiration_dates") or []]
+        if not expirations:
+            return None
+
+        with self._expirations_lock:
+            self._expirations[key] = (today, expirations)
+        return expirations[0]
+
     def _targeted_lookup(
         self,
         symbol: str,
@@ -152,17 +229,29 @@ class OptionsService:
         If ``option_type`` is given, returns one contract.
         Otherwise returns both call and put at that strike.
         """
-        contracts: List[OptionContract] = []
-
         types_to_fetch: List[str] = [option_type] if option_type else ["call", "put"]
 
-        for ot in types_to_fetch:
-            md = rh.get_option_market_data(
+        def fetch(ot: str):
+            return rh.get_option_market_data(
                 symbol,
                 expirationDate=exp,
                 strikePrice=str(strike_price),
                 optionType=ot,
             )
+
+        # Call and put are independent requests; issue them together so the
+        # lookup costs one round trip.  map() keeps the call-then-put order.
+        if len(types_to_fetch) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(types_to_fetch),
+                thread_name_prefix="rh-options",
+            ) as pool:
+                responses = list(pool.map(fetch, types_to_fetch))
+        else:
+            responses = [fetch(ot) for ot in types_to_fetch]
+
+        contracts: List[OptionContract] = []
+        for ot, md in zip(types_to_fetch, responses):
             if not md:
                 continue
             # get_option_market_data returns a list of
@@ -184,17 +273,156 @@ class OptionsService:
 
         return contracts
 
+    def _strike_ladder(
+        self,
+        symbol: str,
+        exp: str,
+        option_type: Optional[str],
+        strike_prices: Optional[List[str]],
+        strikes_around_atm: Optional[int],
+    ) -> List[OptionContract]:
+        """Fetch full market data for several strikes in bulk.
+
+        Instrument ids are resolved from a single ``find_tradable_options``
+        call, then market data is requested by id in chunks.  Contracts are
+        returned sorted by strike, calls before puts.
+        """
+        options_data = rh.find_tradable_options(
+            symbol,
+            expirationDate=exp,
+            optionType=option_type,
+        )
+        instruments = [
+            item
+            for item in (options_data or [])
+            if item and isinstance(item, dict) and item.get("id")
+        ]
+        if not instruments:
+            return []
+
+        current_price = None
+        if strikes_around_atm:
+            current_price = self._get_current_price(symbol)
+            if current_price is None:
+                raise RobinhoodAPIError(
+                    f"Could not determine current price for {symbol}"
+                )
+        selected = self._select_strikes(
+            instruments, strike_prices, strikes_around_atm, current_price
+        )
+
+        return self._with_market_data(selected, symbol, exp)
+
+    def _with_market_data(
+        self, instruments: List[dict], symbol: str, exp: str
+    ) -> List[OptionContract]:
+        """Build contracts from instruments merged with bulk market data."""
+        market_data = self._market_data_by_ids(
+            [item["id"] for item in instruments if item.get("id")]
+        )
+        contracts: List[OptionContract] = []
+        for item in instruments:
+            # Instrument fields (strike/type/expiration) win over market data.
+            merged = {**market_data.get(item.get("id"), {}), **item}
+            contracts.append(self._build_contract(merged, symbol, exp))
+        return contracts
+
+    @staticmethod
+    def _select_strikes(
+        instruments: List[dict],
+        strike_prices: Optional[List[str]],
+        strikes_around_atm: Optional[int],
+        current_price: Optional[float],
+    ) -> List[dict]:
+        """Pick the ladder's instruments, sorted by strike, calls first."""
+
+        def strike_of(item: dict) -> Optional[float]:
+            try:
+                return float(item.get("strike_price"))
+            except (ValueError, TypeError):
+                return None
+
+        available = sorted(
+            {strike for strike in map(strike_of, instruments) if strike is not None}
+        )
+        wanted = set()
+        for raw in strike_prices or []:
+            try:
+                wanted.add(float(raw))
+            except (ValueError, TypeError):
+                raise InvalidArgumentError(f"Invalid strike price: {raw}")
+        if strikes_around_atm and current_price is not None:
+            nearest = sorted(available, key=lambda s: abs(s - current_price))
+            wanted.update(nearest[:strikes_around_atm])
+
+        selected = [item for item in instruments if strike_of(item) in wanted]
+        selected.sort(
+            key=lambda item: (strike_of(item), 0 if item.get("type") == "call" else 1)
+        )
+        return selected
+
+    @staticmethod
+    def _index_market_data(results: Optional[list], by_id: Dict[str, dict]) -> None:
+        """Add option market data rows to ``by_id`` keyed by instrument id."""
+        for item in results or []:
+            if not item or not isinstance(item, dict):
+                continue
+            instrument_id = item.get("instrument_id") or (
+                str(item.get("instrument", "")).rstrip("/").split("/")[-1]
+            )
+            if instrument_id:
+                by_id[instrument_id] = item
+
+    @staticmethod
+    def _market_data_by_ids(ids: List[str]) -> Dict[str, dict]:
+        """Fetch option market data for many instrument ids.
+
+        Returns a map of instrument id to market data.  Ids are sent
+        ``MARKET_DATA_CHUNK_SIZE`` at a time to keep URLs short, and
+        chunks are fetched concurrently.
+        """
+
+        def fetch(chunk: List[str]) -> Optional[list]:
+            return rh.request_get(
+                rh.urls.marketdata_options_url(),
+                "results",
+                {"ids": ",".join(chunk)},
+            )
+
+        chunks = [
+            ids[start : start + MARKET_DATA_CHUNK_SIZE]
+            for start in range(0, len(ids), MARKET_DATA_CHUNK_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(chunks), MAX_MARKET_DATA_WORKERS),
+                thread_name_prefix="rh-options",
+            ) as pool:
+                pages = list(pool.map(fetch, chunks))
+        else:
+            pages = [fetch(chunk) for chunk in chunks]
+
+        by_id: Dict[str, dict] = {}
+        for results in pages:
+            OptionsService._index_market_data(results, by_id)
+        return by_id
+
     def _chain_listing(
         self,
         symbol: str,
         exp: str,
         option_type: Optional[str],
+        with_market_data: bool = False,
     ) -> List[OptionContract]:
-        """List strikes for an expiration (no greeks).
+        """List strikes for an expiration.
 
         Uses ``find_tradable_options`` which is a single paginated
         API call — fast even for large chains.  Results are filtered
         to near-the-money (±20% of current price) when possible.
+
+        With ``with_market_data`` the remaining contracts also get bid/ask
+        and greeks, fetched by instrument id in bulk.  Otherwise only
+        instrument data is returned.
         """
         options_data = rh.find_tradable_options(
             symbol,
@@ -208,31 +436,40 @@ class OptionsService:
         # Near-the-money filtering
         current_price = self._get_current_price(symbol)
 
-        contracts: List[OptionContract] = []
-        for item in options_data:
-            if not item or not isinstance(item, dict):
-                continue
+        selected = [
+            item
+            for item in options_data
+            if item
+            and isinstance(item, dict)
+            and self._near_the_money(item, current_price)
+        ]
+        if with_market_data:
+            return self._with_market_data(selected, symbol, exp)
 
-            if current_price:
-                try:
-                    strike_val = float(item.get("strike_price", 0))
-                    lower = current_price * 0.80
-                    upper = current_price * 1.20
-                    if strike_val < lower or strike_val > upper:
-                        continue
-                except (ValueError, TypeError):
-                    pass
+        return [self._build_contract(item, symbol, exp) for item in selected]
 
-            contracts.append(self._build_contract(item, symbol, exp))
+    @staticmethod
+    def _near_the_money(item: dict, current_price: Optional[float]) -> bool:
+        """Whether a strike is within ±20% of ``current_price``.
 
-        return contracts
+        Always true when the price or strike is unknown.
+        """
+        if not current_price:
+            return True
+        try:
+            strike_val = float(item.get("strike_price", 0))
+        except (ValueError, TypeError):
+            return True
+        return current_price * 0.80 <= strike_val <= current_price * 1.20
 
     def get_option_positions(self) -> List[OptionPosition]:
         """Get all open option positions for the account.
 
         Calls ``rh.get_open_option_positions()`` and resolves each
         position's option instrument URL to extract the underlying
-        symbol, strike, expiration, and option type.
+        symbol, strike, expiration, and option type.  Instrument data is
+        served from ``option_instrument_cache`` when available, so repeat
+        calls only fetch the positions list.
         """
         self.client.ensure_session()
 
@@ -247,42 +484,22 @@ class OptionsService:
                 if not item or not isinstance(item, dict):
                     continue
 
-                # Resolve the option instrument for strike/expiration/type
+                instrument = None
                 option_url = item.get("option")
-                symbol = item.get("chain_symbol")
-                strike_price = None
-                expiration_date = None
-                option_type = None
-
                 if option_url:
                     try:
                         # Extract the option ID from the URL and fetch instrument data
                         option_id = option_url.rstrip("/").split("/")[-1]
-                        instrument = rh.get_option_instrument_data_by_id(option_id)
-                        if instrument and isinstance(instrument, dict):
-                            strike_price = instrument.get("strike_price")
-                            expiration_date = instrument.get("expiration_date")
-                            option_type = instrument.get("type")
-                            if not symbol:
-                                symbol = instrument.get("chain_symbol")
+                        instrument = self.option_instrument_cache.resolve(
+                            option_id, rh.get_option_instrument_data_by_id
+                        )
                     except Exception:
                         logger.debug(
                             "Failed to resolve option instrument: %s",
                             option_url,
                         )
 
-                position = OptionPosition(
-                    symbol=symbol,
-                    expiration_date=expiration_date,
-                    strike_price=strike_price,
-                    option_type=option_type,
-                    direction=item.get("type"),
-                    quantity=item.get("quantity"),
-                    average_price=item.get("average_price"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                )
-                positions.append(position)
+                positions.append(self._build_option_position(item, instrument))
 
             return positions
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
@@ -291,3 +508,22 @@ class OptionsService:
             raise RobinhoodAPIError(f"Failed to fetch option positions: {e}") from e
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch option positions: {e}") from e
+
+    @staticmethod
+    def _build_option_position(
+        item: dict, instrument: Optional[dict]
+    ) -> OptionPosition:
+        """Build an OptionPosition with strike/expiration/type from ``instrument``."""
+        if not instrument or not isinstance(instrument, dict):
+            instrument = {}
+        return OptionPosition(
+            symbol=item.get("chain_symbol") or instrument.get("chain_symbol"),
+            expiration_date=instrument.get("expiration_date"),
+            strike_price=instrument.get("strike_price"),
+            option_type=instrument.get("type"),
+            direction=item.get("type"),
+            quantity=item.get("quantity"),
+            average_price=item.get("average_price"),
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+        )
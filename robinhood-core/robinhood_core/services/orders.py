@@ -1,9 +1,23 @@
+import base64
+import binascii
+import json
 import logging
-from typing import List, Optional
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-import requests
 import robin_stocks.robinhood as rh
 
+from robinhood_core.cache import CryptoPairTable, InstrumentCache
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.errors import (
+    AuthRequiredError,
+    InvalidArgumentError,
+    RobinhoodAPIError,
+)
+from robinhood_core.journal import JournalRow, OrderJournal
 from robinhood_core.models.orders import (
     CryptoOrder,
     OptionOrder,
@@ -11,200 +25,673 @@ from robinhood_core.models.orders import (
     OrderHistory,
     StockOrder,
 )
-from robinhood_core.client import RobinhoodClient
-from robinhood_core.errors import (
-    AuthRequiredError,
-    InvalidArgumentError,
-    RobinhoodAPIError,
-)
 
 logger = logging.getLogger(__name__)
 
+ORDER_CATEGORIES = ("stock", "option", "crypto")
+
+# Position of the last order returned for a category: (created_at, id).
+OrderPosition = Tuple[str, str]
+
+# Where live paging resumes: the Robinhood page holding the next order
+# (``None`` for the first page) and how many of its orders to skip.
+PagePosition = Tuple[Optional[str], int]
+
+# One category's entry in a cursor: ``{"page": [url, offset]}`` on the
+# live path, ``{"after": [created_at, id]}`` on the journal path, or
+# ``None`` to start again from the newest order.
+CursorEntry = Optional[Dict[str, Any]]
+
+# A page of orders: (page URL, or None for the first page; orders; next URL).
+OrderPage = Tuple[Optional[str], List[dict], Optional[str]]
+
 
 class OrdersService:
-    def __init__(self, client: RobinhoodClient):
+    """Service for order history.
+
+    Args:
+        client: Authenticated Robinhood client.
+        instrument_cache: Shared instrument URL cache.  A private
+            in-memory cache is used when omitted.
+        crypto_pairs: Crypto currency pair table used to label crypto
+            orders with their symbol.  A private table is used when
+            omitted.
+        journal: Local order journal.  When given, each call syncs only
+            orders updated since the last sync and filters locally;
+            otherwise every call pages through the history from Robinhood,
+            newest first, and stops as soon as ``limit`` orders match.  A
+            call also pages from Robinhood when the journal's database is
+            locked or unreadable.
+    """
+
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        instrument_cache: Optional[InstrumentCache] = None,
+        journal: Optional[OrderJournal] = None,
+        crypto_pairs: Optional[CryptoPairTable] = None,
+    ):
         self.client = client
+        self.instrument_cache = instrument_cache or InstrumentCache()
+        self.journal = journal
+        self.crypto_pairs = crypto_pairs or CryptoPairTable()
 
     def get_order_history(
         self,
         order_type: Optional[str] = None,
         symbol: Optional[str] = None,
         start_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> OrderHistory:
+        """Get order history, newest first.
+
+        Args:
+            order_type: ``stock``, ``option``, ``crypto`` or ``all``.
+            symbol: Only orders for this symbol (stock and option orders).
+            start_date: Only stock and option orders updated on or after
+                this date, and crypto orders created on or after it (the
+                crypto endpoint cannot filter by update time).
+            limit: At most this many orders per category.  When a category
+                may have more, ``OrderHistory.next_cursor`` is set.
+            end_date: Only orders created on or before this date.
+            state: Only orders in this state, e.g. ``filled``.
+            cursor: ``next_cursor`` of the previous page.  Pass the same
+                filters as for that page.
+        """
+        if limit is not None and limit < 1:
+            raise InvalidArgumentError("limit must be at least 1")
+
         self.client.ensure_session()
 
+        order_type = self._validate_order_type(order_type)
+        positions = self._page_positions(order_type, cursor)
+
+        fetchers: Dict[str, Callable[[], Tuple[list, CursorEntry]]] = {}
+        if "stock" in positions:
+            fetchers["stock"] = lambda: self._get_stock_orders(
+                symbol, start_date, limit, end_date, state, positions["stock"]
+            )
+        if "option" in positions:
+            fetchers["option"] = lambda: self._get_option_orders(
+                symbol, start_date, limit, end_date, state, positions["option"]
+            )
+        if "crypto" in positions:
+            fetchers["crypto"] = lambda: self._get_crypto_orders(
+                start_date, limit, end_date, state, positions["crypto"]
+            )
+        if not fetchers:
+            return OrderHistory()
+
+        # Each category is an independent paginated download, so run them
+        # concurrently and collect failures per category.
+        results: Dict[str, list] = {}
+        pending: Dict[str, CursorEntry] = {}
+        errors: Dict[str, Exception] = {}
+        with ThreadPoolExecutor(
+            max_workers=len(fetchers), thread_name_prefix="rh-orders"
+        ) as pool:
+            futures = {name: pool.submit(fetch) for name, fetch in fetchers.items()}
+            for name, future in futures.items():
+                try:
+                    results[name], resume = future.result()
+                except Exception as e:
+                    logger.warning("Failed to fetch %s orders: %s", name, e)
+                    errors[name] = e
+                    continue
+                if resume is not None:
+                    pending[name] = resume
+
+        return self._assemble_history(results, errors, pending, positions)
+
+    @staticmethod
+    def _validate_order_type(order_type: Optional[str]) -> str:
         order_type = (order_type or "all").lower()
         valid_types = {"all", "stock", "option", "crypto"}
         if order_type not in valid_types:
             raise InvalidArgumentError(
                 f"Invalid order type '{order_type}'. Must be one of: {', '.join(sorted(valid_types))}"
             )
+        return order_type
+
+    @staticmethod
+    def _page_positions(
+        order_type: str, cursor: Optional[str]
+    ) -> Dict[str, CursorEntry]:
+        """Map each category to fetch to where it continues.
 
+        Without a cursor every requested category starts at its newest
+        order (``None``).  A cursor only lists the categories that may
+        have more orders.
+        """
+        requested = [c for c in ORDER_CATEGORIES if order_type in ("all", c)]
+        if not cursor:
+            return {category: None for category in requested}
         try:
-            stock_orders: List[StockOrder] = []
-            option_orders: List[OptionOrder] = []
-            crypto_orders: List[CryptoOrder] = []
+            decoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            positions = {
+                category: decoded[category]
+                for category in requested
+                if category in decoded
+            }
+        except (binascii.Error, ValueError, TypeError, AttributeError) as e:
+            raise InvalidArgumentError("Invalid cursor") from e
+        if any(p is not None and not isinstance(p, dict) for p in positions.values()):
+            raise InvalidArgumentError("Invalid cursor")
+        return positions
+
+    @staticmethod
+    def _after(position: CursorEntry) -> Optional[OrderPosition]:
+        """Decode a journal cursor entry into ``(created_at, id)``."""
+        if position is None:
+            return None
+        after = position.get("after")
+        if (
+            not isinstance(after, list)
+            or len(after) != 2
+            or not all(isinstance(part, str) for part in after)
+        ):
+            raise InvalidArgumentError("Invalid cursor")
+        return after[0], after[1]
 
-            if order_type in ("all", "stock"):
-                stock_orders = self._get_stock_orders(symbol, start_date)
+    @staticmethod
+    def _resume(position: CursorEntry, url: str) -> PagePosition:
+        """Decode a live cursor entry into ``(page URL, offset)``.
 
-            if order_type in ("all", "option"):
-                option_orders = self._get_option_orders(symbol, start_date)
+        The page must belong to the endpoint at ``url``: the cursor comes
+        from the caller and the page is requested with the session's
+        credentials.
+        """
+        if position is None:
+            return None, 0
+        page = position.get("page")
+        if not isinstance(page, list) or len(page) != 2:
+            raise InvalidArgumentError("Invalid cursor")
+        page_url, offset = page
+        if not isinstance(offset, int) or isinstance(offset, bool) or offset < 0:
+            raise InvalidArgumentError("Invalid cursor")
+        if page_url is not None:
+            if not isinstance(page_url, str):
+                raise InvalidArgumentError("Invalid cursor")
+            expected, given = urlsplit(url), urlsplit(page_url)
+            if given[:3] != expected[:3]:
+                raise InvalidArgumentError("Invalid cursor")
+        return page_url, offset
 
-            if order_type in ("all", "crypto"):
-                crypto_orders = self._get_crypto_orders(start_date)
+    @staticmethod
+    def _resume_at(
+        page_url: Optional[str], page: List[dict], index: int, next_url: Optional[str]
+    ) -> CursorEntry:
+        """Cursor entry continuing after ``page[index]``, or ``None`` at the end."""
+        if index + 1 < len(page):
+            return {"page": [page_url, index + 1]}
+        if next_url:
+            return {"page": [next_url, 0]}
+        return None
 
-            return OrderHistory(
-                stock_orders=stock_orders,
-                option_orders=option_orders,
-                crypto_orders=crypto_orders,
-            )
-        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
-            raise
-        except (requests.RequestException, ConnectionError, TimeoutError) as e:
-            raise RobinhoodAPIError(f"Failed to fetch order history: {e}") from e
-        except Exception as e:
+    @staticmethod
+    def _next_cursor(
+        pending: Dict[str, CursorEntry],
+        errors: Dict[str, Exception],
+        positions: Dict[str, CursorEntry],
+    ) -> Optional[str]:
+        """Encode where each unfinished category continues, if any.
+
+        ``pending`` holds the categories that filled their ``limit`` and
+        may have more orders; a failed category is retried from where it
+        was.
+        """
+        if not pending:
+            return None
+        entries = dict(pending)
+        for category in errors:
+            entries[category] = positions.get(category)
+        encoded = json.dumps(entries, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(encoded).decode()
+
+    @staticmethod
+    def _in_page(item: dict, end_date: Optional[str], state: Optional[str]) -> bool:
+        """Whether an order passes the end_date and state filters."""
+        created_at = str(item.get("created_at") or "")
+        if end_date and created_at[: len(end_date)] > end_date:
+            return False
+        if state and item.get("state") != state:
+            return False
+        return True
+
+    @staticmethod
+    def _assemble_history(
+        results: Dict[str, list],
+        errors: Dict[str, Exception],
+        pending: Optional[Dict[str, CursorEntry]] = None,
+        positions: Optional[Dict[str, CursorEntry]] = None,
+    ) -> OrderHistory:
+        """Combine per-category results, keeping partial failures.
+
+        Argument and auth errors are re-raised; other errors fail the call
+        only when every category failed.
+        """
+        for e in errors.values():
+            if isinstance(e, (InvalidArgumentError, AuthRequiredError)):
+                raise e
+
+        if errors and not results:
+            e = next(iter(errors.values()))
+            if isinstance(e, RobinhoodAPIError):
+                raise e
             raise RobinhoodAPIError(f"Failed to fetch order history: {e}") from e
 
+        return OrderHistory(
+            stock_orders=results.get("stock", []),
+            option_orders=results.get("option", []),
+            crypto_orders=results.get("crypto", []),
+            errors={name: str(e) for name, e in errors.items()},
+            next_cursor=OrdersService._next_cursor(
+                pending or {}, errors, positions or {}
+            ),
+        )
+
     def _get_stock_orders(
         self,
         symbol: Optional[str],
         start_date: Optional[str],
-    ) -> List[StockOrder]:
-        raw = rh.get_all_stock_orders(start_date=start_date)
-        if not raw:
-            return []
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        position: CursorEntry = None,
+    ) -> Tuple[List[StockOrder], CursorEntry]:
+        if self.journal is not None:
+            journaled = self._from_journal(
+                "stock",
+                lambda: self._sync_journal(
+                    "stock",
+                    lambda mark: rh.urls.orders_url(start_date=mark),
+                    self._resolve_stock_symbol,
+                    on_page=self._prefetch_instruments,
+                ),
+                lambda: [
+                    self._build_stock_order(item, order_symbol)
+                    for order_symbol, item in self.journal.query(
+                        "stock",
+                        symbol,
+                        start_date,
+                        limit,
+                        end_date,
+                        state,
+                        self._after(position),
+                    )
+                ],
+                limit,
+            )
+            if journaled is not None:
+                return journaled
+
+        url = rh.urls.orders_url(start_date=start_date)
+        page_url, skip = self._resume(position, url)
+
+        # Let Robinhood filter by instrument instead of resolving the
+        # instrument of every order just to drop most of them.
+        params = None
+        if symbol:
+            instrument_url = self._instrument_url(symbol)
+            if instrument_url is None:
+                return [], None
+            params = {"instrument": instrument_url}
 
         orders: List[StockOrder] = []
-        for item in raw:
-            if not item or not isinstance(item, dict):
-                continue
-
-            order_symbol = self._resolve_stock_symbol(item)
-
-            if symbol and order_symbol and order_symbol.upper() != symbol.upper():
-                continue
-
-            executions = [
-                OrderExecution(
-                    price=ex.get("price"),
-                    quantity=ex.get("quantity"),
-                    settlement_date=ex.get("settlement_date"),
-                    timestamp=ex.get("timestamp"),
-                    id=ex.get("id"),
-                )
-                for ex in (item.get("executions") or [])
-                if ex and isinstance(ex, dict)
+        for page_url, page, next_url in self._iter_order_pages(url, params, page_url):
+            wanted = [
+                index
+                for index in range(skip, len(page))
+                if self._in_page(page[index], end_date, state)
             ]
+            skip = 0
+            self._prefetch_instruments([page[index] for index in wanted])
+            for index in wanted:
+                item = page[index]
+                order_symbol = self._resolve_stock_symbol(item)
 
-            orders.append(
-                StockOrder(
-                    id=item.get("id"),
-                    symbol=order_symbol,
-                    side=item.get("side"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    cumulative_quantity=item.get("cumulative_quantity"),
-                    price=item.get("price"),
-                    average_price=item.get("average_price"),
-                    stop_price=item.get("stop_price"),
-                    executions=executions,
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    last_transaction_at=item.get("last_transaction_at"),
-                    time_in_force=item.get("time_in_force"),
-                    extended_hours=item.get("extended_hours"),
-                )
-            )
+                if symbol and order_symbol and order_symbol.upper() != symbol.upper():
+                    continue
+
+                orders.append(self._build_stock_order(item, order_symbol))
+                if limit and len(orders) >= limit:
+                    return orders, self._resume_at(page_url, page, index, next_url)
 
-        return orders
+        return orders, None
 
     def _get_option_orders(
         self,
         symbol: Optional[str],
         start_date: Optional[str],
-    ) -> List[OptionOrder]:
-        raw = rh.get_all_option_orders(start_date=start_date)
-        if not raw:
-            return []
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        position: CursorEntry = None,
+    ) -> Tuple[List[OptionOrder], CursorEntry]:
+        if self.journal is not None:
+            journaled = self._from_journal(
+                "option",
+                lambda: self._sync_journal(
+                    "option",
+                    lambda mark: rh.urls.option_orders_url(start_date=mark),
+                    lambda item: item.get("chain_symbol"),
+                ),
+                lambda: [
+                    self._build_option_order(item)
+                    for _, item in self.journal.query(
+                        "option",
+                        symbol,
+                        start_date,
+                        limit,
+                        end_date,
+                        state,
+                        self._after(position),
+                    )
+                ],
+                limit,
+            )
+            if journaled is not None:
+                return journaled
+
+        url = rh.urls.option_orders_url(start_date=start_date)
+        page_url, skip = self._resume(position, url)
 
         orders: List[OptionOrder] = []
-        for item in raw:
-            if not item or not isinstance(item, dict):
-                continue
-
-            chain_symbol = item.get("chain_symbol")
-            if symbol and chain_symbol and chain_symbol.upper() != symbol.upper():
-                continue
-
-            orders.append(
-                OptionOrder(
-                    id=item.get("id"),
-                    chain_symbol=chain_symbol,
-                    direction=item.get("direction"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    pending_quantity=item.get("pending_quantity"),
-                    processed_quantity=item.get("processed_quantity"),
-                    price=item.get("price"),
-                    premium=item.get("premium"),
-                    processed_premium=item.get("processed_premium"),
-                    opening_strategy=item.get("opening_strategy"),
-                    closing_strategy=item.get("closing_strategy"),
-                    legs=item.get("legs"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    time_in_force=item.get("time_in_force"),
-                )
-            )
+        for page_url, page, next_url in self._iter_order_pages(url, None, page_url):
+            for index in range(skip, len(page)):
+                item = page[index]
+                if not self._in_page(item, end_date, state):
+                    continue
+                chain_symbol = item.get("chain_symbol")
+                if symbol and chain_symbol and chain_symbol.upper() != symbol.upper():
+                    continue
+
+                orders.append(self._build_option_order(item))
+                if limit and len(orders) >= limit:
+                    return orders, self._resume_at(page_url, page, index, next_url)
+            skip = 0
 
-        return orders
+        return orders, None
 
     def _get_crypto_orders(
         self,
         start_date: Optional[str],
-    ) -> List[CryptoOrder]:
-        # robin-stocks crypto orders API does not support start_date
-        raw = rh.get_all_crypto_orders()
-        if not raw:
-            return []
+        limit: Optional[int] = None,
+        end_date: Optional[str] = None,
+        state: Optional[str] = None,
+        position: CursorEntry = None,
+    ) -> Tuple[List[CryptoOrder], CursorEntry]:
+        if self.journal is not None:
+            journaled = self._from_journal(
+                "crypto",
+                lambda: self._sync_journal(
+                    "crypto",
+                    lambda mark: rh.urls.crypto_orders_url(),
+                    self._crypto_symbol,
+                    by_created_at=True,
+                ),
+                lambda: [
+                    self._build_crypto_order(
+                        item, pair_symbol or self._crypto_symbol(item)
+                    )
+                    for pair_symbol, item in self.journal.query(
+                        "crypto",
+                        None,
+                        None,
+                        limit,
+                        end_date,
+                        state,
+                        self._after(position),
+                        created_since=start_date,
+                    )
+                ],
+                limit,
+            )
+            if journaled is not None:
+                return journaled
+
+        url = rh.urls.crypto_orders_url()
+        page_url, skip = self._resume(position, url)
 
+        # The crypto orders endpoint has no date filter, so stop paging at
+        # the first order created before start_date (pages are newest
+        # first).
         orders: List[CryptoOrder] = []
-        for item in raw:
-            if not item or not isinstance(item, dict):
-                continue
-
-            orders.append(
-                CryptoOrder(
-                    id=item.get("id"),
-                    currency_pair_id=item.get("currency_pair_id"),
-                    side=item.get("side"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    cumulative_quantity=item.get("cumulative_quantity"),
-                    price=item.get("price"),
-                    average_price=item.get("average_price"),
-                    executions=item.get("executions"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    time_in_force=item.get("time_in_force"),
-                )
+        for page_url, page, next_url in self._iter_order_pages(url, None, page_url):
+            for index in range(skip, len(page)):
+                item = page[index]
+                if start_date and str(item.get("created_at") or "") < start_date:
+                    return orders, None
+                if not self._in_page(item, end_date, state):
+                    continue
+                orders.append(self._build_crypto_order(item, self._crypto_symbol(item)))
+                if limit and len(orders) >= limit:
+                    return orders, self._resume_at(page_url, page, index, next_url)
+            skip = 0
+
+        return orders, None
+
+    @staticmethod
+    def _from_journal(
+        category: str,
+        sync: Callable[[], None],
+        query: Callable[[], list],
+        limit: Optional[int],
+    ) -> Optional[Tuple[list, CursorEntry]]:
+        """Sync and query the journal, or ``None`` when its database fails.
+
+        The journal shares its SQLite file with the caches and with other
+        processes.  When that file stays locked or is unreadable the call
+        is answered from Robinhood instead, as a cache miss would be.
+        """
+        try:
+            sync()
+            orders = query()
+        except sqlite3.Error as e:
+            logger.warning("Order journal unavailable for %s orders: %s", category, e)
+            return None
+        if not limit or len(orders) < limit:
+            return orders, None
+        last = orders[-1]
+        return orders, {"after": [last.created_at or "", last.id or ""]}
+
+    def _crypto_symbol(self, item: dict) -> Optional[str]:
+        return self.crypto_pairs.symbol_for(
+            item.get("currency_pair_id"), rh.get_crypto_currency_pairs
+        )
+
+    @staticmethod
+    def _iter_order_pages(
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        resume_url: Optional[str] = None,
+    ) -> Iterator[OrderPage]:
+        """Yield the orders of a paginated endpoint one page at a time.
+
+        Robinhood returns orders newest first.  The next page is only
+        requested once the caller asks for it, so a caller that stops
+        early never downloads the rest of the history.  A page that fails
+        to load raises ``RobinhoodAPIError`` instead of silently ending the
+        history early.
+
+        Each page comes with its own URL (``None`` for the first page,
+        which is requested from ``url`` with ``params``) and Robinhood's
+        ``next`` link, so a cursor can resume from either.  ``resume_url``
+        starts at a later page instead of the first.
+        """
+        page_url: Optional[str] = resume_url
+        if resume_url:
+            # The ``next`` link already carries the query string.
+            params = None
+        while True:
+            request_url = page_url or url
+            data = rh.request_get(request_url, "regular", params)
+            params = None
+            if not data or not isinstance(data, dict):
+                raise RobinhoodAPIError(f"Failed to load orders page: {request_url}")
+            next_url = data.get("next")
+            yield (
+                page_url,
+                [
+                    item
+                    for item in data.get("results") or []
+                    if item and isinstance(item, dict)
+                ],
+                next_url,
+            )
+            if not next_url:
+                return
+            page_url = next_url
+
+    def _sync_journal(
+        self,
+        category: str,
+        url_for: Callable[[Optional[str]], str],
+        symbol_of: Callable[[dict], Optional[str]],
+        on_page: Optional[Callable[[List[dict]], object]] = None,
+        by_created_at: bool = False,
+    ) -> None:
+        """Pull orders updated since the journal's high-water mark.
+
+        The first sync for a category downloads the full history.  Later
+        syncs pass the mark as ``start_date`` so only changed orders are
+        fetched.  Rows are only recorded, and the mark only advances, once
+        every page has loaded; a failed page fails the sync and leaves the
+        journal as it was, so the next sync asks for the same orders again.
+
+        ``by_created_at`` is for endpoints that cannot filter by update
+        time.  Pages are newest first, so paging stops at the first order
+        created before the mark and before every order the journal still
+        holds as open: no older order can have changed since the last sync.
+        """
+        mark = self.journal.high_water_mark(category)
+        started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        cutoff = None
+        if by_created_at and mark is not None:
+            cutoff = min(filter(None, (mark, self.journal.oldest_open(category))))
+
+        rows: List[JournalRow] = []
+        done = False
+        for _, page, _ in self._iter_order_pages(url_for(mark)):
+            if cutoff is not None:
+                kept = [
+                    item for item in page if str(item.get("created_at") or "") >= cutoff
+                ]
+                done = len(kept) < len(page)
+                page = kept
+            if on_page is not None:
+                on_page(page)
+            rows.extend(
+                (item["id"], symbol_of(item), item) for item in page if item.get("id")
+            )
+            if done:
+                break
+
+        written = self.journal.record(category, rows)
+        if mark is None:
+            self.journal.mark_synced(category, started_at)
+        logger.debug(
+            "Synced %d %s orders (since %s)", written, category, mark or "start"
+        )
+
+    @staticmethod
+    def _build_stock_order(item: dict, symbol: Optional[str]) -> StockOrder:
+        executions = [
+            OrderExecution(
+                price=ex.get("price"),
+                quantity=ex.get("quantity"),
+                settlement_date=ex.get("settlement_date"),
+                timestamp=ex.get("timestamp"),
+                id=ex.get("id"),
             )
+            for ex in (item.get("executions") or [])
+            if ex and isinstance(ex, dict)
+        ]
 
-        return orders
+        return StockOrder(
+            id=item.get("id"),
+            symbol=symbol,
+            side=item.get("side"),
+            type=item.get("type"),
+            state=item.get("state"),
+            quantity=item.get("quantity"),
+            cumulative_quantity=item.get("cumulative_quantity"),
+            price=item.get("price"),
+            average_price=item.get("average_price"),
+            stop_price=item.get("stop_price"),
+            executions=executions,
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+            last_transaction_at=item.get("last_transaction_at"),
+            time_in_force=item.get("time_in_force"),
+            extended_hours=item.get("extended_hours"),
+        )
 
     @staticmethod
-    def _resolve_stock_symbol(item: dict) -> Optional[str]:
+    def _build_option_order(item: dict) -> OptionOrder:
+        return OptionOrder(
+            id=item.get("id"),
+            chain_symbol=item.get("chain_symbol"),
+            direction=item.get("direction"),
+            type=item.get("type"),
+            state=item.get("state"),
+            quantity=item.get("quantity"),
+            pending_quantity=item.get("pending_quantity"),
+            processed_quantity=item.get("processed_quantity"),
+            price=item.get("price"),
+            premium=item.get("premium"),
+            processed_premium=item.get("processed_premium"),
+            opening_strategy=item.get("opening_strategy"),
+            closing_strategy=item.get("closing_strategy"),
+            legs=item.get("legs"),
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+            time_in_force=item.get("time_in_force"),
+        )
+
+    @staticmethod
+    def _build_crypto_order(item: dict, symbol: Optional[str] = None) -> CryptoOrder:
+        return CryptoOrder(
+            id=item.get("id"),
+            currency_pair_id=item.get("currency_pair_id"),
+            symbol=symbol,
+            side=item.get("side"),
+            type=item.get("type"),
+            state=item.get("state"),
+            quantity=item.get("quantity"),
+            cumulative_quantity=item.get("cumulative_quantity"),
+            price=item.get("price"),
+            average_price=item.get("average_price"),
+            executions=item.get("executions"),
+            created_at=item.get("created_at"),
+            updated_at=item.get("updated_at"),
+            time_in_force=item.get("time_in_force"),
+        )
+
+    def _prefetch_instruments(self, page: List[dict]) -> None:
+        """Bulk-resolve the instruments of a page of stock orders."""
+        self.instrument_cache.prefetch(item.get("instrument") for item in page)
+
+    def _instrument_url(self, symbol: str) -> Optional[str]:
+        return self.instrument_cache.url_for_symbol(
+            symbol,
+            lambda s: rh.request_get(
+                rh.urls.instruments_url(), "indexzero", {"symbol": s}
+            ),
+        )
+
+    def _resolve_stock_symbol(self, item: dict) -> Optional[str]:
         instrument_url = item.get("instrument")
         if not instrument_url:
             return None
         try:
-            instrument = rh.get_instrument_by_url(instrument_url)
-            if instrument and isinstance(instrument, dict):
-                return instrument.get("symbol")
+            return self.instrument_cache.symbol_for(
+                instrument_url, rh.get_instrument_by_url
+            )
         except Exception:
             logger.debug("Failed to resolve instrument: %s", instrument_url)
         return None
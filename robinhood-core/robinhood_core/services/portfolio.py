@@ -1,21 +1,53 @@
 # robin_stocks_mcp/services/portfolio.py
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import requests
 import robin_stocks.robinhood as rh
-from robinhood_core.models import PortfolioSummary, Position
+from robinhood_core.models import PortfolioSnapshot, PortfolioSummary, Position
+from robinhood_core.cache import InstrumentCache, QuoteCache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
     InvalidArgumentError,
     RobinhoodAPIError,
 )
+from robinhood_core.services.options import OptionsService
 
+# Upper bound on concurrent instrument lookups for a single call.
+DEFAULT_LOOKUP_WORKERS = 8
 
-class PortfolioService:
-    """Service for portfolio operations."""
 
-    def __init__(self, client: RobinhoodClient):
+class PortfolioService:
+    """Service for portfolio operations.
+
+    Args:
+        client: Authenticated Robinhood client.
+        instrument_cache: Shared instrument URL cache.  A private
+            in-memory cache is used when omitted.
+        lookup_workers: Maximum number of instrument lookups run
+            concurrently for instruments the bulk lookup did not return.
+        quote_cache: Shared quote cache.  A private one is used when
+            omitted.
+        options_service: Options service whose ``get_option_positions``
+            ``get_snapshot`` uses.  One sharing ``quote_cache`` is created
+            when omitted.
+    """
+
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        instrument_cache: Optional[InstrumentCache] = None,
+        lookup_workers: int = DEFAULT_LOOKUP_WORKERS,
+        quote_cache: Optional[QuoteCache] = None,
+        options_service: Optional[OptionsService] = None,
+    ):
         self.client = client
+        self.instrument_cache = instrument_cache or InstrumentCache()
+        self.lookup_workers = max(1, lookup_workers)
+        self.quote_cache = quote_cache or QuoteCache()
+        self.options_service = options_service or OptionsService(
+            client, quote_cache=self.quote_cache
+        )
 
     def get_portfolio_summary(self) -> PortfolioSummary:
         """Get portfolio summary."""
@@ -25,23 +57,7 @@ class PortfolioService:
             portfolio = rh.load_portfolio_profile()
             account = rh.load_account_profile()
 
-            equity = portfolio.get("equity")
-            equity_previous_close = portfolio.get("equity_previous_close")
-
-            day_change = None
-            if equity is not None and equity_previous_close is not None:
-                try:
-                    day_change = float(equity) - float(equity_previous_close)
-                except (ValueError, TypeError):
-                    day_change = None
-
-            return PortfolioSummary(
-                equity=equity,
-                cash=account.get("cash"),
-                buying_power=account.get("buying_power"),
-                day_change=day_change,
-                unrealized_pl=day_change,
-            )
+            return self._build_summary(portfolio, account)
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
@@ -54,64 +70,136 @@ class PortfolioService:
         self.client.ensure_session()
 
         try:
-            positions_data = rh.get_open_stock_positions()
-
-            # First pass: resolve symbols from instrument URLs
-            resolved = []
-            for item in positions_data:
-                instrument = rh.get_instrument_by_url(item.get("instrument"))
-                symbol = instrument.get("symbol") if instrument else None
-
-                if symbols and symbol not in symbols:
-                    continue
-
-                resolved.append((symbol or "UNKNOWN", item))
-
-            # Batch-fetch current quotes for all position symbols
-            known_symbols = [s for s, _ in resolved if s != "UNKNOWN"]
-            quotes_map: dict = {}
-            if known_symbols:
-                quotes = rh.get_quotes(known_symbols)
-                if quotes:
-                    for q in quotes:
-                        if q and q.get("symbol"):
-                            quotes_map[q["symbol"]] = q
-
-            # Build position objects with computed market_value / unrealized_pl
-            positions = []
-            for symbol, item in resolved:
-                quantity = item.get("quantity")
-                avg_buy_price = item.get("average_buy_price")
-
-                market_value = None
-                unrealized_pl = None
-
-                quote = quotes_map.get(symbol)
-                if quote and quantity is not None:
-                    try:
-                        current_price = float(quote.get("last_trade_price", 0))
-                        qty = float(quantity)
-                        market_value = qty * current_price
-
-                        if avg_buy_price is not None:
-                            cost_basis = qty * float(avg_buy_price)
-                            unrealized_pl = market_value - cost_basis
-                    except (ValueError, TypeError):
-                        pass
-
-                position = Position(
-                    symbol=symbol,
-                    quantity=quantity,
-                    average_cost=avg_buy_price,
-                    market_value=market_value,
-                    unrealized_pl=unrealized_pl,
-                )
-                positions.append(position)
-
-            return positions
+            return self._load_positions(symbols)
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
             raise RobinhoodAPIError(f"Failed to fetch positions: {e}") from e
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch positions: {e}") from e
+
+    def get_snapshot(self) -> PortfolioSnapshot:
+        """Get the summary, stock positions and option positions together.
+
+        Establishes the session first, then fetches the portfolio profile,
+        the account profile, the stock positions and the option positions
+        concurrently.  Stock positions are priced with a single quote
+        batch.
+        """
+        self.client.ensure_session()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="rh-snapshot"
+            ) as pool:
+                portfolio = pool.submit(rh.load_portfolio_profile)
+                account = pool.submit(rh.load_account_profile)
+                positions = pool.submit(self._load_positions)
+                option_positions = pool.submit(
+                    self.options_service.get_option_positions
+                )
+                return PortfolioSnapshot(
+                    summary=self._build_summary(portfolio.result(), account.result()),
+                    positions=positions.result(),
+                    option_positions=option_positions.result(),
+                )
+        except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
+            raise
+        except (requests.RequestException, ConnectionError, TimeoutError) as e:
+            raise RobinhoodAPIError(f"Failed to fetch portfolio snapshot: {e}") from e
+        except Exception as e:
+            raise RobinhoodAPIError(f"Failed to fetch portfolio snapshot: {e}") from e
+
+    def _load_positions(self, symbols: Optional[List[str]] = None) -> List[Position]:
+        positions_data = rh.get_open_stock_positions()
+
+        # First pass: resolve symbols from instrument URLs.  Cache misses
+        # are fetched in bulk, then any stragglers concurrently; map()
+        # keeps results in position order.
+        urls = [item.get("instrument") for item in positions_data]
+        self.instrument_cache.prefetch(urls)
+        position_symbols = self._resolve_symbols(urls)
+
+        resolved = []
+        for item, symbol in zip(positions_data, position_symbols):
+            if symbols and symbol not in symbols:
+                continue
+
+            resolved.append((symbol or "UNKNOWN", item))
+
+        # Batch-fetch current quotes for all position symbols
+        known_symbols = [s for s, _ in resolved if s != "UNKNOWN"]
+        quotes_map: dict = {}
+        if known_symbols:
+            quotes_map = self.quote_cache.get_quotes(known_symbols, rh.get_quotes)
+
+        return [
+            self._build_position(symbol, item, quotes_map.get(symbol))
+            for symbol, item in resolved
+        ]
+
+    @staticmethod
+    def _build_summary(portfolio: dict, account: dict) -> PortfolioSummary:
+        equity = portfolio.get("equity")
+        equity_previous_close = portfolio.get("equity_previous_close")
+
+        day_change = None
+        if equity is not None and equity_previous_close is not None:
+            try:
+                day_change = float(equity) - float(equity_previous_close)
+            except (ValueError, TypeError):
+                day_change = None
+
+        return PortfolioSummary(
+            equity=equity,
+            cash=account.get("cash"),
+            buying_power=account.get("buying_power"),
+            day_change=day_change,
+            unrealized_pl=day_change,
+        )
+
+    @staticmethod
+    def _build_position(
+        symbol: str, item: dict, quote: Optional[dict]
+    ) -> Position:
+        """Build a Position with market_value / unrealized_pl from ``quote``."""
+        quantity = item.get("quantity")
+        avg_buy_price = item.get("average_buy_price")
+
+        market_value = None
+        unrealized_pl = None
+
+        if quote and quantity is not None:
+            try:
+                current_price = float(quote.get("last_trade_price", 0))
+                qty = float(quantity)
+                market_value = qty * current_price
+
+                if avg_buy_price is not None:
+                    cost_basis = qty * float(avg_buy_price)
+                    unrealized_pl = market_value - cost_basis
+            except (ValueError, TypeError):
+                pass
+
+        return Position(
+            symbol=symbol,
+            quantity=quantity,
+            average_cost=avg_buy_price,
+            market_value=market_value,
+            unrealized_pl=unrealized_pl,
+        )
+
+    def _resolve_symbols(self, urls: List[Optional[str]]) -> List[Optional[str]]:
+        """Resolve instrument URLs to symbols, preserving input order."""
+
+        def resolve(url: Optional[str]) -> Optional[str]:
+            return self.instrument_cache.symbol_for(url, rh.get_instrument_by_url)
+
+        if len(urls) <= 1 or self.lookup_workers == 1:
+            return [resolve(url) for url in urls]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.lookup_workers, len(urls)),
+            thread_name_prefix="rh-instruments",
+        ) as pool:
+            return list(pool.map(resolve, urls))
@@ -1,8 +1,9 @@
 # robin_stocks_mcp/services/watchlists.py
-from typing import List
+from typing import List, Optional
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import Watchlist
+from robinhood_core.cache import InstrumentCache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -14,8 +15,13 @@ from robinhood_core.errors import (
 class WatchlistsService:
     """Service for watchlist operations."""
 
-    def __init__(self, client: RobinhoodClient):
+    def __init__(
+        self,
+        client: RobinhoodClient,
+        instrument_cache: Optional[InstrumentCache] = None,
+    ):
         self.client = client
+        self.instrument_cache = instrument_cache or InstrumentCache()
 
     def get_watchlists(self) -> List[Watchlist]:
         """Get all watchlists with their symbols."""
@@ -59,18 +65,21 @@ class WatchlistsService:
         """Fetch symbols for a watchlist by name."""
         try:
             items = rh.get_watchlist_by_name(name=name)
+            if isinstance(items, dict):
+                # robin_stocks returns the raw page for list items.
+                items = items.get("results")
             if not items or not isinstance(items, list):
                 return []
 
+            entries = [entry for entry in items if isinstance(entry, dict)]
+            self.instrument_cache.prefetch(entry.get("instrument") for entry in entries)
             symbols = []
-            for entry in items:
-                if not isinstance(entry, dict):
-                    continue
-                instrument_url = entry.get("instrument")
-                if instrument_url:
-                    symbol = rh.get_symbol_by_url(instrument_url)
-                    if symbol:
-                        symbols.append(symbol)
+            for entry in entries:
+                symbol = self.instrument_cache.symbol_for(
+                    entry.get("instrument"), rh.get_instrument_by_url
+                )
+                if symbol:
+                    symbols.append(symbol)
             return symbols
         except Exception:
             return []
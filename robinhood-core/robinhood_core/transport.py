@@ -0,0 +1,126 @@
+# robinhood_core/transport.py
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from robin_stocks.robinhood import globals as rh_globals
+
+from robinhood_core.policy import RETRY_STATUSES, CallPolicy, CircuitOpenError
+from robinhood_core.ratelimit import RateLimiter, endpoint_family
+
+logger = logging.getLogger(__name__)
+
+
+class RobinhoodAdapter(HTTPAdapter):
+    """HTTPAdapter mounted on the robin_stocks session.
+
+    robin_stocks sends every request through one global
+    ``requests.Session``, so mounting this adapter there applies to all
+    service calls without touching robin_stocks itself.
+
+    With a ``rate_limiter`` each request waits for its endpoint family's
+    budget, and a throttled (429) GET is retried up to
+    ``max_throttle_retries`` times once the limiter's pause has elapsed.
+    With a ``policy`` requests get per-endpoint timeouts, jittered retries
+    for reads, and a circuit breaker (see ``CallPolicy``).
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        policy: Optional[CallPolicy] = None,
+        max_throttle_retries: int = 2,
+        **kwargs,
+    ):
+        self.rate_limiter = rate_limiter
+        self.policy = policy
+        self.max_throttle_retries = max_throttle_retries
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs) -> requests.Response:
+        policy = self.policy
+        breaker = policy.breaker(request.url) if policy is not None else None
+        if policy is not None and kwargs.get("timeout") is None:
+            kwargs["timeout"] = policy.timeout(request.url)
+
+        # The breaker sees each logical request once: it is consulted before
+        # the first attempt and told the outcome after the last retry.
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(
+                f"Robinhood {endpoint_family(request.url)} requests are "
+                "failing; not retrying until the circuit resets",
+                request=request,
+            )
+
+        attempt = 0
+        throttled = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(request.url)
+
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if policy is None or not policy.should_retry(request.method, attempt):
+                    if breaker is not None:
+                        breaker.record_failure()
+                    raise
+                attempt += 1
+                logger.debug("Retrying failed request (attempt %d)", attempt)
+                policy.sleep(policy.delay(attempt))
+                continue
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.observe(
+                    request.url,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+
+            if policy is not None and response.status_code in RETRY_STATUSES:
+                if not policy.should_retry(request.method, attempt):
+                    breaker.record_failure()
+                    return response
+                attempt += 1
+                logger.debug(
+                    "Retrying HTTP %d response (attempt %d)",
+                    response.status_code,
+                    attempt,
+                )
+                response.close()
+                policy.sleep(policy.delay(attempt))
+                continue
+
+            if breaker is not None:
+                breaker.record_success()
+            if (
+                self.rate_limiter is None
+                or response.status_code != 429
+                or request.method != "GET"
+                or throttled >= self.max_throttle_retries
+            ):
+                return response
+            throttled += 1
+            logger.debug("Retrying throttled request (attempt %d)", throttled)
+            response.close()
+
+
+def install_adapter(
+    adapter: HTTPAdapter,
+    session: Optional[requests.Session] = None,
+    keep_alive: bool = True,
+    gzip: bool = True,
+) -> HTTPAdapter:
+    """Mount ``adapter`` for HTTPS on the robin_stocks session.
+
+    Also sets the session's ``Connection`` header from ``keep_alive`` and
+    its ``Accept-Encoding`` header from ``gzip``.  robin_stocks advertises
+    ``br`` by default, which requests can only decode when brotli is
+    installed, so compression is limited to gzip/deflate.
+    """
+    session = session if session is not None else rh_globals.SESSION
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+    session.headers["Accept-Encoding"] = "gzip, deflate" if gzip else "identity"
+    session.mount("https://", adapter)
+    return adapter
@@ -0,0 +1,17 @@
+# tests/unit/conftest.py
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_rh():
+    """Patch the robin_stocks module used by the caches' bulk lookups.
+
+    Services patch their own ``rh``; this keeps ``InstrumentCache.prefetch``
+    off the network too.  Bulk lookups return nothing unless a test sets
+    ``cache_rh.request_get``, so rows fall back to per-URL resolution.
+    """
+    with patch("robinhood_core.cache.rh") as mock_rh:
+        mock_rh.request_get.return_value = None
+        yield mock_rh
@@ -0,0 +1,621 @@
+# tests/unit/test_aio.py
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from robinhood_core.aio import (
+    AsyncFundamentalsService,
+    AsyncMarketDataService,
+    AsyncNewsService,
+    AsyncOptionsService,
+    AsyncOrdersService,
+    AsyncPortfolioService,
+    AsyncRobinhoodHTTP,
+    AsyncWatchlistsService,
+)
+from robinhood_core.cache import InstrumentCache, QuoteCache
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.errors import InvalidArgumentError, RobinhoodAPIError
+from robinhood_core.policy import CallPolicy
+from robinhood_core.ratelimit import RateLimiter
+
+API = "https://api.robinhood.com"
+
+
+def make_client(authenticated=True, rate_limiter=None, call_policy=None):
+    client = MagicMock(spec=RobinhoodClient)
+    client.authenticated = authenticated
+    client.rate_limiter = rate_limiter
+    client.call_policy = call_policy
+    return client
+
+
+def make_http(routes, client=None, requests=None):
+    """Serve JSON bodies from ``routes``: {path: body or callable(request)}."""
+
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        route = routes.get(request.url.path)
+        if route is None:
+            return httpx.Response(404, json={"detail": "Not found"})
+        if callable(route):
+            return route(request)
+        return httpx.Response(200, json=route)
+
+    async def no_sleep(seconds):
+        pass
+
+    return AsyncRobinhoodHTTP(
+        client or make_client(),
+        transport=httpx.MockTransport(handler),
+        sleep=no_sleep,
+    )
+
+
+def page(results, next_url=None):
+    return {"results": results, "next": next_url}
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_robin_stocks_headers():
+    seen = []
+    http = make_http({"/quotes/": page([])}, requests=seen)
+    with patch.dict(
+        "robin_stocks.robinhood.globals.SESSION.headers",
+        {"Authorization": "Bearer token-123"},
+    ):
+        await http.results(f"{API}/quotes/", {"symbols": "AAPL"})
+    await http.aclose()
+
+    assert seen[0].headers["Authorization"] == "Bearer token-123"
+    assert seen[0].url.params["symbols"] == "AAPL"
+
+
+@pytest.mark.asyncio
+async def test_ensure_session_logs_in_only_when_needed():
+    client = make_client(authenticated=False)
+    http = make_http({}, client=client)
+    await http.ensure_session()
+    client.ensure_session.assert_called_once()
+
+    client = make_client(authenticated=True)
+    http = make_http({}, client=client)
+    await http.ensure_session()
+    client.ensure_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_paginate_follows_next_links():
+    routes = {
+        "/positions/": lambda request: httpx.Response(
+            200,
+            json=page([{"id": "2"}])
+            if request.url.params.get("cursor")
+            else page([{"id": "1"}], f"{API}/positions/?cursor=abc"),
+        )
+    }
+    http = make_http(routes)
+    items = await http.paginate(f"{API}/positions/", {"nonzero": "true"})
+    assert [item["id"] for item in items] == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_raises_on_a_malformed_page():
+    routes = {
+        "/positions/": lambda request: httpx.Response(
+            200,
+            json=["not", "a", "page"]
+            if request.url.params.get("cursor")
+            else page([{"id": "1"}], f"{API}/positions/?cursor=abc"),
+        )
+    }
+    http = make_http(routes)
+    with pytest.raises(RobinhoodAPIError, match="cursor=abc"):
+        await http.paginate(f"{API}/positions/")
+
+
+@pytest.mark.asyncio
+async def test_instrument_cache_runs_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads = []
+
+    class RecordingCache(InstrumentCache):
+        def get(self, key):
+            threads.append(threading.get_ident())
+            return super().get(key)
+
+        def put(self, key, value):
+            threads.append(threading.get_ident())
+            super().put(key, value)
+
+    http = make_http(
+        {"/instruments/abc/": {"url": f"{API}/instruments/abc/", "symbol": "AAPL"}}
+    )
+    cache = RecordingCache()
+    symbol = await http.symbol_for(cache, f"{API}/instruments/abc/")
+
+    assert symbol == "AAPL"
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_policy_retries_server_errors():
+    calls = []
+
+    def flaky(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json=page([{"symbol": "AAPL"}]))
+
+    client = make_client(call_policy=CallPolicy(jitter=lambda a, b: 0.0))
+    http = make_http({"/quotes/": flaky}, client=client)
+    assert await http.results(f"{API}/quotes/") == [{"symbol": "AAPL"}]
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_policy_records_one_failure_per_call():
+    policy = CallPolicy(retries=2, failure_threshold=2, reset_timeout=60)
+    calls = []
+
+    def failing(request):
+        calls.append(request)
+        return httpx.Response(503, json={})
+
+    http = make_http({"/quotes/": failing}, client=make_client(call_policy=policy))
+    with pytest.raises(httpx.HTTPStatusError):
+        await http.get(f"{API}/quotes/")
+
+    assert len(calls) == 3
+    assert policy.breaker(f"{API}/quotes/").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_throttled_request_is_retried_and_slows_the_bucket():
+    calls = []
+
+    def throttled(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=page([]))
+
+    limiter = RateLimiter()
+    client = make_client(rate_limiter=limiter)
+    http = make_http({"/quotes/": throttled}, client=client)
+    await http.results(f"{API}/quotes/")
+
+    assert len(calls) == 2
+    assert limiter.rates()["quotes"] < 5.0
+
+
+@pytest.mark.asyncio
+async def test_http_errors_become_robinhood_api_errors():
+    http = make_http({"/fundamentals/": lambda request: httpx.Response(500)})
+    service = AsyncFundamentalsService(http)
+    with pytest.raises(RobinhoodAPIError, match="Failed to fetch fundamentals"):
+        await service.get_fundamentals("AAPL")
+
+
+@pytest.mark.asyncio
+async def test_get_current_price_uses_quote_cache():
+    seen = []
+    quote = {
+        "symbol": "AAPL",
+        "last_trade_price": "110.00",
+        "previous_close": "100.00",
+        "bid_price": "109.90",
+        "ask_price": "110.10",
+        "updated_at": "2026-01-05T15:00:00Z",
+    }
+    http = make_http({"/quotes/": page([quote])}, requests=seen)
+    service = AsyncMarketDataService(http, quote_cache=QuoteCache(ttl=60))
+
+    first = await service.get_current_price(["aapl"])
+    second = await service.get_current_price(["AAPL"])
+
+    assert first == second
+    assert first[0].last_price == 110.0
+    assert first[0].change_percent == pytest.approx(10.0)
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_price_requires_symbols():
+    service = AsyncMarketDataService(make_http({}))
+    with pytest.raises(InvalidArgumentError):
+        await service.get_current_price([])
+
+
+@pytest.mark.asyncio
+async def test_get_price_history_flattens_historicals():
+    bar = {
+        "begins_at": "2026-01-05T14:30:00Z",
+        "open_price": "100",
+        "high_price": "101",
+        "low_price": "99",
+        "close_price": "100.5",
+        "volume": 1000,
+    }
+    seen = []
+    http = make_http(
+        {"/quotes/historicals/": page([{"symbol": "AAPL", "historicals": [bar]}])},
+        requests=seen,
+    )
+    candles = await AsyncMarketDataService(http).get_price_history(
+        "aapl", interval="day", span="month"
+    )
+
+    assert len(candles) == 1
+    assert candles[0].close == 100.5
+    assert seen[0].url.params["span"] == "month"
+    assert seen[0].url.params["symbols"] == "AAPL"
+
+
+@pytest.mark.asyncio
+async def test_get_price_history_validates_arguments():
+    service = AsyncMarketDataService(make_http({}))
+    with pytest.raises(InvalidArgumentError, match="Invalid interval"):
+        await service.get_price_history("AAPL", interval="minute")
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary():
+    http = make_http(
+        {
+            "/portfolios/": page(
+                [{"equity": "10000.50", "equity_previous_close": "9975.00"}]
+            ),
+            "/accounts/": page([{"cash": "2500.00", "buying_power": "12500.00"}]),
+        }
+    )
+    summary = await AsyncPortfolioService(http).get_portfolio_summary()
+
+    assert summary.equity == 10000.50
+    assert summary.cash == 2500.00
+    assert summary.day_change == pytest.approx(25.50)
+
+
+@pytest.mark.asyncio
+async def test_positions_resolve_symbols_and_prices():
+    http = make_http(
+        {
+            "/positions/": page(
+                [
+                    {
+                        "instrument": f"{API}/instruments/aapl-id/",
+                        "quantity": "10",
+                        "average_buy_price": "100",
+                    },
+                    {
+                        "instrument": f"{API}/instruments/msft-id/",
+                        "quantity": "5",
+                        "average_buy_price": "200",
+                    },
+                ]
+            ),
+            "/instruments/aapl-id/": {"id": "aapl-id", "symbol": "AAPL"},
+            "/instruments/msft-id/": {"id": "msft-id", "symbol": "MSFT"},
+            "/quotes/": page([{"symbol": "AAPL", "last_trade_price": "110"}]),
+        }
+    )
+    positions = await AsyncPortfolioService(http).get_positions(symbols=["AAPL"])
+
+    assert [p.symbol for p in positions] == ["AAPL"]
+    assert positions[0].market_value == pytest.approx(1100.0)
+    assert positions[0].unrealized_pl == pytest.approx(100.0)
+
+
+CHAIN_ROUTES = {
+    "/instruments/": page([{"symbol": "AAPL", "tradable_chain_id": "chain-1"}]),
+    "/options/chains/chain-1/": {"expiration_dates": ["2026-01-16", "2026-01-23"]},
+    "/quotes/": page([{"symbol": "AAPL", "last_trade_price": "100"}]),
+}
+
+
+def option(option_id, strike, option_type="call"):
+    return {
+        "id": option_id,
+        "chain_symbol": "AAPL",
+        "expiration_date": "2026-01-16",
+        "strike_price": strike,
+        "type": option_type,
+    }
+
+
+@pytest.mark.asyncio
+async def test_chain_listing_filters_near_the_money():
+    seen = []
+    routes = {
+        **CHAIN_ROUTES,
+        "/options/instruments/": page(
+            [option("a", "50.00"), option("b", "100.00"), option("c", "115.00")]
+        ),
+    }
+    http = make_http(routes, requests=seen)
+    contracts = await AsyncOptionsService(http).get_options_chain("aapl")
+
+    assert [c.strike for c in contracts] == [100.0, 115.0]
+    instruments_request = next(r for r in seen if r.url.path == "/options/instruments/")
+    assert instruments_request.url.params["chain_id"] == "chain-1"
+    assert instruments_request.url.params["expiration_dates"] == "2026-01-16"
+
+
+@pytest.mark.asyncio
+async def test_chain_listing_with_market_data():
+    seen = []
+    routes = {
+        **CHAIN_ROUTES,
+        "/options/instruments/": page([option("a", "50.00"), option("b", "100.00")]),
+        "/marketdata/options/": page(
+            [{"instrument_id": "b", "bid_price": "1.00", "delta": "0.5"}]
+        ),
+    }
+    http = make_http(routes, requests=seen)
+    contracts = await AsyncOptionsService(http).get_options_chain(
+        "AAPL", with_market_data=True
+    )
+
+    assert [(c.strike, c.bid, c.delta) for c in contracts] == [(100.0, 1.0, 0.5)]
+    market_data_request = next(r for r in seen if r.url.path == "/marketdata/options/")
+    assert market_data_request.url.params["ids"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_targeted_lookup_merges_market_data():
+    routes = {
+        **CHAIN_ROUTES,
+        "/options/instruments/": page(
+            [option("p", "100.00", "put"), option("c", "100.00", "call")]
+        ),
+        "/marketdata/options/": page(
+            [
+                {"instrument_id": "c", "bid_price": "1.00", "delta": "0.5"},
+                {"instrument_id": "p", "bid_price": "2.00", "delta": "-0.5"},
+            ]
+        ),
+    }
+    http = make_http(routes)
+    contracts = await AsyncOptionsService(http).get_options_chain(
+        "AAPL", expiration_date="2026-01-16", strike_price="100"
+    )
+
+    assert [c.type for c in contracts] == ["call", "put"]
+    assert contracts[0].bid == 1.0
+    assert contracts[1].delta == -0.5
+
+
+@pytest.mark.asyncio
+async def test_option_positions_resolve_instruments():
+    http = make_http(
+        {
+            "/options/positions/": page(
+                [
+                    {
+                        "option": f"{API}/options/instruments/opt-1/",
+                        "chain_symbol": "AAPL",
+                        "type": "long",
+                        "quantity": "1",
+                        "average_price": "150",
+                    }
+                ]
+            ),
+            "/options/instruments/opt-1/": option("opt-1", "100.00"),
+        }
+    )
+    positions = await AsyncOptionsService(http).get_option_positions()
+
+    assert positions[0].symbol == "AAPL"
+    assert positions[0].strike_price == 100.0
+    assert positions[0].option_type == "call"
+    assert positions[0].direction == "long"
+
+
+@pytest.mark.asyncio
+async def test_order_history_filters_and_reports_partial_failures():
+    aapl_url = f"{API}/instruments/aapl-id/"
+
+    def orders(request):
+        # Stock and crypto orders share the path; crypto lives on nummus.
+        if request.url.host == "nummus.robinhood.com":
+            return httpx.Response(500)
+        assert request.url.params["instrument"] == aapl_url
+        return httpx.Response(200, json=page([{"id": "o1", "instrument": aapl_url}]))
+
+    http = make_http(
+        {
+            "/orders/": orders,
+            "/instruments/": page(
+                [{"id": "aapl-id", "symbol": "AAPL", "url": aapl_url}]
+            ),
+            "/options/orders/": page(
+                [
+                    {"id": "x1", "chain_symbol": "AAPL"},
+                    {"id": "x2", "chain_symbol": "MSFT"},
+                ]
+            ),
+        }
+    )
+    history = await AsyncOrdersService(http).get_order_history(symbol="AAPL")
+
+    assert [o.id for o in history.stock_orders] == ["o1"]
+    assert history.stock_orders[0].symbol == "AAPL"
+    assert [o.id for o in history.option_orders] == ["x1"]
+    assert "crypto" in history.errors
+
+
+@pytest.mark.asyncio
+async def test_order_history_rejects_unknown_type():
+    with pytest.raises(InvalidArgumentError):
+        await AsyncOrdersService(make_http({})).get_order_history(order_type="bond")
+
+
+@pytest.mark.asyncio
+async def test_start_date_is_sent_as_updated_at_filter():
+    seen = []
+    http = make_http({"/orders/": page([])}, requests=seen)
+    await AsyncOrdersService(http).get_order_history(
+        order_type="stock", start_date="2026-01-01"
+    )
+    assert seen[0].url.params["updated_at[gte]"] == "2026-01-01"
+
+
+@pytest.mark.asyncio
+async def test_crypto_orders_cut_off_at_start_date_and_labelled():
+    def orders(request):
+        return httpx.Response(
+            200,
+            json=page(
+                [
+                    {"id": "c2", "currency_pair_id": "btc", "created_at": "2026-01-20"},
+                    {"id": "c1", "currency_pair_id": "btc", "created_at": "2026-01-05"},
+                ],
+                f"{API}/orders/?cursor=older",
+            ),
+        )
+
+    http = make_http(
+        {
+            "/orders/": orders,
+            "/currency_pairs/": page([{"id": "btc", "symbol": "BTC-USD"}]),
+        }
+    )
+    history = await AsyncOrdersService(http).get_order_history(
+        order_type="crypto", start_date="2026-01-10"
+    )
+
+    assert [(o.id, o.symbol) for o in history.crypto_orders] == [("c2", "BTC-USD")]
+
+
+@pytest.mark.asyncio
+async def test_order_history_limit_stops_paging():
+    seen = []
+
+    def option_orders(request):
+        page_no = int(request.url.params.get("page", "0"))
+        return httpx.Response(
+            200,
+            json=page(
+                [{"id": f"x{page_no}-{i}", "chain_symbol": "AAPL"} for i in range(2)],
+                f"{API}/options/orders/?page={page_no + 1}",
+            ),
+        )
+
+    http = make_http({"/options/orders/": option_orders}, requests=seen)
+    history = await AsyncOrdersService(http).get_order_history(
+        order_type="option", limit=3
+    )
+
+    assert [o.id for o in history.option_orders] == ["x0-0", "x0-1", "x1-0"]
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_order_history_cursor_resumes_from_robinhood_page():
+    seen = []
+
+    def option_orders(request):
+        page_no = int(request.url.params.get("page", "0"))
+        return httpx.Response(
+            200,
+            json=page(
+                [{"id": f"x{page_no}-{i}", "chain_symbol": "AAPL"} for i in range(2)],
+                f"{API}/options/orders/?page={page_no + 1}" if page_no < 3 else None,
+            ),
+        )
+
+    http = make_http({"/options/orders/": option_orders}, requests=seen)
+    service = AsyncOrdersService(http)
+    first = await service.get_order_history(order_type="option", limit=5)
+    seen.clear()
+    second = await service.get_order_history(
+        order_type="option", limit=5, cursor=first.next_cursor
+    )
+
+    assert [o.id for o in second.option_orders] == ["x2-1", "x3-0", "x3-1"]
+    assert [r.url.params.get("page") for r in seen] == ["2", "3"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_watchlists_with_symbols():
+    def items(request):
+        assert request.url.params["list_id"] == "wl-1"
+        return httpx.Response(
+            200, json=page([{"instrument": f"{API}/instruments/aapl-id/"}])
+        )
+
+    http = make_http(
+        {
+            "/midlands/lists/default/": page([{"id": "wl-1", "display_name": "Tech"}]),
+            "/midlands/lists/items/": items,
+            "/instruments/aapl-id/": {"id": "aapl-id", "symbol": "AAPL"},
+        }
+    )
+    watchlists = await AsyncWatchlistsService(http).get_watchlists()
+
+    assert watchlists[0].name == "Tech"
+    assert watchlists[0].symbols == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_news_and_fundamentals():
+    http = make_http(
+        {
+            "/midlands/news/AAPL/": page(
+                [
+                    {
+                        "uuid": "n1",
+                        "title": "Headline",
+                        "url": "https://x",
+                        "published_at": "2026-01-05T15:00:00Z",
+                    }
+                ]
+            ),
+            "/fundamentals/": page([{"market_cap": "1000", "pe_ratio": "25"}]),
+        }
+    )
+    news = await AsyncNewsService(http).get_news("aapl")
+    fundamentals = await AsyncFundamentalsService(http).get_fundamentals("AAPL")
+
+    assert news[0].headline == "Headline"
+    assert fundamentals.market_cap == 1000.0
+    assert fundamentals.pe_ratio == 25.0
+
+
+@pytest.mark.asyncio
+async def test_positions_resolve_instruments_in_bulk():
+    seen = []
+
+    def instruments(request):
+        ids = request.url.params["ids"].split(",")
+        return httpx.Response(
+            200, json=page([{"id": i, "symbol": i.upper()} for i in ids])
+        )
+
+    http = make_http(
+        {
+            "/positions/": page(
+                [
+                    {
+                        "instrument": f"{API}/instruments/id-{i}/",
+                        "quantity": "1",
+                        "average_buy_price": "10",
+                    }
+                    for i in range(3)
+                ]
+            ),
+            "/instruments/": instruments,
+            "/quotes/": page([]),
+        },
+        requests=seen,
+    )
+    positions = await AsyncPortfolioService(http).get_positions()
+
+    assert [p.symbol for p in positions] == ["ID-0", "ID-1", "ID-2"]
+    assert [r.url.path for r in seen].count("/instruments/") == 1
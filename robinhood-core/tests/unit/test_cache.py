@@ -0,0 +1,529 @@
+# tests/unit/test_cache.py
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from robinhood_core.cache import (
+    CryptoPairTable,
+    InstrumentCache,
+    OptionInstrumentCache,
+    QuoteBatcher,
+    QuoteCache,
+    market_is_active,
+)
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.services.market_data import MarketDataService
+from robinhood_core.services.options import OptionsService
+from robinhood_core.services.orders import OrdersService
+from robinhood_core.services.portfolio import PortfolioService
+
+URL = "https://api.robinhood.com/instruments/abc/"
+INSTRUMENT = {"id": "abc", "symbol": "AAPL", "name": "Apple Inc."}
+
+
+def test_resolve_fetches_once_and_counts_hits():
+    cache = InstrumentCache()
+    fetch = MagicMock(return_value=INSTRUMENT)
+
+    assert cache.resolve(URL, fetch) == INSTRUMENT
+    assert cache.resolve(URL, fetch) == INSTRUMENT
+
+    fetch.assert_called_once_with(URL)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_symbol_for_handles_missing_url_and_failed_fetch():
+    cache = InstrumentCache()
+    fetch = MagicMock(return_value=None)
+
+    assert cache.symbol_for(None, fetch) is None
+    assert cache.symbol_for(URL, fetch) is None
+    # Failed lookups are not cached
+    assert cache.symbol_for(URL, fetch) is None
+    assert fetch.call_count == 2
+
+
+def test_lru_is_bounded():
+    cache = InstrumentCache(max_entries=2)
+    for i in range(3):
+        cache.put(f"url-{i}", {"symbol": f"S{i}"})
+
+    assert cache.stats()["memory_entries"] == 2
+    # Evicted from memory but still served from SQLite
+    assert cache.get("url-0") == {"symbol": "S0"}
+
+
+def test_persists_across_instances(tmp_path):
+    first = InstrumentCache.open(tmp_path)
+    first.resolve(URL, MagicMock(return_value=INSTRUMENT))
+    first.close()
+
+    second = InstrumentCache.open(tmp_path)
+    fetch = MagicMock()
+    assert second.symbol_for(URL, fetch) == "AAPL"
+    fetch.assert_not_called()
+
+
+def test_open_does_not_touch_disk_until_used(tmp_path):
+    InstrumentCache.open(tmp_path / "nested")
+    assert not (tmp_path / "nested").exists()
+
+
+def test_warm_order_history_makes_no_instrument_lookups():
+    cache = InstrumentCache()
+    service = OrdersService(MagicMock(spec=RobinhoodClient), instrument_cache=cache)
+    order = {"id": "o1", "instrument": URL, "state": "filled"}
+
+    with patch("robinhood_core.services.orders.rh") as mock_rh:
+        mock_rh.urls.orders_url.return_value = "orders"
+        mock_rh.request_get.side_effect = lambda url, data_type, payload=None: (
+            {"results": [order, order], "next": None} if url == "orders" else None
+        )
+        mock_rh.get_instrument_by_url.return_value = INSTRUMENT
+
+        service.get_order_history(order_type="stock")
+        service.get_order_history(order_type="stock")
+
+        mock_rh.get_instrument_by_url.assert_called_once_with(URL)
+
+
+def instrument_url(i):
+    return f"https://api.robinhood.com/instruments/id-{i}/"
+
+
+def test_prefetch_resolves_uncached_ids_in_chunks():
+    cache = InstrumentCache()
+    cache.put(instrument_url(0), {"id": "id-0", "symbol": "S0"})
+    fetch_by_ids = MagicMock(
+        side_effect=lambda ids: [{"id": i, "symbol": i.upper()} for i in ids]
+    )
+
+    urls = [instrument_url(i) for i in range(5)] + [instrument_url(1), None]
+    assert cache.prefetch(urls, fetch_by_ids, chunk_size=2) == 4
+
+    assert fetch_by_ids.call_args_list == [
+        ((["id-1", "id-2"],),),
+        ((["id-3", "id-4"],),),
+    ]
+    fetch = MagicMock()
+    assert cache.symbol_for(instrument_url(4), fetch) == "ID-4"
+    fetch.assert_not_called()
+
+
+def test_prefetch_leaves_missing_instruments_to_symbol_for():
+    cache = InstrumentCache()
+    fetch_by_ids = MagicMock(return_value=[None])
+
+    assert cache.prefetch([URL], fetch_by_ids) == 0
+
+    fetch = MagicMock(return_value=INSTRUMENT)
+    assert cache.symbol_for(URL, fetch) == "AAPL"
+    fetch.assert_called_once_with(URL)
+
+
+def test_prefetch_survives_failed_bulk_request():
+    cache = InstrumentCache()
+    fetch_by_ids = MagicMock(side_effect=Exception("boom"))
+
+    assert cache.prefetch([URL], fetch_by_ids) == 0
+    assert cache.stats()["misses"] == 0
+
+
+def test_prefetch_defaults_to_the_instruments_endpoint(cache_rh):
+    cache = InstrumentCache()
+    cache_rh.request_get.return_value = [{"id": "abc", "symbol": "AAPL"}]
+
+    assert cache.prefetch([URL]) == 1
+    assert cache_rh.request_get.call_args[0][1:] == ("results", {"ids": "abc"})
+    assert cache.symbol_for(URL, MagicMock()) == "AAPL"
+
+
+def test_store_writes_a_chunk_in_one_transaction(tmp_path):
+    cache = InstrumentCache.open(tmp_path)
+    pending = {f"id-{i}": instrument_url(i) for i in range(3)}
+    commits = []
+    cache._conn().set_trace_callback(
+        lambda sql: commits.append(sql) if sql == "COMMIT" else None
+    )
+
+    stored = cache.store(pending, [{"id": i, "symbol": i} for i in pending])
+
+    assert stored == 3
+    assert len(commits) == 1
+    cache.close()
+    assert InstrumentCache.open(tmp_path).get(instrument_url(2))["symbol"] == "id-2"
+
+
+def test_order_history_resolves_instruments_in_bulk(cache_rh):
+    service = OrdersService(MagicMock(spec=RobinhoodClient))
+    orders = [
+        {"id": f"o{i}", "instrument": instrument_url(i % 3), "state": "filled"}
+        for i in range(9)
+    ]
+    cache_rh.request_get.side_effect = lambda url, data_type, payload: [
+        {"id": i, "symbol": f"SYM-{i}"} for i in payload["ids"].split(",")
+    ]
+
+    with patch("robinhood_core.services.orders.rh") as mock_rh:
+        mock_rh.urls.orders_url.return_value = "orders"
+        mock_rh.request_get.return_value = {"results": orders, "next": None}
+
+        history = service.get_order_history(order_type="stock")
+
+        cache_rh.request_get.assert_called_once()
+        assert cache_rh.request_get.call_args[0][2] == {"ids": "id-0,id-1,id-2"}
+        mock_rh.get_instrument_by_url.assert_not_called()
+        assert [o.symbol for o in history.stock_orders] == [
+            f"SYM-id-{i % 3}" for i in range(9)
+        ]
+
+
+def test_url_for_symbol_searches_cached_instruments():
+    cache = InstrumentCache()
+    cache.put(URL, {**INSTRUMENT, "url": URL})
+    fetch = MagicMock()
+
+    assert cache.url_for_symbol("aapl", fetch) == URL
+    fetch.assert_not_called()
+
+
+def test_url_for_symbol_fetches_and_caches_on_miss():
+    cache = InstrumentCache()
+    fetch = MagicMock(return_value={**INSTRUMENT, "url": URL})
+
+    assert cache.url_for_symbol("AAPL", fetch) == URL
+    assert cache.url_for_symbol("AAPL", fetch) == URL
+    fetch.assert_called_once_with("AAPL")
+    assert cache.symbol_for(URL, MagicMock()) == "AAPL"
+    assert cache.url_for_symbol("MSFT") is None
+
+
+def test_crypto_pairs_load_once():
+    pairs = CryptoPairTable()
+    fetch = MagicMock(return_value=[{"id": "btc-usd-id", "symbol": "BTC-USD"}])
+
+    assert pairs.symbol_for("btc-usd-id", fetch) == "BTC-USD"
+    assert pairs.symbol_for("unknown", fetch) is None
+    fetch.assert_called_once()
+
+
+def test_crypto_pairs_retry_failed_load_after_interval():
+    now = [0.0]
+    pairs = CryptoPairTable(retry_interval=60.0, clock=lambda: now[0])
+    fetch = MagicMock(side_effect=[[None], [{"id": "eth", "symbol": "ETH-USD"}]])
+
+    assert pairs.symbol_for("eth", fetch) is None
+    assert not pairs.loaded
+
+    now[0] = 59.0
+    assert pairs.symbol_for("eth", fetch) is None
+    fetch.assert_called_once()
+
+    now[0] = 60.0
+    assert pairs.symbol_for("eth", fetch) == "ETH-USD"
+    assert fetch.call_count == 2
+
+
+def test_failed_crypto_pair_load_is_not_repeated_per_order():
+    service = OrdersService(MagicMock(spec=RobinhoodClient))
+    orders = [
+        {"id": f"c{i}", "currency_pair_id": "btc", "state": "filled"}
+        for i in range(50)
+    ]
+
+    with patch("robinhood_core.services.orders.rh") as mock_rh:
+        mock_rh.urls.crypto_orders_url.return_value = "crypto"
+        mock_rh.request_get.return_value = {"results": orders, "next": None}
+        mock_rh.get_crypto_currency_pairs.return_value = [None]
+
+        history = service.get_order_history(order_type="crypto")
+
+        assert len(history.crypto_orders) == 50
+        mock_rh.get_crypto_currency_pairs.assert_called_once()
+
+
+def test_option_cache_serves_unexpired_contracts():
+    cache = OptionInstrumentCache()
+    contract = {"strike_price": "150.0000", "expiration_date": "2999-01-15"}
+    fetch = MagicMock(return_value=contract)
+
+    cache.resolve("opt-1", fetch)
+    assert cache.resolve("opt-1", fetch) == contract
+    fetch.assert_called_once()
+
+
+def test_option_cache_evicts_expired_contracts(tmp_path):
+    cache = OptionInstrumentCache.open(tmp_path)
+    cache.put("opt-1", {"expiration_date": "2000-01-21"})
+
+    assert cache.get("opt-1") is None
+    assert cache.stats()["memory_entries"] == 0
+
+    cache.put("opt-2", {"expiration_date": "2000-01-21"})
+    cache.close()
+    reopened = OptionInstrumentCache.open(tmp_path)
+    count = reopened._conn().execute(
+        "SELECT COUNT(*) FROM option_instruments"
+    ).fetchone()[0]
+    assert count == 0
+
+
+def test_repeat_option_positions_only_fetch_positions_list():
+    service = OptionsService(
+        MagicMock(spec=RobinhoodClient),
+        option_instrument_cache=OptionInstrumentCache(),
+    )
+    position = {
+        "option": "https://api.robinhood.com/options/instruments/opt-1/",
+        "chain_symbol": "AAPL",
+        "quantity": "1.0000",
+    }
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.get_open_option_positions.return_value = [position]
+        mock_rh.get_option_instrument_data_by_id.return_value = {
+            "strike_price": "150.0000",
+            "expiration_date": "2999-01-15",
+            "type": "call",
+        }
+
+        service.get_option_positions()
+        positions = service.get_option_positions()
+
+        assert positions[0].strike_price == 150.0
+        assert mock_rh.get_open_option_positions.call_count == 2
+        mock_rh.get_option_instrument_data_by_id.assert_called_once_with("opt-1")
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _quotes(symbols):
+    return [
+        {"symbol": s, "last_trade_price": "1.00", "updated_at": "2026-01-14T15:00:00Z"}
+        for s in symbols
+    ]
+
+
+def test_quote_cache_fetches_only_missing_symbols():
+    clock = _Clock()
+    cache = QuoteCache(ttl=2.0, closed_ttl=2.0, clock=clock)
+    fetch = MagicMock(side_effect=_quotes)
+
+    cache.get_quotes(["AAPL"], fetch)
+    result = cache.get_quotes(["aapl", "MSFT"], fetch)
+
+    assert list(result) == ["AAPL", "MSFT"]
+    assert fetch.call_args_list[1].args == (["MSFT"],)
+
+
+def test_quote_cache_refetches_stale_symbols():
+    clock = _Clock()
+    cache = QuoteCache(ttl=2.0, closed_ttl=2.0, clock=clock)
+    fetch = MagicMock(side_effect=_quotes)
+
+    cache.get_quotes(["AAPL", "MSFT"], fetch)
+    clock.now = 1.0
+    cache.get_quotes(["AAPL"], fetch)
+    clock.now = 2.5
+    cache.get_quotes(["AAPL", "MSFT"], fetch)
+
+    assert fetch.call_count == 2
+    assert fetch.call_args_list[1].args == (["AAPL", "MSFT"],)
+
+
+def test_quote_cache_uses_closed_ttl_outside_trading_hours():
+    clock = _Clock()
+    cache = QuoteCache(ttl=2.0, closed_ttl=60.0, clock=clock)
+    fetch = MagicMock(side_effect=_quotes)
+
+    with patch("robinhood_core.cache.market_is_active", return_value=False):
+        cache.get_quotes(["AAPL"], fetch)
+        clock.now = 30.0
+        cache.get_quotes(["AAPL"], fetch)
+
+    fetch.assert_called_once()
+
+
+def test_market_is_active():
+    eastern = ZoneInfo("America/New_York")
+    # Wednesday
+    assert market_is_active(datetime(2026, 1, 14, 10, 0, tzinfo=eastern))
+    assert market_is_active(datetime(2026, 1, 14, 18, 0, tzinfo=eastern))
+    assert not market_is_active(datetime(2026, 1, 14, 21, 0, tzinfo=eastern))
+    # Saturday
+    assert not market_is_active(datetime(2026, 1, 17, 10, 0, tzinfo=eastern))
+
+
+def test_quote_cache_shared_across_services():
+    cache = QuoteCache()
+    client = MagicMock(spec=RobinhoodClient)
+    market = MarketDataService(client, quote_cache=cache)
+    portfolio = PortfolioService(client, quote_cache=cache)
+
+    with patch("robinhood_core.services.market_data.rh") as market_rh, patch(
+        "robinhood_core.services.portfolio.rh"
+    ) as portfolio_rh:
+        market_rh.get_quotes.side_effect = _quotes
+        portfolio_rh.get_open_stock_positions.return_value = [
+            {"instrument": URL, "quantity": "1", "average_buy_price": "1"}
+        ]
+        portfolio_rh.get_instrument_by_url.return_value = INSTRUMENT
+
+        market.get_current_price(["AAPL"])
+        positions = portfolio.get_positions()
+
+        assert positions[0].market_value == 1.0
+        portfolio_rh.get_quotes.assert_not_called()
+
+
+def _in_threads(*calls):
+    results = [None] * len(calls)
+    barrier = threading.Barrier(len(calls))
+
+    def run(i, call):
+        barrier.wait()
+        try:
+            results[i] = call()
+        except Exception as e:
+            results[i] = e
+
+    threads = [
+        threading.Thread(target=run, args=(i, call)) for i, call in enumerate(calls)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return results
+
+
+@contextmanager
+def _batch_in_flight(batcher, fetch):
+    """Hold a batch for ``fetch`` in flight, so new callers wait to merge.
+
+    The held batch asks for ``HOLD``; ``fetch`` answers every other call
+    with its original side effect.
+    """
+    release = threading.Event()
+    started = threading.Event()
+    original = fetch.side_effect
+
+    def held(symbols):
+        if symbols == ["HOLD"]:
+            started.set()
+            release.wait(5)
+            return []
+        if isinstance(original, Exception):
+            raise original
+        return original(symbols)
+
+    fetch.side_effect = held
+    thread = threading.Thread(target=batcher.get_quotes, args=(["HOLD"], fetch))
+    thread.start()
+    started.wait(5)
+    try:
+        yield
+    finally:
+        release.set()
+        thread.join(5)
+
+
+def _merged_calls(fetch):
+    return [sorted(c.args[0]) for c in fetch.call_args_list if c.args[0] != ["HOLD"]]
+
+
+def test_batcher_merges_concurrent_requests():
+    batcher = QuoteBatcher(window=0.05)
+    fetch = MagicMock(side_effect=_quotes)
+
+    with _batch_in_flight(batcher, fetch):
+        aapl, msft = _in_threads(
+            lambda: batcher.get_quotes(["AAPL"], fetch),
+            lambda: batcher.get_quotes(["msft", "AAPL"], fetch),
+        )
+
+    assert _merged_calls(fetch) == [["AAPL", "MSFT"]]
+    assert [q["symbol"] for q in aapl] == ["AAPL"]
+    assert [q["symbol"] for q in msft] == ["MSFT", "AAPL"]
+
+
+def test_batcher_lone_caller_does_not_wait():
+    batcher = QuoteBatcher(window=10)
+    fetch = MagicMock(side_effect=_quotes)
+
+    started = time.monotonic()
+    quotes = batcher.get_quotes(["AAPL"], fetch)
+
+    assert time.monotonic() - started < 1
+    assert [q["symbol"] for q in quotes] == ["AAPL"]
+
+
+def test_batcher_keeps_separate_batches_per_fetch():
+    batcher = QuoteBatcher(window=0.05)
+    fetch = MagicMock(side_effect=_quotes)
+    other = MagicMock(side_effect=_quotes)
+
+    with _batch_in_flight(batcher, fetch):
+        aapl, msft = _in_threads(
+            lambda: batcher.get_quotes(["AAPL"], fetch),
+            lambda: batcher.get_quotes(["MSFT"], other),
+        )
+
+    assert _merged_calls(fetch) == [["AAPL"]]
+    other.assert_called_once_with(["MSFT"])
+    assert [q["symbol"] for q in aapl] == ["AAPL"]
+    assert [q["symbol"] for q in msft] == ["MSFT"]
+
+
+def test_batcher_chunks_large_batches():
+    batcher = QuoteBatcher(window=0, chunk_size=2)
+    fetch = MagicMock(side_effect=_quotes)
+
+    quotes = batcher.get_quotes(["A", "B", "C"], fetch)
+
+    assert [c.args[0] for c in fetch.call_args_list] == [["A", "B"], ["C"]]
+    assert len(quotes) == 3
+
+
+def test_batcher_shares_fetch_errors():
+    batcher = QuoteBatcher(window=0.05)
+    fetch = MagicMock(side_effect=ConnectionError("boom"))
+
+    with _batch_in_flight(batcher, fetch):
+        results = _in_threads(
+            lambda: batcher.get_quotes(["AAPL"], fetch),
+            lambda: batcher.get_quotes(["MSFT"], fetch),
+        )
+
+    assert _merged_calls(fetch) == [["AAPL", "MSFT"]]
+    assert all(isinstance(r, ConnectionError) for r in results)
+    with pytest.raises(ConnectionError):
+        batcher.get_quotes(["AAPL"], fetch)
+
+
+def test_quote_cache_batches_misses_across_threads():
+    batcher = QuoteBatcher(window=0.05)
+    cache = QuoteCache(batcher=batcher)
+    fetch = MagicMock(side_effect=_quotes)
+
+    with _batch_in_flight(batcher, fetch):
+        first, second = _in_threads(
+            lambda: cache.get_quotes(["AAPL"], fetch),
+            lambda: cache.get_quotes(["MSFT"], fetch),
+        )
+
+    assert _merged_calls(fetch) == [["AAPL", "MSFT"]]
+    assert list(first) == ["AAPL"]
+    assert list(second) == ["MSFT"]
@@ -0,0 +1,165 @@
+# tests/unit/test_candles.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from robinhood_core.candles import CandleStore
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.services.market_data import MarketDataService
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _bars(first_day, count, close=1.0, step=timedelta(days=1)):
+    return [
+        {
+            "begins_at": (START + timedelta(days=first_day) + i * step).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+            "open_price": "1.00",
+            "high_price": "2.00",
+            "low_price": "0.50",
+            "close_price": str(close),
+            "volume": 100,
+        }
+        for i in range(count)
+    ]
+
+
+class _Clock:
+    def __init__(self, day):
+        self.now = (START + timedelta(days=day)).timestamp()
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeat_request_fetches_only_tail():
+    store = CandleStore(clock=_Clock(400))
+    fetch = MagicMock(side_effect=[_bars(0, 400), _bars(395, 5, close=9.0)])
+
+    store.history("aapl", "day", "year", "regular", fetch)
+    rows = store.history("AAPL", "day", "year", "regular", fetch)
+
+    assert [c.args for c in fetch.call_args_list] == [("year",), ("month",)]
+    assert rows[-1]["close_price"] == 9.0
+    # The year window is sliced from the stored series.
+    assert len(rows) == 367
+    assert rows[0]["begins_at"] == "2025-02-03T00:00:00Z"
+
+
+def test_intraday_repeat_request_fetches_only_tail():
+    clock = _Clock(7)
+    store = CandleStore(clock=clock)
+    week = _bars(0, 7 * 24 * 12, step=timedelta(minutes=5))
+    fetch = MagicMock(side_effect=[week, week[-12:] + _bars(7, 1, close=9.0)])
+
+    store.history("AAPL", "5minute", "week", "regular", fetch)
+    clock.now += 300
+    rows = store.history("AAPL", "5minute", "week", "regular", fetch)
+
+    assert [c.args for c in fetch.call_args_list] == [("week",), ("day",)]
+    assert rows[-1]["close_price"] == 9.0
+    assert len(rows) == len(week) + 1
+
+
+def test_tail_after_last_stored_bar_fetches_in_full():
+    store = CandleStore(clock=_Clock(400))
+    # The month tail starts a day after the last stored bar.
+    fetch = MagicMock(side_effect=[_bars(0, 390), _bars(391, 9), _bars(0, 400)])
+
+    store.history("AAPL", "day", "year", "regular", fetch)
+    rows = store.history("AAPL", "day", "year", "regular", fetch)
+
+    assert [c.args for c in fetch.call_args_list] == [
+        ("year",),
+        ("month",),
+        ("year",),
+    ]
+    assert rows[-1]["begins_at"] == "2026-02-04T00:00:00Z"
+    assert len(rows) == 367
+
+
+def test_longer_span_than_stored_fetches_in_full():
+    store = CandleStore(clock=_Clock(400))
+    fetch = MagicMock(side_effect=[_bars(300, 100), _bars(0, 400)])
+
+    store.history("AAPL", "day", "3month", "regular", fetch)
+    store.history("AAPL", "day", "year", "regular", fetch)
+
+    assert [c.args for c in fetch.call_args_list] == [("3month",), ("year",)]
+
+
+def test_stale_series_without_overlap_is_replaced():
+    clock = _Clock(10)
+    store = CandleStore(clock=clock)
+    store.history(
+        "AAPL", "day", "year", "regular", MagicMock(return_value=_bars(0, 10))
+    )
+
+    clock.now += timedelta(days=500).total_seconds()
+    fetch = MagicMock(side_effect=[_bars(500, 10)])
+    rows = store.history("AAPL", "day", "year", "regular", fetch)
+
+    fetch.assert_called_once_with("year")
+    assert len(rows) == 10
+
+
+def test_failed_tail_falls_back_to_full_fetch():
+    store = CandleStore(clock=_Clock(400))
+    fetch = MagicMock(side_effect=[_bars(0, 400), [None], _bars(0, 400)])
+
+    store.history("AAPL", "day", "year", "regular", fetch)
+    rows = store.history("AAPL", "day", "year", "regular", fetch)
+
+    assert [c.args for c in fetch.call_args_list] == [
+        ("year",),
+        ("month",),
+        ("year",),
+    ]
+    assert rows
+
+
+def test_persists_across_instances(tmp_path):
+    first = CandleStore.open(tmp_path, clock=_Clock(400))
+    first.history(
+        "AAPL", "week", "5year", "regular", MagicMock(return_value=_bars(0, 400))
+    )
+
+    second = CandleStore.open(tmp_path, clock=_Clock(400))
+    fetch = MagicMock(return_value=_bars(399, 1))
+    rows = second.history("AAPL", "week", "5year", "regular", fetch)
+
+    fetch.assert_called_once_with("year")
+    assert len(rows) == 400
+
+
+def test_unreadable_file_is_ignored(tmp_path):
+    (tmp_path / "candles").mkdir()
+    (tmp_path / "candles" / "AAPL-day-regular.bin").write_bytes(b"junk")
+    store = CandleStore.open(tmp_path, clock=_Clock(400))
+
+    rows = store.history(
+        "AAPL", "day", "year", "regular", MagicMock(return_value=_bars(0, 3))
+    )
+
+    assert len(rows) == 3
+
+
+def test_price_history_uses_candle_store():
+    service = MarketDataService(
+        MagicMock(spec=RobinhoodClient), candle_store=CandleStore(clock=_Clock(400))
+    )
+
+    with patch("robinhood_core.services.market_data.rh") as mock_rh:
+        mock_rh.get_stock_historicals.side_effect = [_bars(0, 400), _bars(399, 1)]
+
+        service.get_price_history("AAPL", interval="day", span="5year")
+        candles = service.get_price_history("AAPL", interval="day", span="5year")
+
+        assert len(candles) == 400
+        assert candles[0].timestamp == "2025-01-01T00:00:00Z"
+        assert mock_rh.get_stock_historicals.call_args.kwargs == {
+            "interval": "day",
+            "span": "month",
+            "bounds": "regular",
+        }
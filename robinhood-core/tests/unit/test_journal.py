@@ -0,0 +1,345 @@
+# tests/unit/test_journal.py
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.errors import RobinhoodAPIError
+from robinhood_core.journal import BUSY_TIMEOUT_MS, OrderJournal
+from robinhood_core.services.orders import OrdersService
+
+URL = "https://api.robinhood.com/instruments/abc/"
+
+
+def _order(order_id, updated_at, instrument=URL):
+    return {
+        "id": order_id,
+        "instrument": instrument,
+        "state": "filled",
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+def test_record_advances_high_water_mark():
+    journal = OrderJournal()
+    assert journal.high_water_mark("stock") is None
+
+    journal.record(
+        "stock",
+        [
+            ("o1", "AAPL", _order("o1", "2026-01-10T10:00:00Z")),
+            ("o2", "MSFT", _order("o2", "2026-01-12T10:00:00Z")),
+        ],
+    )
+    assert journal.high_water_mark("stock") == "2026-01-12T10:00:00Z"
+
+    journal.record("stock", [("o0", "AAPL", _order("o0", "2026-01-01T10:00:00Z"))])
+    assert journal.high_water_mark("stock") == "2026-01-12T10:00:00Z"
+
+
+def test_record_upserts_by_order_id():
+    journal = OrderJournal()
+    journal.record("stock", [("o1", "AAPL", {"id": "o1", "state": "queued"})])
+    journal.record("stock", [("o1", "AAPL", {"id": "o1", "state": "filled"})])
+
+    rows = journal.query("stock")
+    assert rows == [("AAPL", {"id": "o1", "state": "filled"})]
+
+
+def test_query_filters_by_symbol_and_date_newest_first():
+    journal = OrderJournal()
+    journal.record(
+        "stock",
+        [
+            ("o1", "AAPL", _order("o1", "2026-01-05T10:00:00Z")),
+            ("o2", "aapl", _order("o2", "2026-01-15T10:00:00Z")),
+            ("o3", "MSFT", _order("o3", "2026-01-20T10:00:00Z")),
+            ("o4", None, _order("o4", "2026-01-25T10:00:00Z")),
+        ],
+    )
+
+    ids = [item["id"] for _, item in journal.query("stock", "AAPL", "2026-01-10")]
+    assert ids == ["o4", "o2"]
+    assert journal.query("option") == []
+
+
+def test_query_limit_keeps_newest():
+    journal = OrderJournal()
+    journal.record(
+        "stock",
+        [
+            (f"o{day}", "AAPL", _order(f"o{day}", f"2026-01-{day:02d}T10:00:00Z"))
+            for day in range(1, 6)
+        ],
+    )
+
+    ids = [item["id"] for _, item in journal.query("stock", limit=2)]
+    assert ids == ["o5", "o4"]
+
+    after = ("2026-01-04T10:00:00Z", "o4")
+    ids = [item["id"] for _, item in journal.query("stock", limit=2, after=after)]
+    assert ids == ["o3", "o2"]
+
+
+def test_file_journal_waits_for_locks_in_wal_mode(tmp_path):
+    journal = OrderJournal.open(tmp_path)
+    db = journal._conn()
+
+    assert db.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert db.execute("PRAGMA busy_timeout").fetchone() == (BUSY_TIMEOUT_MS,)
+
+
+def test_failed_record_writes_nothing():
+    journal = OrderJournal()
+
+    with pytest.raises(sqlite3.IntegrityError):
+        journal.record(
+            "stock",
+            [
+                ("o1", "AAPL", _order("o1", "2026-01-10T10:00:00Z")),
+                (None, "AAPL", _order("o2", "2026-01-12T10:00:00Z")),
+            ],
+        )
+
+    assert journal.query("stock") == []
+    assert journal.high_water_mark("stock") is None
+
+
+def test_query_end_date_and_state():
+    journal = OrderJournal()
+    journal.record(
+        "stock",
+        [
+            ("o1", "AAPL", _order("o1", "2026-01-05T10:00:00Z")),
+            ("o2", "AAPL", {**_order("o2", "2026-01-10T10:00:00Z"), "state": "x"}),
+            ("o3", "AAPL", _order("o3", "2026-01-10T18:00:00Z")),
+            ("o4", "AAPL", _order("o4", "2026-01-11T10:00:00Z")),
+        ],
+    )
+
+    rows = journal.query("stock", end_date="2026-01-10", state="filled")
+    assert [item["id"] for _, item in rows] == ["o3", "o1"]
+
+
+def test_oldest_open_ignores_final_states():
+    journal = OrderJournal()
+    journal.record(
+        "crypto",
+        [
+            ("c1", None, {**_order("c1", "2026-01-05T10:00:00Z"), "state": "x"}),
+            ("c2", None, _order("c2", "2026-01-01T10:00:00Z")),
+            ("c3", None, {**_order("c3", "2026-01-08T10:00:00Z"), "state": "y"}),
+        ],
+    )
+
+    assert journal.oldest_open("crypto") == "2026-01-05T10:00:00Z"
+    assert journal.oldest_open("stock") is None
+
+
+def test_mark_synced_does_not_override_existing_mark():
+    journal = OrderJournal()
+    journal.mark_synced("option", "2026-01-01T00:00:00Z")
+    journal.mark_synced("option", "2026-02-01T00:00:00Z")
+    assert journal.high_water_mark("option") == "2026-01-01T00:00:00Z"
+
+
+def test_persists_across_instances(tmp_path):
+    first = OrderJournal.open(tmp_path)
+    first.record("stock", [("o1", "AAPL", _order("o1", "2026-01-10T10:00:00Z"))])
+    first.close()
+
+    second = OrderJournal.open(tmp_path)
+    assert second.high_water_mark("stock") == "2026-01-10T10:00:00Z"
+    assert [s for s, _ in second.query("stock")] == ["AAPL"]
+
+
+def _serve_pages(mock_rh, *responses):
+    """Answer order page requests with ``responses``, one per request.
+
+    Each response is a list of pages; a ``None`` page fails to load.
+    Returns the list of requested URLs.
+    """
+    mock_rh.urls.orders_url.side_effect = lambda start_date=None: (
+        f"stock?since={start_date}"
+    )
+    mock_rh.urls.option_orders_url.side_effect = lambda start_date=None: (
+        f"option?since={start_date}"
+    )
+    mock_rh.urls.crypto_orders_url.return_value = "crypto"
+    mock_rh.urls.instruments_url.return_value = "instruments"
+    pending = [list(pages) for pages in responses]
+    requested = []
+
+    def request_get(url, data_type="regular", payload=None):
+        if url == "instruments":
+            return None
+        requested.append(url)
+        pages = pending[0]
+        page = pages.pop(0)
+        if not pages:
+            pending.pop(0)
+        if page is None:
+            return None
+        return {"results": page, "next": "next" if pages else None}
+
+    mock_rh.request_get.side_effect = request_get
+    return requested
+
+
+class TestOrdersServiceWithJournal:
+    @pytest.fixture
+    def service(self):
+        return OrdersService(MagicMock(spec=RobinhoodClient), journal=OrderJournal())
+
+    def test_second_call_fetches_only_updated_orders(self, service):
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+            requested = _serve_pages(
+                mock_rh,
+                [[_order("o1", "2026-01-10T10:00:00Z")]],
+                [[_order("o2", "2026-01-12T10:00:00Z")]],
+            )
+
+            service.get_order_history(order_type="stock")
+            result = service.get_order_history(order_type="stock")
+
+            assert requested == ["stock?since=None", "stock?since=2026-01-10T10:00:00Z"]
+            assert [o.id for o in result.stock_orders] == ["o2", "o1"]
+
+    def test_filters_answered_locally(self, service):
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            mock_rh.get_instrument_by_url.side_effect = lambda url: {
+                "symbol": url.rstrip("/").rsplit("/", 1)[-1].upper()
+            }
+            aapl = _order("o1", "2026-01-05T10:00:00Z", instrument="/aapl/")
+            msft = _order("o2", "2026-01-15T10:00:00Z", instrument="/msft/")
+            requested = _serve_pages(mock_rh, [[msft, aapl]])
+
+            result = service.get_order_history(
+                order_type="stock", symbol="msft", start_date="2026-01-10"
+            )
+
+            assert [o.symbol for o in result.stock_orders] == ["MSFT"]
+            assert requested == ["stock?since=None"]
+
+    def test_cursor_continues_after_last_journaled_order(self, service):
+        o3, o2, o1 = (
+            _order(f"o{day}", f"2026-01-1{day}T10:00:00Z") for day in (3, 2, 1)
+        )
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_pages(mock_rh, [[o3, o2, o1]], [[]])
+
+            first = service.get_order_history(order_type="option", limit=2)
+            second = service.get_order_history(
+                order_type="option", limit=2, cursor=first.next_cursor
+            )
+
+            assert [o.id for o in first.option_orders] == ["o3", "o2"]
+            assert [o.id for o in second.option_orders] == ["o1"]
+            assert second.next_cursor is None
+
+    def test_locked_journal_falls_back_to_live_paging(self, service):
+        locked = sqlite3.OperationalError("database is locked")
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_pages(mock_rh, [[_order("x1", "2026-01-10")]])
+            with patch.object(service.journal, "high_water_mark", side_effect=locked):
+                result = service.get_order_history(order_type="option")
+
+            assert [o.id for o in result.option_orders] == ["x1"]
+            assert result.errors == {}
+            assert requested == ["option?since=None"]
+
+    def test_empty_first_sync_records_mark(self, service):
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_pages(mock_rh, [[]])
+
+            service.get_order_history(order_type="option")
+
+            assert service.journal.high_water_mark("option") is not None
+
+    def test_failed_first_sync_is_not_recorded(self, service):
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_pages(mock_rh, [None])
+
+            with pytest.raises(RobinhoodAPIError):
+                service.get_order_history(order_type="option")
+
+            assert service.journal.high_water_mark("option") is None
+
+    def test_failed_page_mid_sync_records_nothing(self, service):
+        o3 = _order("o3", "2026-01-12T10:00:00Z")
+        o2 = _order("o2", "2026-01-11T10:00:00Z")
+        o1 = _order("o1", "2026-01-10T10:00:00Z")
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+            requested = _serve_pages(
+                mock_rh,
+                # The first sync loses o1's page ...
+                [[o3, o2], None],
+                # ... so the next one starts over from the beginning.
+                [[o3, o2], [o1]],
+            )
+
+            with pytest.raises(RobinhoodAPIError):
+                service.get_order_history(order_type="stock")
+            assert service.journal.high_water_mark("stock") is None
+            assert service.journal.query("stock") == []
+
+            result = service.get_order_history(order_type="stock")
+
+            assert requested[-2:] == ["stock?since=None", "next"]
+            assert [o.id for o in result.stock_orders] == ["o3", "o2", "o1"]
+
+    def test_crypto_sync_stops_at_the_mark(self, service):
+        c1, c2, c3, c4 = (
+            _order(f"c{day}", f"2026-01-1{day}T10:00:00Z") for day in range(1, 5)
+        )
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_pages(mock_rh, [[c3, c2], [c1]], [[c4, c3, c2], [c1]])
+
+            service.get_order_history(order_type="crypto")
+            result = service.get_order_history(order_type="crypto")
+
+            # The second sync never asks for c1's page.
+            assert requested == ["crypto", "next", "crypto"]
+            assert [o.id for o in result.crypto_orders] == ["c4", "c3", "c2", "c1"]
+
+    def test_crypto_sync_pages_back_to_the_oldest_open_order(self, service):
+        c1, c3, c4 = (
+            _order(f"c{day}", f"2026-01-1{day}T10:00:00Z") for day in (1, 3, 4)
+        )
+        c2 = {**_order("c2", "2026-01-12T10:00:00Z"), "state": "queued"}
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_pages(
+                mock_rh,
+                [[c3, c2, c1]],
+                [[c4, c3], [{**c2, "state": "filled"}, c1]],
+            )
+
+            service.get_order_history(order_type="crypto")
+            result = service.get_order_history(order_type="crypto", state="filled")
+
+            assert requested == ["crypto", "crypto", "next"]
+            assert [o.id for o in result.crypto_orders] == ["c4", "c3", "c2", "c1"]
+
+    def test_crypto_start_date_means_created_on_or_after(self, service):
+        updated_late = {
+            **_order("c1", "2026-01-05T10:00:00Z"),
+            "updated_at": "2026-01-20",
+        }
+        recent = _order("c2", "2026-01-15T10:00:00Z")
+        live = OrdersService(MagicMock(spec=RobinhoodClient))
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_pages(mock_rh, [[recent, updated_late]], [[recent, updated_late]])
+
+            journaled = service.get_order_history(
+                order_type="crypto", start_date="2026-01-10"
+            )
+            streamed = live.get_order_history(
+                order_type="crypto", start_date="2026-01-10"
+            )
+
+            assert [o.id for o in journaled.crypto_orders] == ["c2"]
+            assert [o.id for o in streamed.crypto_orders] == ["c2"]
@@ -0,0 +1,179 @@
+# tests/unit/test_policy.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from robinhood_core.policy import CallPolicy, CircuitBreaker, CircuitOpenError
+from robinhood_core.transport import RobinhoodAdapter
+
+QUOTES = "https://api.robinhood.com/quotes/"
+ORDERS = "https://api.robinhood.com/orders/"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status):
+    response = requests.Response()
+    response.raw = MagicMock()
+    response.status_code = status
+    return response
+
+
+def _prepared(method="GET", url=QUOTES):
+    return requests.Request(method, url).prepare()
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("sleep", MagicMock())
+    kwargs.setdefault("jitter", lambda low, high: high)
+    return CallPolicy(**kwargs)
+
+
+def test_breaker_opens_after_threshold_and_allows_one_trial():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    clock.now += 10
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now += 10
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_policy_timeouts_and_backoff():
+    policy = _policy(timeouts={"quotes": (1.0, 2.0)}, backoff=0.5, max_backoff=3.0)
+
+    assert policy.timeout(QUOTES) == (1.0, 2.0)
+    assert policy.timeout(ORDERS) == (3.05, 20.0)
+    assert policy.delay(1) == 1.0
+    assert policy.delay(5) == 3.0
+    assert policy.breaker(QUOTES) is policy.breaker(QUOTES + "?symbols=A")
+    assert policy.breaker(QUOTES) is not policy.breaker(ORDERS)
+
+
+def test_adapter_applies_family_timeout():
+    adapter = RobinhoodAdapter(policy=_policy())
+
+    with patch.object(HTTPAdapter, "send", return_value=_response(200)) as send:
+        adapter.send(_prepared(url=ORDERS))
+        adapter.send(_prepared(), timeout=1)
+
+    assert send.call_args_list[0].kwargs["timeout"] == (3.05, 20.0)
+    assert send.call_args_list[1].kwargs["timeout"] == 1
+
+
+def test_adapter_retries_get_after_connection_error_and_5xx():
+    policy = _policy(retries=2)
+    adapter = RobinhoodAdapter(policy=policy)
+
+    with patch.object(
+        HTTPAdapter,
+        "send",
+        side_effect=[requests.ConnectTimeout(), _response(503), _response(200)],
+    ):
+        assert adapter.send(_prepared()).status_code == 200
+
+    assert [c.args[0] for c in policy.sleep.call_args_list] == [0.5, 1.0]
+    assert policy.breaker(QUOTES).state == "closed"
+
+
+def test_adapter_gives_up_after_retries():
+    adapter = RobinhoodAdapter(policy=_policy(retries=1))
+
+    with patch.object(HTTPAdapter, "send", return_value=_response(502)) as send:
+        assert adapter.send(_prepared()).status_code == 502
+    assert send.call_count == 2
+
+    with patch.object(
+        HTTPAdapter, "send", side_effect=requests.ReadTimeout()
+    ) as send:
+        with pytest.raises(requests.ReadTimeout):
+            adapter.send(_prepared())
+    assert send.call_count == 2
+
+
+def test_adapter_does_not_retry_post():
+    adapter = RobinhoodAdapter(policy=_policy())
+
+    with patch.object(HTTPAdapter, "send", side_effect=requests.ConnectionError()):
+        with pytest.raises(requests.ConnectionError):
+            adapter.send(_prepared("POST"))
+
+
+def test_open_circuit_fails_fast():
+    adapter = RobinhoodAdapter(
+        policy=_policy(retries=0, failure_threshold=2, reset_timeout=60)
+    )
+
+    with patch.object(HTTPAdapter, "send", return_value=_response(500)) as send:
+        adapter.send(_prepared())
+        adapter.send(_prepared())
+        with pytest.raises(CircuitOpenError):
+            adapter.send(_prepared())
+        assert send.call_count == 2
+
+        # Other endpoint families are unaffected.
+        adapter.send(_prepared(url=ORDERS))
+        assert send.call_count == 3
+
+
+def test_retried_request_counts_as_one_failure():
+    adapter = RobinhoodAdapter(
+        policy=_policy(retries=2, failure_threshold=3, reset_timeout=60)
+    )
+
+    with patch.object(HTTPAdapter, "send", return_value=_response(503)) as send:
+        adapter.send(_prepared())
+        adapter.send(_prepared())
+        assert send.call_count == 6
+        assert adapter.policy.breaker(QUOTES).state == "closed"
+
+        adapter.send(_prepared())
+        assert adapter.policy.breaker(QUOTES).state == "open"
+
+    with patch.object(
+        HTTPAdapter, "send", side_effect=[requests.ConnectTimeout(), _response(200)]
+    ):
+        adapter.policy.breaker(ORDERS).record_failure()
+        adapter.policy.breaker(ORDERS).record_failure()
+        # A retry that succeeds is a success, not a third failure.
+        assert adapter.send(_prepared(url=ORDERS)).status_code == 200
+        assert adapter.policy.breaker(ORDERS).state == "closed"
+
+
+def test_circuit_open_error_is_a_request_exception():
+    assert issubclass(CircuitOpenError, requests.RequestException)
+
+
+def test_client_installs_adapter_with_policy():
+    from robinhood_core.client import RobinhoodClient
+
+    policy = CallPolicy()
+    with patch("robinhood_core.client.install_adapter") as install:
+        RobinhoodClient(call_policy=policy)
+
+    adapter = install.call_args.args[0]
+    assert adapter.policy is policy
+    assert adapter.rate_limiter is None
@@ -0,0 +1,153 @@
+# tests/unit/test_ratelimit.py
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from robinhood_core.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_family,
+    parse_retry_after,
+)
+from robinhood_core.transport import RobinhoodAdapter, install_adapter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_endpoint_family():
+    assert endpoint_family("https://api.robinhood.com/quotes/?symbols=AAPL") == "quotes"
+    assert endpoint_family("https://api.robinhood.com/quotes/historicals/") == "quotes"
+    assert (
+        endpoint_family("https://api.robinhood.com/marketdata/options/?ids=1")
+        == "options_market_data"
+    )
+    assert endpoint_family("https://api.robinhood.com/options/orders/") == "orders"
+    assert endpoint_family("https://nummus.robinhood.com/orders/") == "orders"
+    assert endpoint_family("https://api.robinhood.com/instruments/a/") == "instruments"
+    assert endpoint_family("https://api.robinhood.com/accounts/") == "default"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480) == 10.0
+
+
+def test_bucket_allows_burst_then_paces():
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    clock.now += 10
+    assert bucket.reserve() == 0
+
+
+def test_throttle_pauses_and_halves_rate_then_recovers():
+    clock = _Clock()
+    bucket = TokenBucket(rate=4.0, burst=4, clock=clock)
+
+    bucket.throttle(retry_after=3)
+    assert bucket.rate == 2.0
+    assert bucket.reserve() == 3.5
+
+    for _ in range(50):
+        bucket.recover()
+    assert bucket.rate == 4.0
+
+
+def test_throttle_without_retry_after_backs_off_exponentially():
+    clock = _Clock()
+    bucket = TokenBucket(rate=1.0, burst=1, min_rate=0.5, clock=clock)
+
+    bucket.throttle()
+    clock.now += 1
+    bucket.throttle()
+    assert bucket.rate == 0.5
+    assert bucket._paused_until == clock.now + 2
+
+
+def test_limiter_keeps_families_separate():
+    clock = _Clock()
+    sleep = MagicMock()
+    limiter = RateLimiter({"quotes": (1.0, 1)}, clock=clock, sleep=sleep)
+
+    limiter.acquire("https://api.robinhood.com/quotes/")
+    limiter.acquire("https://api.robinhood.com/instruments/x/")
+    sleep.assert_not_called()
+
+    limiter.acquire("https://api.robinhood.com/quotes/")
+    sleep.assert_called_once_with(1.0)
+
+    limiter.observe("https://api.robinhood.com/orders/", 429, "5")
+    assert limiter.rates()["orders"] == 1.0
+    assert limiter.rates()["quotes"] == 1.0
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.raw = MagicMock()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+def _prepared(method="GET", url="https://api.robinhood.com/quotes/"):
+    return requests.Request(method, url).prepare()
+
+
+def test_adapter_retries_throttled_get():
+    limiter = MagicMock()
+    adapter = RobinhoodAdapter(rate_limiter=limiter)
+
+    with patch.object(
+        HTTPAdapter,
+        "send",
+        side_effect=[_response(429, {"Retry-After": "1"}), _response(200)],
+    ) as send:
+        response = adapter.send(_prepared())
+
+    assert response.status_code == 200
+    assert send.call_count == 2
+    assert limiter.acquire.call_count == 2
+    limiter.observe.assert_any_call("https://api.robinhood.com/quotes/", 429, "1")
+
+
+def test_adapter_does_not_retry_post_or_beyond_limit():
+    adapter = RobinhoodAdapter(rate_limiter=MagicMock(), max_throttle_retries=1)
+
+    with patch.object(HTTPAdapter, "send", return_value=_response(429)) as send:
+        assert adapter.send(_prepared("POST")).status_code == 429
+        assert send.call_count == 1
+        assert adapter.send(_prepared()).status_code == 429
+        assert send.call_count == 3
+
+
+def test_install_adapter_mounts_https():
+    session = requests.Session()
+    adapter = install_adapter(RobinhoodAdapter(), session)
+    assert session.get_adapter("https://api.robinhood.com/quotes/") is adapter
+
+
+def test_client_installs_rate_limited_adapter():
+    from robinhood_core.client import RobinhoodClient
+
+    limiter = RateLimiter()
+    with patch("robinhood_core.client.install_adapter") as install:
+        RobinhoodClient(rate_limiter=limiter)
+        RobinhoodClient()
+
+    first, second = install.call_args_list
+    assert first.args[0].rate_limiter is limiter
+    assert second.args[0].rate_limiter is None
@@ -367,3 +367,130 @@ def test_ensure_session_raises_when_no_credentials_no_session_path():
     client = RobinhoodClient()  # no credentials, no session path
     with pytest.raises(AuthRequiredError):
         client.ensure_session()
+
+
+def test_session_dir_defaults_to_robin_stocks_location():
+    from robinhood_core.client import RobinhoodClient
+
+    with patch.dict(os.environ, {}, clear=True):
+        assert RobinhoodClient().session_dir == Path.home() / ".tokens"
+    assert RobinhoodClient(session_path="/tmp/s").session_dir == Path("/tmp/s")
+
+
+def _burst(client, count=10):
+    import threading
+
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def call():
+        barrier.wait()
+        try:
+            client.ensure_session()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    return errors
+
+
+def test_concurrent_ensure_session_logs_in_once():
+    import time
+
+    from robinhood_core.client import RobinhoodClient
+
+    client = RobinhoodClient(username="u", password="p")
+
+    def slow_login(**kwargs):
+        time.sleep(0.05)
+        return {"access_token": "t"}
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+        mock_rh.login.side_effect = slow_login
+        errors = _burst(client)
+
+        assert errors == []
+        assert mock_rh.login.call_count == 1
+
+
+def test_concurrent_callers_share_failed_login():
+    import time
+
+    from robinhood_core.client import RobinhoodClient
+    from robinhood_core.errors import AuthRequiredError
+
+    client = RobinhoodClient(username="u", password="p")
+
+    def slow_login(**kwargs):
+        time.sleep(0.05)
+        return None
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+        mock_rh.login.side_effect = slow_login
+        errors = _burst(client)
+
+        assert len(errors) == 10
+        assert all(isinstance(e, AuthRequiredError) for e in errors)
+        assert mock_rh.login.call_count == 1
+
+        # A later call retries instead of reusing the old failure.
+        mock_rh.login.side_effect = None
+        mock_rh.login.return_value = {"access_token": "t"}
+        client.ensure_session()
+        assert mock_rh.login.call_count == 2
+
+
+def test_client_configures_connection_pool():
+    from robinhood_core.client import RobinhoodClient
+
+    with patch("robinhood_core.client.install_adapter") as install:
+        with patch.dict(os.environ, {}, clear=True):
+            RobinhoodClient()
+        with patch.dict(
+            os.environ,
+            {"RH_POOL_MAXSIZE": "64", "RH_KEEP_ALIVE": "0", "RH_GZIP": "0"},
+        ):
+            RobinhoodClient(pool_connections=2)
+
+    default, tuned = install.call_args_list
+    assert default.args[0]._pool_maxsize == 32
+    assert default.kwargs == {"keep_alive": True, "gzip": True}
+    assert tuned.args[0]._pool_connections == 2
+    assert tuned.args[0]._pool_maxsize == 64
+    assert tuned.kwargs == {"keep_alive": False, "gzip": False}
+
+
+def test_client_rejects_invalid_pool_sizes():
+    from robinhood_core.client import RobinhoodClient
+
+    with patch("robinhood_core.client.install_adapter"):
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError, match="pool_maxsize must be at least 1"):
+                RobinhoodClient(pool_maxsize=0)
+            with pytest.raises(ValueError, match="pool_connections"):
+                RobinhoodClient(pool_connections=-1)
+        with patch.dict(os.environ, {"RH_POOL_MAXSIZE": "lots"}):
+            with pytest.raises(ValueError, match="RH_POOL_MAXSIZE must be an integer"):
+                RobinhoodClient()
+        with patch.dict(os.environ, {"RH_POOL_CONNECTIONS": "0"}):
+            with pytest.raises(ValueError, match="RH_POOL_CONNECTIONS must be at"):
+                RobinhoodClient()
+
+
+def test_install_adapter_sets_session_headers():
+    import requests
+
+    from robinhood_core.transport import RobinhoodAdapter, install_adapter
+
+    session = requests.Session()
+    install_adapter(RobinhoodAdapter(), session)
+    assert session.headers["Connection"] == "keep-alive"
+    assert session.headers["Accept-Encoding"] == "gzip, deflate"
+
+    install_adapter(RobinhoodAdapter(), session, keep_alive=False, gzip=False)
+    assert session.headers["Connection"] == "close"
+    assert session.headers["Accept-Encoding"] == "identity"
@@ -78,7 +78,7 @@ def test_get_options_chain_calls_ensure_session():
 
     with patch("robinhood_core.services.options.rh") as mock_rh:
         mock_rh.find_tradable_options.return_value = []
-        mock_rh.get_latest_price.return_value = [None]
+        mock_rh.get_quotes.return_value = [None]
 
         service.get_options_chain("AAPL", "2026-03-20")
 
@@ -97,7 +97,9 @@ def test_chain_listing_with_expiration_date():
             MOCK_INSTRUMENT_CALL,
             MOCK_INSTRUMENT_PUT,
         ]
-        mock_rh.get_latest_price.return_value = ["152.00"]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "152.00"}
+        ]
 
         contracts = service.get_options_chain("AAPL", "2026-03-20")
 
@@ -124,7 +126,9 @@ def test_chain_listing_with_option_type():
 
     with patch("robinhood_core.services.options.rh") as mock_rh:
         mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
-        mock_rh.get_latest_price.return_value = ["150.00"]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "150.00"}
+        ]
 
         contracts = service.get_options_chain("AAPL", "2026-03-20", option_type="call")
 
@@ -144,7 +148,9 @@ def test_chain_listing_resolves_nearest_expiration():
             "expiration_dates": ["2026-03-20", "2026-04-17"]
         }
         mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
-        mock_rh.get_latest_price.return_value = ["150.00"]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "150.00"}
+        ]
 
         contracts = service.get_options_chain("AAPL")
 
@@ -157,6 +163,37 @@ def test_chain_listing_resolves_nearest_expiration():
         )
 
 
+def test_nearest_expiration_cached_for_the_day():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.get_chains.return_value = {
+            "expiration_dates": ["2999-01-15", "2999-01-22"]
+        }
+        mock_rh.find_tradable_options.return_value = []
+
+        service.get_options_chain("AAPL")
+        service.get_options_chain("aapl")
+
+        mock_rh.get_chains.assert_called_once_with("AAPL")
+        assert mock_rh.find_tradable_options.call_count == 2
+
+
+def test_nearest_expiration_refetched_after_it_passes():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.get_chains.return_value = {"expiration_dates": ["2000-01-21"]}
+        mock_rh.find_tradable_options.return_value = []
+
+        service.get_options_chain("AAPL")
+        service.get_options_chain("AAPL")
+
+        assert mock_rh.get_chains.call_count == 2
+
+
 def test_chain_listing_empty_expirations():
     mock_client = MagicMock(spec=RobinhoodClient)
     service = OptionsService(mock_client)
@@ -200,7 +237,9 @@ def test_chain_listing_near_the_money_filter():
 
     with patch("robinhood_core.services.options.rh") as mock_rh:
         mock_rh.find_tradable_options.return_value = [far_otm, near_money]
-        mock_rh.get_latest_price.return_value = ["100.00"]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "TEST", "last_trade_price": "100.00"}
+        ]
 
         contracts = service.get_options_chain("TEST", "2026-03-20", option_type="call")
 
@@ -226,7 +265,7 @@ def test_chain_listing_no_price_skips_filter():
 
     with patch("robinhood_core.services.options.rh") as mock_rh:
         mock_rh.find_tradable_options.return_value = [far_otm, near_money]
-        mock_rh.get_latest_price.return_value = [None]
+        mock_rh.get_quotes.return_value = [None]
 
         contracts = service.get_options_chain("TEST", "2026-03-20")
 
@@ -243,7 +282,9 @@ def test_chain_listing_skips_none_items():
             MOCK_INSTRUMENT_CALL,
             None,
         ]
-        mock_rh.get_latest_price.return_value = ["150.00"]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "150.00"}
+        ]
 
         contracts = service.get_options_chain("AAPL", "2026-03-20")
 
@@ -303,6 +344,32 @@ def test_targeted_lookup_both_types():
         assert mock_rh.get_option_market_data.call_count == 2
 
 
+def test_targeted_lookup_both_types_concurrent_and_ordered():
+    """Call and put are fetched together and returned call-first."""
+    import threading
+    import time
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def market_data(symbol, expirationDate, strikePrice, optionType):
+        # Deadlocks (and times out) unless both requests are in flight
+        barrier.wait()
+        if optionType == "call":
+            time.sleep(0.02)
+        return [[{"chain_symbol": symbol, "delta": "0.5"}]]
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.get_option_market_data.side_effect = market_data
+
+        contracts = service.get_options_chain(
+            "AAPL", "2026-03-20", strike_price="150.00"
+        )
+
+        assert [c.type for c in contracts] == ["call", "put"]
+
+
 def test_targeted_lookup_empty_result():
     mock_client = MagicMock(spec=RobinhoodClient)
     service = OptionsService(mock_client)
@@ -332,6 +399,125 @@ def test_targeted_lookup_none_entries():
         assert len(contracts) == 0
 
 
+# -- Tests: strike ladder (strike_prices / strikes_around_atm) -----
+
+LADDER_INSTRUMENTS = [
+    {
+        "id": f"{ot}-{strike}",
+        "strike_price": f"{strike}.0000",
+        "type": ot,
+        "chain_symbol": "AAPL",
+        "expiration_date": "2026-03-20",
+    }
+    for strike in (140, 145, 150, 155, 160)
+    for ot in ("put", "call")
+]
+
+
+def _ladder_market_data(url, data_type, payload):
+    return [
+        {"instrument_id": i, "delta": "0.5", "bid_price": "1.00"}
+        for i in payload["ids"].split(",")
+    ]
+
+
+def test_strike_prices_fetch_market_data_in_bulk():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.find_tradable_options.return_value = LADDER_INSTRUMENTS
+        mock_rh.request_get.side_effect = _ladder_market_data
+
+        contracts = service.get_options_chain(
+            "AAPL", "2026-03-20", strike_prices=["155", "145.00"]
+        )
+
+        assert [(c.strike, c.type) for c in contracts] == [
+            (145.0, "call"),
+            (145.0, "put"),
+            (155.0, "call"),
+            (155.0, "put"),
+        ]
+        assert all(c.delta == 0.5 and c.bid == 1.0 for c in contracts)
+        mock_rh.find_tradable_options.assert_called_once()
+        mock_rh.request_get.assert_called_once()
+        mock_rh.get_option_market_data.assert_not_called()
+
+
+def test_strikes_around_atm_picks_nearest_strikes():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.find_tradable_options.return_value = LADDER_INSTRUMENTS
+        mock_rh.request_get.side_effect = _ladder_market_data
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "AAPL", "last_trade_price": "151.00"}
+        ]
+
+        contracts = service.get_options_chain(
+            "AAPL", "2026-03-20", option_type="call", strikes_around_atm=3
+        )
+
+        assert sorted({c.strike for c in contracts}) == [145.0, 150.0, 155.0]
+
+
+def test_strike_ladder_chunks_market_data_requests():
+    from robinhood_core.services.options import MARKET_DATA_CHUNK_SIZE
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+    instruments = [
+        {"id": f"id-{i}", "strike_price": str(i), "type": "call"}
+        for i in range(MARKET_DATA_CHUNK_SIZE + 5)
+    ]
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.find_tradable_options.return_value = instruments
+        mock_rh.request_get.side_effect = _ladder_market_data
+
+        contracts = service.get_options_chain(
+            "AAPL",
+            "2026-03-20",
+            strike_prices=[str(i) for i in range(MARKET_DATA_CHUNK_SIZE + 5)],
+        )
+
+        assert len(contracts) == MARKET_DATA_CHUNK_SIZE + 5
+        assert mock_rh.request_get.call_count == 2
+
+
+def test_strikes_around_atm_must_be_positive():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+
+    with pytest.raises(InvalidArgumentError, match="strikes_around_atm"):
+        service.get_options_chain("AAPL", strikes_around_atm=0)
+
+
+def test_chain_listing_with_market_data_fetches_in_bulk():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = OptionsService(mock_client)
+    far_otm = {"id": "far", "strike_price": "200.00", "type": "call"}
+    near_money = {"id": "near", "strike_price": "100.00", "type": "call"}
+
+    with patch("robinhood_core.services.options.rh") as mock_rh:
+        mock_rh.find_tradable_options.return_value = [far_otm, near_money]
+        mock_rh.get_quotes.return_value = [
+            {"symbol": "TEST", "last_trade_price": "100.00"}
+        ]
+        mock_rh.request_get.side_effect = _ladder_market_data
+
+        contracts = service.get_options_chain(
+            "TEST", "2026-03-20", with_market_data=True
+        )
+
+        assert [(c.strike, c.delta, c.bid) for c in contracts] == [(100.0, 0.5, 1.0)]
+        mock_rh.request_get.assert_called_once()
+        assert mock_rh.request_get.call_args.args[2] == {"ids": "near"}
+        mock_rh.get_option_market_data.assert_not_called()
+
+
 # -- Tests: error handling ------------------------------------------
 
 
@@ -341,7 +527,7 @@ def test_api_error_wrapped():
 
     with patch("robinhood_core.services.options.rh") as mock_rh:
         mock_rh.find_tradable_options.side_effect = Exception("API Error")
-        mock_rh.get_latest_price.return_value = [None]
+        mock_rh.get_quotes.return_value = [None]
 
         with pytest.raises(RobinhoodAPIError, match="Failed to fetch options chain"):
             service.get_options_chain("AAPL", "2026-03-20")
@@ -1,3 +1,5 @@
+import base64
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -71,11 +73,66 @@ MOCK_CRYPTO_ORDER = {
 }
 
 
+AAPL_INSTRUMENT = {
+    "id": "abc",
+    "symbol": "AAPL",
+    "url": MOCK_STOCK_ORDER["instrument"],
+}
+
+
 def _make_service():
     client = MagicMock(spec=RobinhoodClient)
     return OrdersService(client), client
 
 
+def _serve_orders(
+    mock_rh,
+    stock=(),
+    option=(),
+    crypto=(),
+    page_size=None,
+    instruments=(),
+    failed_pages=(),
+):
+    """Serve order lists as pages through the patched ``rh.request_get``.
+
+    A list is split into pages of ``page_size``; an exception is raised
+    when its endpoint is requested.  Page numbers in ``failed_pages`` fail
+    to load.  ``instruments`` answer lookups by symbol.  Returns the list
+    of requested order URLs.
+    """
+    mock_rh.urls.orders_url.return_value = "stock"
+    mock_rh.urls.option_orders_url.return_value = "option"
+    mock_rh.urls.crypto_orders_url.return_value = "crypto"
+    mock_rh.urls.instruments_url.return_value = "instruments"
+    served = {"stock": stock, "option": option, "crypto": crypto}
+    by_symbol = {item["symbol"]: item for item in instruments}
+    requested = []
+
+    def request_get(url, data_type="regular", payload=None):
+        if url == "instruments" and data_type == "indexzero":
+            return by_symbol.get(payload["symbol"])
+        name, _, page = str(url).partition("?page=")
+        if name not in served:
+            return None
+        requested.append(url)
+        orders = served[name]
+        if isinstance(orders, Exception):
+            raise orders
+        if orders is None or int(page or 0) in failed_pages:
+            return None
+        size = page_size or max(len(orders), 1)
+        start = int(page or 0) * size
+        more = start + size < len(orders)
+        return {
+            "results": list(orders[start : start + size]),
+            "next": f"{name}?page={int(page or 0) + 1}" if more else None,
+        }
+
+    mock_rh.request_get.side_effect = request_get
+    return requested
+
+
 class TestInit:
     def test_service_initialization(self):
         service, client = _make_service()
@@ -86,9 +143,7 @@ class TestGetOrderHistory:
     def test_calls_ensure_session(self):
         service, client = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
-            mock_rh.get_all_option_orders.return_value = []
-            mock_rh.get_all_crypto_orders.return_value = []
+            _serve_orders(mock_rh)
             service.get_order_history()
             client.ensure_session.assert_called_once()
 
@@ -97,12 +152,20 @@ class TestGetOrderHistory:
         with pytest.raises(InvalidArgumentError, match="Invalid order type"):
             service.get_order_history(order_type="invalid")
 
+    def test_invalid_limit_raises(self):
+        service, _ = _make_service()
+        with pytest.raises(InvalidArgumentError, match="limit"):
+            service.get_order_history(limit=0)
+
     def test_all_types_returned(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
-            mock_rh.get_all_crypto_orders.return_value = [MOCK_CRYPTO_ORDER]
+            _serve_orders(
+                mock_rh,
+                stock=[MOCK_STOCK_ORDER],
+                option=[MOCK_OPTION_ORDER],
+                crypto=[MOCK_CRYPTO_ORDER],
+            )
             mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
             history = service.get_order_history()
@@ -114,7 +177,7 @@ class TestGetOrderHistory:
     def test_stock_only(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+            requested = _serve_orders(mock_rh, stock=[MOCK_STOCK_ORDER])
             mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
             history = service.get_order_history(order_type="stock")
@@ -122,13 +185,12 @@ class TestGetOrderHistory:
             assert len(history.stock_orders) == 1
             assert history.option_orders == []
             assert history.crypto_orders == []
-            mock_rh.get_all_option_orders.assert_not_called()
-            mock_rh.get_all_crypto_orders.assert_not_called()
+            assert requested == ["stock"]
 
     def test_option_only(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
+            _serve_orders(mock_rh, option=[MOCK_OPTION_ORDER])
 
             history = service.get_order_history(order_type="option")
 
@@ -139,7 +201,7 @@ class TestGetOrderHistory:
     def test_crypto_only(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_crypto_orders.return_value = [MOCK_CRYPTO_ORDER]
+            _serve_orders(mock_rh, crypto=[MOCK_CRYPTO_ORDER])
 
             history = service.get_order_history(order_type="crypto")
 
@@ -150,54 +212,265 @@ class TestGetOrderHistory:
     def test_none_defaults_to_all(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
-            mock_rh.get_all_option_orders.return_value = []
-            mock_rh.get_all_crypto_orders.return_value = []
+            requested = _serve_orders(mock_rh)
 
             service.get_order_history(order_type=None)
 
-            mock_rh.get_all_stock_orders.assert_called_once()
-            mock_rh.get_all_option_orders.assert_called_once()
-            mock_rh.get_all_crypto_orders.assert_called_once()
+            assert sorted(requested) == ["crypto", "option", "stock"]
 
 
-class TestStockOrders:
-    def test_symbol_filter(self):
+class TestPagination:
+    ORDERS = [
+        {**MOCK_OPTION_ORDER, "id": f"option-{i:03d}", "chain_symbol": symbol}
+        for i, symbol in enumerate(["AAPL", "MSFT"] * 10)
+    ]
+
+    def test_follows_next_pages(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS, page_size=3)
+
+            history = service.get_order_history(order_type="option")
+
+            assert [o.id for o in history.option_orders] == [
+                o["id"] for o in self.ORDERS
+            ]
+            assert len(requested) == 7
+
+    def test_limit_stops_paging_early(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS, page_size=3)
+
+            history = service.get_order_history(order_type="option", limit=4)
+
+            assert [o.id for o in history.option_orders] == [
+                "option-000",
+                "option-001",
+                "option-002",
+                "option-003",
+            ]
+            assert requested == ["option", "option?page=1"]
+
+    def test_limit_counts_rows_after_symbol_filter(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS, page_size=3)
+
+            history = service.get_order_history(
+                order_type="option", symbol="MSFT", limit=3
+            )
+
+            assert [o.id for o in history.option_orders] == [
+                "option-001",
+                "option-003",
+                "option-005",
+            ]
+            assert len(requested) == 2
+
+    def test_limit_applies_per_category(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+            _serve_orders(
+                mock_rh,
+                stock=[MOCK_STOCK_ORDER] * 3,
+                option=self.ORDERS,
+                crypto=[MOCK_CRYPTO_ORDER] * 3,
+            )
             mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
+            history = service.get_order_history(limit=2)
+
+            assert len(history.stock_orders) == 2
+            assert len(history.option_orders) == 2
+            assert len(history.crypto_orders) == 2
+
+
+class TestCursor:
+    ORDERS = [
+        {
+            **MOCK_OPTION_ORDER,
+            "id": f"option-{i:03d}",
+            "created_at": f"2026-01-{31 - i:02d}T10:00:00Z",
+            "state": "filled" if i % 2 else "cancelled",
+        }
+        for i in range(12)
+    ]
+
+    def test_cursor_walks_every_page(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, option=self.ORDERS, page_size=5)
+
+            seen, cursor = [], None
+            for _ in range(5):
+                history = service.get_order_history(
+                    order_type="option", limit=5, cursor=cursor
+                )
+                seen += [o.id for o in history.option_orders]
+                cursor = history.next_cursor
+                if cursor is None:
+                    break
+
+            assert seen == [o["id"] for o in self.ORDERS]
+
+    def test_cursor_resumes_from_robinhood_page(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS, page_size=5)
+
+            first = service.get_order_history(order_type="option", limit=7)
+            requested.clear()
+            second = service.get_order_history(
+                order_type="option", limit=2, cursor=first.next_cursor
+            )
+
+            assert [o.id for o in second.option_orders] == ["option-007", "option-008"]
+            assert requested == ["option?page=1"]
+
+    def test_cursor_at_page_end_starts_next_page(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS, page_size=5)
+
+            first = service.get_order_history(order_type="option", limit=5)
+            requested.clear()
+            second = service.get_order_history(
+                order_type="option", limit=1, cursor=first.next_cursor
+            )
+
+            assert [o.id for o in second.option_orders] == ["option-005"]
+            assert requested == ["option?page=1"]
+
+    def test_no_cursor_when_limit_ends_history(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, option=self.ORDERS, page_size=5)
+
+            history = service.get_order_history(order_type="option", limit=12)
+
+            assert len(history.option_orders) == 12
+            assert history.next_cursor is None
+
+    def test_cursor_for_another_endpoint_raises(self):
+        service, _ = _make_service()
+        cursor = base64.urlsafe_b64encode(
+            json.dumps({"option": {"page": ["https://evil.test/option", 0]}}).encode()
+        ).decode()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, option=self.ORDERS)
+
+            with pytest.raises(InvalidArgumentError, match="cursor"):
+                service.get_order_history(order_type="option", cursor=cursor)
+            assert requested == []
+
+    def test_no_cursor_when_everything_fits(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, option=self.ORDERS)
+
+            history = service.get_order_history(order_type="option", limit=20)
+
+            assert len(history.option_orders) == 12
+            assert history.next_cursor is None
+
+    def test_finished_categories_are_dropped_from_cursor(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(
+                mock_rh, option=self.ORDERS, crypto=[MOCK_CRYPTO_ORDER]
+            )
+
+            first = service.get_order_history(limit=5)
+            requested.clear()
+            second = service.get_order_history(limit=5, cursor=first.next_cursor)
+
+            assert len(first.crypto_orders) == 1
+            assert second.crypto_orders == []
+            assert [o.id for o in second.option_orders] == [
+                o["id"] for o in self.ORDERS[5:10]
+            ]
+            assert requested == ["option"]
+
+    def test_end_date_and_state_filters(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, option=self.ORDERS)
+
+            history = service.get_order_history(
+                order_type="option", end_date="2026-01-27", state="filled"
+            )
+
+            assert [o.id for o in history.option_orders] == [
+                "option-005",
+                "option-007",
+                "option-009",
+                "option-011",
+            ]
+
+    def test_invalid_cursor_raises(self):
+        service, _ = _make_service()
+        with pytest.raises(InvalidArgumentError, match="cursor"):
+            service.get_order_history(cursor="not-a-cursor")
+
+
+class TestStockOrders:
+    def test_unknown_symbol_skips_order_download(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(
+                mock_rh, stock=[MOCK_STOCK_ORDER], instruments=[AAPL_INSTRUMENT]
+            )
+
             history = service.get_order_history(order_type="stock", symbol="MSFT")
 
             assert len(history.stock_orders) == 0
+            assert requested == []
 
     def test_symbol_filter_matches(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+            _serve_orders(
+                mock_rh, stock=[MOCK_STOCK_ORDER], instruments=[AAPL_INSTRUMENT]
+            )
 
-            history = service.get_order_history(order_type="stock", symbol="AAPL")
+            history = service.get_order_history(order_type="stock", symbol="aapl")
 
             assert len(history.stock_orders) == 1
             assert history.stock_orders[0].symbol == "AAPL"
+            mock_rh.get_instrument_by_url.assert_not_called()
+
+    def test_symbol_filter_sent_as_instrument(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(
+                mock_rh, stock=[MOCK_STOCK_ORDER], instruments=[AAPL_INSTRUMENT]
+            )
+
+            service.get_order_history(order_type="stock", symbol="AAPL")
+            service.get_order_history(order_type="stock", symbol="AAPL")
+
+            calls = mock_rh.request_get.call_args_list
+            lookups = [c for c in calls if c.args[:2] == ("instruments", "indexzero")]
+            pages = [c for c in calls if c.args[0] == "stock"]
+            assert len(lookups) == 1
+            assert [c.args[2] for c in pages] == [
+                {"instrument": AAPL_INSTRUMENT["url"]}
+            ] * 2
 
     def test_start_date_passed_through(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
+            _serve_orders(mock_rh)
 
             service.get_order_history(order_type="stock", start_date="2026-01-01")
 
-            mock_rh.get_all_stock_orders.assert_called_once_with(
-                start_date="2026-01-01"
-            )
+            mock_rh.urls.orders_url.assert_called_once_with(start_date="2026-01-01")
 
     def test_execution_parsing(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+            _serve_orders(mock_rh, stock=[MOCK_STOCK_ORDER])
             mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
             history = service.get_order_history(order_type="stock")
@@ -210,7 +483,7 @@ class TestStockOrders:
     def test_skips_none_items(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [None, MOCK_STOCK_ORDER, None]
+            _serve_orders(mock_rh, stock=[None, MOCK_STOCK_ORDER, None])
             mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
             history = service.get_order_history(order_type="stock")
@@ -220,18 +493,30 @@ class TestStockOrders:
     def test_empty_response(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = None
+            _serve_orders(mock_rh, stock=[])
 
             history = service.get_order_history(order_type="stock")
 
             assert history.stock_orders == []
 
+    def test_failed_page_is_an_error_not_the_end_of_history(self):
+        service, _ = _make_service()
+        orders = [
+            {**MOCK_STOCK_ORDER, "id": f"o{i}", "created_at": f"2026-01-0{9 - i}"}
+            for i in range(4)
+        ]
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, stock=orders, page_size=2, failed_pages=(1,))
+
+            with pytest.raises(RobinhoodAPIError, match="orders page"):
+                service.get_order_history(order_type="stock")
+
 
 class TestOptionOrders:
     def test_symbol_filter(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
+            _serve_orders(mock_rh, option=[MOCK_OPTION_ORDER])
 
             history = service.get_order_history(order_type="option", symbol="MSFT")
 
@@ -240,7 +525,7 @@ class TestOptionOrders:
     def test_symbol_filter_matches(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
+            _serve_orders(mock_rh, option=[MOCK_OPTION_ORDER])
 
             history = service.get_order_history(order_type="option", symbol="AAPL")
 
@@ -250,11 +535,11 @@ class TestOptionOrders:
     def test_start_date_passed_through(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = []
+            _serve_orders(mock_rh)
 
             service.get_order_history(order_type="option", start_date="2026-01-01")
 
-            mock_rh.get_all_option_orders.assert_called_once_with(
+            mock_rh.urls.option_orders_url.assert_called_once_with(
                 start_date="2026-01-01"
             )
 
@@ -263,20 +548,103 @@ class TestCryptoOrders:
     def test_start_date_not_passed(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_crypto_orders.return_value = []
+            _serve_orders(mock_rh)
 
             service.get_order_history(order_type="crypto", start_date="2026-01-01")
 
-            mock_rh.get_all_crypto_orders.assert_called_once_with()
+            mock_rh.urls.crypto_orders_url.assert_called_once_with()
+
+    def test_start_date_stops_paging(self):
+        service, _ = _make_service()
+        orders = [
+            {**MOCK_CRYPTO_ORDER, "id": f"c{day}", "created_at": f"2026-01-{day:02d}"}
+            for day in range(20, 0, -1)
+        ]
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            requested = _serve_orders(mock_rh, crypto=orders, page_size=5)
+
+            history = service.get_order_history(
+                order_type="crypto", start_date="2026-01-14"
+            )
+
+            assert [o.id for o in history.crypto_orders] == [
+                f"c{day}" for day in range(20, 13, -1)
+            ]
+            assert len(requested) == 2
+
+    def test_currency_pair_resolved_to_symbol(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(mock_rh, crypto=[MOCK_CRYPTO_ORDER] * 2)
+            mock_rh.get_crypto_currency_pairs.return_value = [
+                {"id": "btc-usd", "symbol": "BTC-USD"}
+            ]
+
+            first = service.get_order_history(order_type="crypto")
+            second = service.get_order_history(order_type="crypto")
+
+            symbols = [o.symbol for o in first.crypto_orders + second.crypto_orders]
+            assert symbols == ["BTC-USD"] * 4
+            mock_rh.get_crypto_currency_pairs.assert_called_once()
 
 
 class TestErrorHandling:
     def test_api_error_wrapped(self):
         service, _ = _make_service()
         with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.side_effect = Exception("API Error")
+            _serve_orders(mock_rh, stock=Exception("API Error"))
 
             with pytest.raises(
                 RobinhoodAPIError, match="Failed to fetch order history"
             ):
                 service.get_order_history(order_type="stock")
+
+    def test_failed_category_does_not_discard_others(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(
+                mock_rh,
+                stock=Exception("stock down"),
+                option=[MOCK_OPTION_ORDER],
+                crypto=[MOCK_CRYPTO_ORDER],
+            )
+
+            history = service.get_order_history()
+
+            assert history.stock_orders == []
+            assert len(history.option_orders) == 1
+            assert len(history.crypto_orders) == 1
+            assert history.errors == {"stock": "stock down"}
+
+    def test_all_categories_failing_raises(self):
+        service, _ = _make_service()
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            _serve_orders(
+                mock_rh,
+                stock=Exception("down"),
+                option=Exception("down"),
+                crypto=Exception("down"),
+            )
+
+            with pytest.raises(
+                RobinhoodAPIError, match="Failed to fetch order history"
+            ):
+                service.get_order_history()
+
+    def test_categories_fetched_concurrently(self):
+        import threading
+
+        service, _ = _make_service()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def request_get(url, data_type="regular", payload=None):
+            # Deadlocks (and times out) unless all three run at once
+            barrier.wait()
+            return {"results": [], "next": None}
+
+        with patch("robinhood_core.services.orders.rh") as mock_rh:
+            mock_rh.request_get.side_effect = request_get
+
+            history = service.get_order_history()
+
+            assert history.errors == {}
@@ -229,3 +229,159 @@ def test_get_positions_api_error(mock_rh):
 
     with pytest.raises(RobinhoodAPIError, match="Failed to fetch positions"):
         service.get_positions()
+
+
+@patch("robinhood_core.services.portfolio.rh")
+def test_get_positions_concurrent_lookups_keep_order(mock_rh):
+    import threading
+    import time
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = PortfolioService(mock_client, lookup_workers=4)
+
+    mock_rh.get_open_stock_positions.return_value = [
+        {
+            "instrument": f"https://api.robinhood.com/instruments/{i}/",
+            "quantity": "1.0000",
+            "average_buy_price": "10.00",
+        }
+        for i in range(8)
+    ]
+
+    threads = set()
+
+    def mock_get_instrument(url):
+        threads.add(threading.get_ident())
+        index = int(url.rstrip("/").split("/")[-1])
+        # Earlier positions resolve last
+        time.sleep(0.01 * (8 - index))
+        return {"symbol": f"SYM{index}"}
+
+    mock_rh.get_instrument_by_url.side_effect = mock_get_instrument
+    mock_rh.get_quotes.return_value = []
+
+    positions = service.get_positions()
+
+    assert [p.symbol for p in positions] == [f"SYM{i}" for i in range(8)]
+    assert 1 < len(threads) <= 4
+    mock_rh.get_quotes.assert_called_once_with([f"SYM{i}" for i in range(8)])
+
+
+@patch("robinhood_core.services.portfolio.rh")
+def test_get_positions_resolves_instruments_in_one_bulk_request(mock_rh, cache_rh):
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = PortfolioService(mock_client)
+
+    mock_rh.get_open_stock_positions.return_value = [
+        {
+            "instrument": f"https://api.robinhood.com/instruments/id-{i}/",
+            "quantity": "1.0000",
+            "average_buy_price": "10.00",
+        }
+        for i in range(3)
+    ]
+    cache_rh.request_get.return_value = [
+        {"id": f"id-{i}", "symbol": f"SYM{i}"} for i in range(3)
+    ]
+    mock_rh.get_quotes.return_value = []
+
+    positions = service.get_positions()
+
+    assert [p.symbol for p in positions] == ["SYM0", "SYM1", "SYM2"]
+    cache_rh.request_get.assert_called_once()
+    assert cache_rh.request_get.call_args[0][2] == {"ids": "id-0,id-1,id-2"}
+    mock_rh.get_instrument_by_url.assert_not_called()
+
+
+@patch("robinhood_core.services.options.rh")
+@patch("robinhood_core.services.portfolio.rh")
+def test_get_snapshot_fetches_everything_concurrently(mock_rh, options_rh, cache_rh):
+    import threading
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = PortfolioService(mock_client)
+    # Deadlocks (and times out) unless all four fetches run at once
+    barrier = threading.Barrier(4, timeout=5)
+
+    def after_barrier(value):
+        def fetch(*args, **kwargs):
+            barrier.wait()
+            return value
+
+        return fetch
+
+    mock_rh.load_portfolio_profile.side_effect = after_barrier(
+        {"equity": "10000", "equity_previous_close": "9900"}
+    )
+    mock_rh.load_account_profile.side_effect = after_barrier(
+        {"cash": "500", "buying_power": "1000"}
+    )
+    mock_rh.get_open_stock_positions.side_effect = after_barrier(
+        [
+            {
+                "instrument": "https://api.robinhood.com/instruments/id-0/",
+                "quantity": "10",
+                "average_buy_price": "100",
+            }
+        ]
+    )
+    cache_rh.request_get.return_value = [{"id": "id-0", "symbol": "AAPL"}]
+    mock_rh.get_quotes.return_value = [{"symbol": "AAPL", "last_trade_price": "110"}]
+    options_rh.get_open_option_positions.side_effect = after_barrier(
+        [
+            {
+                "option": "https://api.robinhood.com/options/instruments/opt-1/",
+                "chain_symbol": "AAPL",
+                "type": "long",
+                "quantity": "1",
+                "average_price": "150",
+            }
+        ]
+    )
+    options_rh.get_option_instrument_data_by_id.return_value = {
+        "strike_price": "120.0000",
+        "expiration_date": "2999-01-15",
+        "type": "call",
+    }
+
+    snapshot = service.get_snapshot()
+
+    mock_client.ensure_session.assert_called()
+    mock_rh.get_quotes.assert_called_once_with(["AAPL"])
+    assert snapshot.summary.day_change == pytest.approx(100.0)
+    assert [p.symbol for p in snapshot.positions] == ["AAPL"]
+    assert snapshot.positions[0].market_value == pytest.approx(1100.0)
+    assert snapshot.option_positions[0].strike_price == 120.0
+    assert snapshot.option_positions[0].option_type == "call"
+
+
+@patch("robinhood_core.services.portfolio.rh")
+def test_get_snapshot_uses_injected_options_service(mock_rh):
+    mock_client = MagicMock(spec=RobinhoodClient)
+    options_service = MagicMock()
+    options_service.get_option_positions.return_value = []
+    service = PortfolioService(mock_client, options_service=options_service)
+
+    mock_rh.load_portfolio_profile.return_value = {"equity": "100"}
+    mock_rh.load_account_profile.return_value = {"cash": "0", "buying_power": "0"}
+    mock_rh.get_open_stock_positions.return_value = []
+
+    snapshot = service.get_snapshot()
+
+    options_service.get_option_positions.assert_called_once_with()
+    assert snapshot.option_positions == []
+
+
+@patch("robinhood_core.services.options.rh")
+@patch("robinhood_core.services.portfolio.rh")
+def test_get_snapshot_api_error(mock_rh, options_rh):
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = PortfolioService(mock_client)
+
+    mock_rh.load_portfolio_profile.side_effect = Exception("API Error")
+    options_rh.get_open_option_positions.return_value = []
+
+    from robinhood_core.errors import RobinhoodAPIError
+
+    with pytest.raises(RobinhoodAPIError, match="portfolio snapshot"):
+        service.get_snapshot()
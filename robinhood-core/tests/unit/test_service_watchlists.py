@@ -32,7 +32,11 @@ def test_get_watchlists_parses_results_dict():
                 {"instrument": "https://api.robinhood.com/instruments/inst3/"},
             ],
         ]
-        mock_rh.get_symbol_by_url.side_effect = ["AAPL", "GOOGL", "MSFT"]
+        mock_rh.get_instrument_by_url.side_effect = [
+            {"symbol": "AAPL"},
+            {"symbol": "GOOGL"},
+            {"symbol": "MSFT"},
+        ]
 
         watchlists = service.get_watchlists()
 
@@ -123,3 +127,29 @@ def test_get_watchlist_symbols_with_no_instruments():
 
         assert len(watchlists) == 1
         assert watchlists[0].symbols == []
+
+
+def test_get_watchlist_symbols_from_results_page(cache_rh):
+    """get_watchlist_by_name returns the raw page; ids are resolved in bulk."""
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = WatchlistsService(mock_client)
+
+    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
+        mock_rh.get_all_watchlists.return_value = {
+            "results": [{"id": "abc-123", "display_name": "Tech"}]
+        }
+        mock_rh.get_watchlist_by_name.return_value = {
+            "results": [
+                {"instrument": "https://api.robinhood.com/instruments/inst1/"},
+                {"instrument": "https://api.robinhood.com/instruments/inst2/"},
+            ]
+        }
+        cache_rh.request_get.return_value = [
+            {"id": "inst2", "symbol": "MSFT"},
+            {"id": "inst1", "symbol": "AAPL"},
+        ]
+
+        watchlists = service.get_watchlists()
+
+        assert watchlists[0].symbols == ["AAPL", "MSFT"]
+        mock_rh.get_instrument_by_url.assert_not_called()
@@ -5,12 +5,23 @@ import argparse
 import asyncio
 import json
 import logging
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
+from robinhood_core.cache import (
+    InstrumentCache,
+    OptionInstrumentCache,
+    QuoteBatcher,
+    QuoteCache,
+)
+from robinhood_core.candles import CandleStore
+from robinhood_core.journal import OrderJournal
+from robinhood_core.policy import CallPolicy
+from robinhood_core.ratelimit import RateLimiter
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -39,6 +50,19 @@ news_service: NewsService  # type: ignore[assignment]
 fundamentals_service: FundamentalsService  # type: ignore[assignment]
 orders_service: OrdersService  # type: ignore[assignment]
 
+# Default number of tool calls allowed to run at once.
+DEFAULT_MAX_CONCURRENT_TOOLS = 8
+
+# Orders per category returned by one robinhood.orders.history call.
+ORDER_HISTORY_DEFAULT_LIMIT = 50
+ORDER_HISTORY_MAX_LIMIT = 200
+
+# Limits concurrent tool calls; replaced by _init_services().
+tool_slots = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_TOOLS)
+
+# Tool calls currently running, keyed by _call_key().
+_inflight: Dict[Tuple[str, str], "asyncio.Future[List[TextContent]]"] = {}
+
 logger = logging.getLogger(__name__)
 
 # Create MCP server
@@ -50,23 +74,67 @@ def _init_services(
     password: Optional[str] = None,
     session_path: Optional[str] = None,
     allow_mfa: Optional[bool] = None,
+    max_concurrent_tools: Optional[int] = None,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    keep_alive: Optional[bool] = None,
+    gzip: Optional[bool] = None,
+    order_journal: Optional[bool] = None,
 ):
     """Initialize client and services. Args override env vars."""
-    global client, market_service, options_service, portfolio_service, watchlists_service, news_service, fundamentals_service, orders_service
+    global client, market_service, options_service, portfolio_service, watchlists_service, news_service, fundamentals_service, orders_service, tool_slots
+
+    if max_concurrent_tools is None:
+        max_concurrent_tools = int(
+            os.getenv("RH_MAX_CONCURRENT_TOOLS", DEFAULT_MAX_CONCURRENT_TOOLS)
+        )
+    tool_slots = asyncio.Semaphore(max(1, max_concurrent_tools))
+    if order_journal is None:
+        order_journal = os.getenv("RH_ORDER_JOURNAL", "0") == "1"
 
     client = RobinhoodClient(
         username=username,
         password=password,
         session_path=session_path,
         allow_mfa=allow_mfa,
+        rate_limiter=RateLimiter(),
+        call_policy=CallPolicy(),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        keep_alive=keep_alive,
+        gzip=gzip,
+    )
+    # One instrument cache shared by every service that resolves instrument URLs.
+    instrument_cache = InstrumentCache.open(client.session_dir)
+    # One quote cache so market, options, and portfolio calls share batches;
+    # misses from concurrent tool calls are merged into one get_quotes call.
+    quote_cache = QuoteCache(batcher=QuoteBatcher())
+    market_service = MarketDataService(
+        client,
+        quote_cache=quote_cache,
+        candle_store=CandleStore.open(client.session_dir),
+    )
+    options_service = OptionsService(
+        client,
+        option_instrument_cache=OptionInstrumentCache.open(client.session_dir),
+        quote_cache=quote_cache,
     )
-    market_service = MarketDataService(client)
-    options_service = OptionsService(client)
-    portfolio_service = PortfolioService(client)
-    watchlists_service = WatchlistsService(client)
+    portfolio_service = PortfolioService(
+        client,
+        instrument_cache=instrument_cache,
+        quote_cache=quote_cache,
+        options_service=options_service,
+    )
+    watchlists_service = WatchlistsService(client, instrument_cache=instrument_cache)
     news_service = NewsService(client)
     fundamentals_service = FundamentalsService(client)
-    orders_service = OrdersService(client)
+    # Without the journal each call pages through Robinhood and stops at
+    # its limit; with it, calls after the first sync fetch only changes.
+    orders_service = OrdersService(
+        client,
+        instrument_cache=instrument_cache,
+        journal=OrderJournal.open(client.session_dir) if order_journal else None,
+    )
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -98,6 +166,51 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Enable MFA fallback (overrides RH_ALLOW_MFA env var)",
     )
+    parser.add_argument(
+        "--max-concurrent-tools",
+        type=int,
+        default=None,
+        help=(
+            "Maximum tool calls run at once "
+            f"(overrides RH_MAX_CONCURRENT_TOOLS env var, default "
+            f"{DEFAULT_MAX_CONCURRENT_TOOLS})"
+        ),
+    )
+    parser.add_argument(
+        "--pool-connections",
+        type=int,
+        default=None,
+        help="HTTP connection pools to keep (overrides RH_POOL_CONNECTIONS env var)",
+    )
+    parser.add_argument(
+        "--pool-maxsize",
+        type=int,
+        default=None,
+        help="Connections kept per host (overrides RH_POOL_MAXSIZE env var)",
+    )
+    parser.add_argument(
+        "--no-keep-alive",
+        dest="keep_alive",
+        action="store_false",
+        default=None,
+        help="Close connections after each request (overrides RH_KEEP_ALIVE env var)",
+    )
+    parser.add_argument(
+        "--no-gzip",
+        dest="gzip",
+        action="store_false",
+        default=None,
+        help="Request uncompressed responses (overrides RH_GZIP env var)",
+    )
+    parser.add_argument(
+        "--order-journal",
+        action="store_true",
+        default=None,
+        help=(
+            "Keep a local order journal in the session directory "
+            "(overrides RH_ORDER_JOURNAL env var)"
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -170,7 +283,8 @@ async def list_tools() -> List[Tool]:
                 "Get options chain for a symbol. This tool has TWO data tiers depending on whether strike_price is provided:\n\n"
                 "TIER 1 — Chain listing (strike_price OMITTED): Returns a list of option contracts near the money (±20%% of current price) "
                 "with basic instrument data: strike, type (call/put), expiration. Does NOT include bid/ask, Greeks, or market data. "
-                "This is fast — use it to browse available strikes.\n\n"
+                "This is fast — use it to browse available strikes. Set with_market_data=true to fill in bid/ask and Greeks for every listed "
+                "contract, fetched in bulk.\n\n"
                 "TIER 2 — Targeted lookup (strike_price PROVIDED): Returns 1-2 contracts with FULL market data including: "
                 "bid/ask, mark price, last trade price, open interest, volume, implied volatility, all Greeks "
                 "(delta, gamma, theta, vega, rho), and chance of profit (long/short). This is the ONLY way to get Greeks from Robinhood.\n\n"
@@ -178,7 +292,9 @@ async def list_tools() -> List[Tool]:
                 "  Step 1: Call with just symbol (and optionally expiration_date + option_type) to see available strikes.\n"
                 "  Step 2: Pick a strike from the results.\n"
                 "  Step 3: Call again with symbol + expiration_date + strike_price (+ option_type) to get full Greeks and market data.\n\n"
-                "IMPORTANT: If you need Greeks, bid/ask, or IV — you MUST provide strike_price. Without it you only get strike/type/expiration.\n"
+                "LADDERS: To get Greeks for several strikes in ONE call, pass strike_prices (a list) or strikes_around_atm (N strikes "
+                "nearest the current price) instead of strike_price. Market data is fetched in bulk, so prefer this over repeated calls.\n\n"
+                "IMPORTANT: If you need Greeks, bid/ask, or IV — you MUST provide strike_price, strike_prices, or strikes_around_atm, or set with_market_data. Without them you only get strike/type/expiration.\n"
                 "NOTE: expiration_date defaults to nearest available expiration if omitted."
             ),
             inputSchema={
@@ -200,6 +316,19 @@ async def list_tools() -> List[Tool]:
                         "type": "string",
                         "description": "Specific strike price (e.g., '150.00'). CRITICAL: When provided, switches to targeted lookup mode which returns full market data including bid/ask, Greeks (delta/gamma/theta/vega/rho), IV, and profit probability. Without this, only basic strike/type/expiration data is returned.",
                     },
+                    "strike_prices": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Several strike prices (e.g., ['145', '150', '155']). Returns full market data and Greeks for every listed strike in one call.",
+                    },
+                    "strikes_around_atm": {
+                        "type": "integer",
+                        "description": "Number of strikes closest to the current price to return with full market data and Greeks (e.g., 10).",
+                    },
+                    "with_market_data": {
+                        "type": "boolean",
+                        "description": "Chain listing only: include bid/ask, Greeks and IV for every near-the-money contract. Defaults to false.",
+                    },
                 },
                 "required": ["symbol"],
             },
@@ -219,6 +348,15 @@ async def list_tools() -> List[Tool]:
             description="Get portfolio summary",
             inputSchema={"type": "object", "properties": {}},
         ),
+        Tool(
+            name="robinhood.portfolio.snapshot",
+            description=(
+                "Get the portfolio summary, stock positions and option positions in one call. "
+                "Everything is fetched concurrently, so prefer this over calling robinhood.portfolio.summary, "
+                "robinhood.portfolio.positions and robinhood.options.positions one after another."
+            ),
+            inputSchema={"type": "object", "properties": {}},
+        ),
         Tool(
             name="robinhood.portfolio.positions",
             description="Get portfolio positions",
@@ -273,7 +411,12 @@ async def list_tools() -> List[Tool]:
         ),
         Tool(
             name="robinhood.orders.history",
-            description="Get order history for stocks, options, and/or crypto. Returns past trades with execution details, prices, quantities, and timestamps.",
+            description=(
+                "Get order history for stocks, options, and/or crypto. Returns past trades with execution details, prices, quantities, and timestamps.\n\n"
+                f"Orders are returned newest first, at most `limit` per category (default {ORDER_HISTORY_DEFAULT_LIMIT}, max {ORDER_HISTORY_MAX_LIMIT}). "
+                "When more orders may exist the response includes next_cursor; call again with the same arguments plus cursor=next_cursor "
+                "to get the next page. next_cursor is null on the last page."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -288,7 +431,23 @@ async def list_tools() -> List[Tool]:
                     },
                     "start_date": {
                         "type": "string",
-                        "description": "Start date filter in YYYY-MM-DD format. Returns orders from this date to now.",
+                        "description": "Start date filter in YYYY-MM-DD format. Returns stock and option orders updated on or after this date, and crypto orders created on or after it.",
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "End date filter in YYYY-MM-DD format. Returns orders created on or before this date.",
+                    },
+                    "state": {
+                        "type": "string",
+                        "description": "Only orders in this state, e.g. 'filled', 'cancelled', 'queued'.",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": f"Maximum orders per category (default {ORDER_HISTORY_DEFAULT_LIMIT}, max {ORDER_HISTORY_MAX_LIMIT}).",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous response, to fetch the next page. Pass the same filters as before.",
                     },
                 },
             },
@@ -296,168 +455,211 @@ async def list_tools() -> List[Tool]:
     ]
 
 
-@mcp.call_tool()
-async def call_tool(name: str, arguments: dict) -> List[TextContent]:
-    """Handle tool calls."""
-    assert client is not None, "Services not initialized. Call _init_services() first."
-    assert market_service is not None
-    assert options_service is not None
-    assert portfolio_service is not None
-    assert watchlists_service is not None
-    assert news_service is not None
-    assert fundamentals_service is not None
+def _run_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Run one tool call synchronously.  Called on a worker thread."""
+    if name == "robinhood.market.current_price":
+        symbols = arguments["symbols"]
+        quotes = market_service.get_current_price(symbols)
+        return [
+            TextContent(
+                type="text", text=json.dumps([q.model_dump() for q in quotes])
+            )
+        ]
 
-    logger.debug("Tool called: %s", name)
+    elif name == "robinhood.market.price_history":
+        symbol = arguments["symbol"]
+        interval = arguments.get("interval", "hour")
+        span = arguments.get("span", "week")
+        bounds = arguments.get("bounds", "regular")
+        candles = market_service.get_price_history(
+            symbol,
+            interval,
+            span,
+            bounds,
+        )
+        return [
+            TextContent(
+                type="text", text=json.dumps([c.model_dump() for c in candles])
+            )
+        ]
 
-    try:
-        if name == "robinhood.market.current_price":
-            symbols = arguments["symbols"]
-            quotes = await asyncio.to_thread(
-                market_service.get_current_price, symbols
+    elif name == "robinhood.market.quote":
+        symbols = arguments["symbols"]
+        quotes = market_service.get_current_price(symbols)
+        return [
+            TextContent(
+                type="text", text=json.dumps([q.model_dump() for q in quotes])
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([q.model_dump() for q in quotes])
-                )
-            ]
+        ]
 
-        elif name == "robinhood.market.price_history":
-            symbol = arguments["symbol"]
-            interval = arguments.get("interval", "hour")
-            span = arguments.get("span", "week")
-            bounds = arguments.get("bounds", "regular")
-            candles = await asyncio.to_thread(
-                market_service.get_price_history,
-                symbol,
-                interval,
-                span,
-                bounds,
+    elif name == "robinhood.options.chain":
+        symbol = arguments["symbol"]
+        expiration_date = arguments.get("expiration_date")
+        option_type = arguments.get("option_type")
+        strike_price = arguments.get("strike_price")
+        strike_prices = arguments.get("strike_prices")
+        strikes_around_atm = arguments.get("strikes_around_atm")
+        with_market_data = arguments.get("with_market_data", False)
+        contracts = options_service.get_options_chain(
+            symbol,
+            expiration_date,
+            option_type,
+            strike_price,
+            strike_prices,
+            strikes_around_atm,
+            with_market_data,
+        )
+        return [
+            TextContent(
+                type="text", text=json.dumps([c.model_dump() for c in contracts])
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([c.model_dump() for c in candles])
-                )
-            ]
+        ]
 
-        elif name == "robinhood.market.quote":
-            symbols = arguments["symbols"]
-            quotes = await asyncio.to_thread(
-                market_service.get_current_price, symbols
+    elif name == "robinhood.options.positions":
+        positions = options_service.get_option_positions()
+        return [
+            TextContent(
+                type="text", text=json.dumps([p.model_dump() for p in positions])
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([q.model_dump() for q in quotes])
-                )
-            ]
+        ]
+
+    elif name == "robinhood.portfolio.summary":
+        summary = portfolio_service.get_portfolio_summary()
+        return [TextContent(type="text", text=json.dumps(summary.model_dump()))]
+
+    elif name == "robinhood.portfolio.snapshot":
+        snapshot = portfolio_service.get_snapshot()
+        return [TextContent(type="text", text=json.dumps(snapshot.model_dump()))]
 
-        elif name == "robinhood.options.chain":
-            symbol = arguments["symbol"]
-            expiration_date = arguments.get("expiration_date")
-            option_type = arguments.get("option_type")
-            strike_price = arguments.get("strike_price")
-            contracts = await asyncio.to_thread(
-                options_service.get_options_chain,
-                symbol,
-                expiration_date,
-                option_type,
-                strike_price,
+    elif name == "robinhood.portfolio.positions":
+        symbols = arguments.get("symbols")
+        positions = portfolio_service.get_positions(symbols)
+        return [
+            TextContent(
+                type="text", text=json.dumps([p.model_dump() for p in positions])
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([c.model_dump() for c in contracts])
-                )
-            ]
+        ]
 
-        elif name == "robinhood.options.positions":
-            positions = await asyncio.to_thread(
-                options_service.get_option_positions,
+    elif name == "robinhood.watchlists.list":
+        watchlists = watchlists_service.get_watchlists()
+        return [
+            TextContent(
+                type="text", text=json.dumps([w.model_dump() for w in watchlists])
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([p.model_dump() for p in positions])
-                )
-            ]
+        ]
 
-        elif name == "robinhood.portfolio.summary":
-            summary = portfolio_service.get_portfolio_summary()
-            return [TextContent(type="text", text=json.dumps(summary.model_dump()))]
+    elif name == "robinhood.news.latest":
+        symbol = arguments["symbol"]
+        news = news_service.get_news(symbol)
+        return [
+            TextContent(
+                type="text", text=json.dumps([n.model_dump() for n in news])
+            )
+        ]
 
-        elif name == "robinhood.portfolio.positions":
-            symbols = arguments.get("symbols")
-            positions = portfolio_service.get_positions(symbols)
-            return [
-                TextContent(
-                    type="text", text=json.dumps([p.model_dump() for p in positions])
-                )
-            ]
+    elif name == "robinhood.fundamentals.get":
+        symbol = arguments["symbol"]
+        fundamentals = fundamentals_service.get_fundamentals(symbol)
+        return [
+            TextContent(
+                type="text", text=json.dumps(fundamentals.model_dump())
+            )
+        ]
 
-        elif name == "robinhood.watchlists.list":
-            watchlists = watchlists_service.get_watchlists()
+    elif name == "robinhood.auth.status":
+        try:
+            client.ensure_session()
             return [
-                TextContent(
-                    type="text", text=json.dumps([w.model_dump() for w in watchlists])
-                )
+                TextContent(type="text", text=json.dumps({"authenticated": True}))
             ]
-
-        elif name == "robinhood.news.latest":
-            symbol = arguments["symbol"]
-            news = await asyncio.to_thread(news_service.get_news, symbol)
+        except AuthRequiredError:
             return [
                 TextContent(
-                    type="text", text=json.dumps([n.model_dump() for n in news])
+                    type="text",
+                    text=json.dumps(
+                        {"authenticated": False, "error": "Authentication required"}
+                    ),
                 )
             ]
 
-        elif name == "robinhood.fundamentals.get":
-            symbol = arguments["symbol"]
-            fundamentals = await asyncio.to_thread(
-                fundamentals_service.get_fundamentals, symbol
+    elif name == "robinhood.orders.history":
+        order_type = arguments.get("type", "all")
+        symbol = arguments.get("symbol")
+        start_date = arguments.get("start_date")
+        limit = arguments.get("limit")
+        if limit is None:
+            limit = ORDER_HISTORY_DEFAULT_LIMIT
+        try:
+            limit = min(int(limit), ORDER_HISTORY_MAX_LIMIT)
+        except (TypeError, ValueError):
+            raise InvalidArgumentError(f"limit must be an integer, got {limit!r}")
+        history = orders_service.get_order_history(
+            order_type,
+            symbol,
+            start_date,
+            limit,
+            arguments.get("end_date"),
+            arguments.get("state"),
+            arguments.get("cursor"),
+        )
+        return [
+            TextContent(
+                type="text", text=json.dumps(history.model_dump())
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps(fundamentals.model_dump())
-                )
-            ]
+        ]
 
-        elif name == "robinhood.auth.status":
-            try:
-                client.ensure_session()
-                return [
-                    TextContent(type="text", text=json.dumps({"authenticated": True}))
-                ]
-            except AuthRequiredError:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {"authenticated": False, "error": "Authentication required"}
-                        ),
-                    )
-                ]
-
-        elif name == "robinhood.orders.history":
-            order_type = arguments.get("type", "all")
-            symbol = arguments.get("symbol")
-            start_date = arguments.get("start_date")
-            history = await asyncio.to_thread(
-                orders_service.get_order_history,
-                order_type,
-                symbol,
-                start_date,
+    else:
+        return [
+            TextContent(
+                type="text", text=json.dumps({"error": f"Unknown tool: {name}"})
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps(history.model_dump())
-                )
-            ]
+        ]
 
-        else:
-            return [
-                TextContent(
-                    type="text", text=json.dumps({"error": f"Unknown tool: {name}"})
-                )
-            ]
 
+def _call_key(name: str, arguments: Optional[dict]) -> Tuple[str, str]:
+    """Key identifying calls that must return the same result."""
+    normalized = {k: v for k, v in (arguments or {}).items() if v is not None}
+    return name, json.dumps(normalized, sort_keys=True, default=str)
+
+
+@mcp.call_tool()
+async def call_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Handle tool calls.
+
+    Concurrent calls with the same tool name and arguments share a single
+    execution and its result.  Nothing is cached once the call finishes.
+    """
+    assert client is not None, "Services not initialized. Call _init_services() first."
+    assert market_service is not None
+    assert options_service is not None
+    assert portfolio_service is not None
+    assert watchlists_service is not None
+    assert news_service is not None
+    assert fundamentals_service is not None
+
+    key = _call_key(name, arguments)
+    task = _inflight.get(key)
+    if task is None:
+        logger.debug("Tool called: %s", name)
+        task = asyncio.ensure_future(_execute_tool(name, arguments))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug("Tool called: %s (joining in-flight call)", name)
+    # Shielded so one caller going away does not cancel the others.
+    return await asyncio.shield(task)
+
+
+async def _execute_tool(name: str, arguments: dict) -> List[TextContent]:
+    """Run a tool call and turn errors into error payloads.
+
+    Every handler runs on a worker thread so that blocking Robinhood calls
+    never stall the event loop.  At most ``max_concurrent_tools`` calls run
+    at once; the rest wait their turn.
+    """
+    try:
+        async with tool_slots:
+            return await asyncio.to_thread(_run_tool, name, arguments)
     except AuthRequiredError as e:
         logger.warning("Tool %s failed: AUTH_REQUIRED: %s", name, e)
         return [
@@ -503,6 +705,12 @@ def main():
         password=args.password,
         session_path=args.session_path,
         allow_mfa=args.allow_mfa,
+        max_concurrent_tools=args.max_concurrent_tools,
+        pool_connections=args.pool_connections,
+        pool_maxsize=args.pool_maxsize,
+        keep_alive=args.keep_alive,
+        gzip=args.gzip,
+        order_journal=args.order_journal,
     )
     asyncio.run(run_server())
 
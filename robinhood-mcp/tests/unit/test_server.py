@@ -1,7 +1,8 @@
 # tests/unit/test_server.py
-import pytest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 def test_server_imports():
     from robin_stocks_mcp.server import mcp
@@ -29,6 +30,11 @@ def test_parse_args_defaults():
     assert args.password is None
     assert args.session_path is None
     assert args.allow_mfa is None
+    assert args.max_concurrent_tools is None
+    assert args.pool_maxsize is None
+    assert args.keep_alive is None
+    assert args.gzip is None
+    assert args.order_journal is None
 
 
 def test_parse_args_with_values():
@@ -43,8 +49,23 @@ def test_parse_args_with_values():
             "--session-path",
             "/tmp/session.json",
             "--allow-mfa",
+            "--max-concurrent-tools",
+            "4",
+            "--pool-connections",
+            "2",
+            "--pool-maxsize",
+            "64",
+            "--no-keep-alive",
+            "--no-gzip",
+            "--order-journal",
         ]
     )
+    assert args.max_concurrent_tools == 4
+    assert args.pool_connections == 2
+    assert args.pool_maxsize == 64
+    assert args.keep_alive is False
+    assert args.gzip is False
+    assert args.order_journal is True
     assert args.username == "myuser"
     assert args.password == "mypass"
     assert args.session_path == "/tmp/session.json"
@@ -52,8 +73,8 @@ def test_parse_args_with_values():
 
 
 def test_init_services_creates_all_services():
-    from robin_stocks_mcp.server import _init_services
     import robin_stocks_mcp.server as srv
+    from robin_stocks_mcp.server import _init_services
 
     _init_services(username="u", password="p")
     assert srv.client is not None
@@ -68,8 +89,8 @@ def test_init_services_creates_all_services():
 
 
 def test_init_services_passes_all_args():
-    from robin_stocks_mcp.server import _init_services
     import robin_stocks_mcp.server as srv
+    from robin_stocks_mcp.server import _init_services
 
     _init_services(
         username="u",
@@ -83,12 +104,51 @@ def test_init_services_passes_all_args():
     assert srv.client._allow_mfa is True
 
 
+def test_init_services_passes_pool_settings():
+    import robin_stocks_mcp.server as srv
+    from robin_stocks_mcp.server import _init_services
+
+    _init_services(username="u", password="p", pool_maxsize=48, gzip=False)
+    assert srv.client._pool_maxsize == 48
+    assert srv.client._gzip is False
+
+    _init_services(username="u", password="p")
+
+
+def test_init_services_order_journal_is_opt_in(monkeypatch):
+    import robin_stocks_mcp.server as srv
+    from robin_stocks_mcp.server import _init_services
+
+    monkeypatch.delenv("RH_ORDER_JOURNAL", raising=False)
+    _init_services(username="u", password="p")
+    assert srv.orders_service.journal is None
+
+    monkeypatch.setenv("RH_ORDER_JOURNAL", "1")
+    _init_services(username="u", password="p")
+    assert srv.orders_service.journal is not None
+
+    _init_services(username="u", password="p", order_journal=False)
+    assert srv.orders_service.journal is None
+
+
+def test_init_services_max_concurrent_tools(monkeypatch):
+    import robin_stocks_mcp.server as srv
+    from robin_stocks_mcp.server import _init_services
+
+    monkeypatch.setenv("RH_MAX_CONCURRENT_TOOLS", "3")
+    _init_services(username="u", password="p")
+    assert srv.tool_slots._value == 3
+
+    _init_services(username="u", password="p", max_concurrent_tools=5)
+    assert srv.tool_slots._value == 5
+
+
 @pytest.mark.asyncio
 async def test_list_tools_returns_tools():
     from robin_stocks_mcp.server import list_tools
 
     tools = await list_tools()
-    assert len(tools) == 12
+    assert len(tools) == 13
 
     tool_names = [tool.name for tool in tools]
     expected_tools = [
@@ -98,6 +158,7 @@ async def test_list_tools_returns_tools():
         "robinhood.options.chain",
         "robinhood.options.positions",
         "robinhood.portfolio.summary",
+        "robinhood.portfolio.snapshot",
         "robinhood.portfolio.positions",
         "robinhood.watchlists.list",
         "robinhood.news.latest",
@@ -176,6 +237,129 @@ async def test_call_tool_options_chain():
         assert '"symbol": "AAPL"' in result[0].text
 
 
+@pytest.mark.asyncio
+async def test_call_tool_options_chain_strike_ladder():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.options_service") as mock_service:
+        mock_service.get_options_chain.return_value = []
+
+        await call_tool(
+            "robinhood.options.chain",
+            {"symbol": "AAPL", "strike_prices": ["145", "150"]},
+        )
+        await call_tool(
+            "robinhood.options.chain",
+            {"symbol": "AAPL", "strikes_around_atm": 10},
+        )
+
+        first, second = mock_service.get_options_chain.call_args_list
+        assert first.args == ("AAPL", None, None, None, ["145", "150"], None, False)
+        assert second.args == ("AAPL", None, None, None, None, 10, False)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_options_chain_with_market_data():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.options_service") as mock_service:
+        mock_service.get_options_chain.return_value = []
+
+        await call_tool(
+            "robinhood.options.chain",
+            {"symbol": "AAPL", "with_market_data": True},
+        )
+
+        mock_service.get_options_chain.assert_called_once_with(
+            "AAPL", None, None, None, None, None, True
+        )
+
+
+@pytest.mark.asyncio
+async def test_call_tool_orders_history_rejects_non_integer_limit():
+    from robinhood_core.models import OrderHistory
+
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.orders_service") as mock_service:
+        mock_service.get_order_history.return_value = OrderHistory()
+
+        result = await call_tool("robinhood.orders.history", {"limit": "ten"})
+        coerced = await call_tool("robinhood.orders.history", {"limit": "20"})
+
+        assert "INVALID_ARGUMENT: limit must be an integer" in result[0].text
+        assert '"stock_orders": []' in coerced[0].text
+        mock_service.get_order_history.assert_called_once()
+        assert mock_service.get_order_history.call_args.args[3] == 20
+
+
+@pytest.mark.asyncio
+async def test_call_tool_orders_history_is_paged():
+    from robinhood_core.models import OrderHistory
+
+    from robin_stocks_mcp.server import (
+        ORDER_HISTORY_DEFAULT_LIMIT,
+        ORDER_HISTORY_MAX_LIMIT,
+        call_tool,
+    )
+
+    with patch("robin_stocks_mcp.server.orders_service") as mock_service:
+        mock_service.get_order_history.return_value = OrderHistory(
+            next_cursor="next-page"
+        )
+
+        result = await call_tool("robinhood.orders.history", {"type": "stock"})
+        await call_tool(
+            "robinhood.orders.history",
+            {
+                "limit": 10_000,
+                "end_date": "2026-01-31",
+                "state": "filled",
+                "cursor": "next-page",
+            },
+        )
+
+        assert '"next_cursor": "next-page"' in result[0].text
+        first, second = mock_service.get_order_history.call_args_list
+        assert first.args == (
+            "stock",
+            None,
+            None,
+            ORDER_HISTORY_DEFAULT_LIMIT,
+            None,
+            None,
+            None,
+        )
+        assert second.args == (
+            "all",
+            None,
+            None,
+            ORDER_HISTORY_MAX_LIMIT,
+            "2026-01-31",
+            "filled",
+            "next-page",
+        )
+
+
+@pytest.mark.asyncio
+async def test_call_tool_portfolio_snapshot():
+    from robinhood_core.models import PortfolioSnapshot, PortfolioSummary
+
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.portfolio_service") as mock_service:
+        mock_service.get_snapshot.return_value = PortfolioSnapshot(
+            summary=PortfolioSummary(equity=100, cash=10, buying_power=20)
+        )
+
+        result = await call_tool("robinhood.portfolio.snapshot", {})
+
+        mock_service.get_snapshot.assert_called_once_with()
+        assert '"equity": 100.0' in result[0].text
+        assert '"positions": []' in result[0].text
+        assert '"option_positions": []' in result[0].text
+
+
 @pytest.mark.asyncio
 async def test_call_tool_portfolio_summary():
     from robin_stocks_mcp.server import call_tool
@@ -233,6 +417,92 @@ async def test_call_tool_watchlists():
         assert '"name": "My Watchlist"' in result[0].text
 
 
+@pytest.mark.asyncio
+async def test_call_tool_runs_handlers_off_the_event_loop():
+    import asyncio
+    import threading
+
+    from robin_stocks_mcp.server import call_tool
+
+    loop_thread = threading.get_ident()
+    seen = []
+
+    def get_watchlists():
+        seen.append(threading.get_ident())
+        return []
+
+    with patch("robin_stocks_mcp.server.watchlists_service") as mock_service:
+        mock_service.get_watchlists.side_effect = get_watchlists
+
+        await asyncio.wait_for(call_tool("robinhood.watchlists.list", {}), 5)
+
+    assert seen and seen[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_call_tool_limits_concurrent_calls():
+    import asyncio
+    import threading
+    import time
+
+    from robin_stocks_mcp.server import call_tool
+
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def get_news(symbol):
+        with lock:
+            running.append(symbol)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(symbol)
+        return []
+
+    with patch("robin_stocks_mcp.server.news_service") as mock_service, patch(
+        "robin_stocks_mcp.server.tool_slots", asyncio.Semaphore(2)
+    ):
+        mock_service.get_news.side_effect = get_news
+
+        await asyncio.gather(
+            *(call_tool("robinhood.news.latest", {"symbol": f"S{i}"}) for i in range(6))
+        )
+
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_execution():
+    import asyncio
+    import time
+
+    from robin_stocks_mcp.server import call_tool
+
+    def get_positions(symbols):
+        time.sleep(0.05)
+        return []
+
+    with patch("robin_stocks_mcp.server.portfolio_service") as mock_service:
+        mock_service.get_positions.side_effect = get_positions
+
+        results = await asyncio.gather(
+            call_tool("robinhood.portfolio.positions", {"symbols": ["AAPL"]}),
+            call_tool("robinhood.portfolio.positions", {"symbols": ["AAPL"]}),
+            call_tool(
+                "robinhood.portfolio.positions", {"symbols": ["AAPL"], "x": None}
+            ),
+            call_tool("robinhood.portfolio.positions", {"symbols": ["MSFT"]}),
+        )
+
+        assert results[0] == results[1] == results[2]
+        assert mock_service.get_positions.call_count == 2
+
+        # Finished calls are not reused.
+        await call_tool("robinhood.portfolio.positions", {"symbols": ["AAPL"]})
+        assert mock_service.get_positions.call_count == 3
+
+
 @pytest.mark.asyncio
 async def test_call_tool_news():
     from robin_stocks_mcp.server import call_tool
@@ -285,9 +555,10 @@ async def test_call_tool_auth_status_authenticated():
 
 @pytest.mark.asyncio
 async def test_call_tool_auth_status_not_authenticated():
-    from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import AuthRequiredError
 
+    from robin_stocks_mcp.server import call_tool
+
     with patch("robin_stocks_mcp.server.client") as mock_client:
         mock_client.ensure_session.side_effect = AuthRequiredError("Not authenticated")
 
@@ -310,9 +581,10 @@ async def test_call_tool_unknown_tool():
 
 @pytest.mark.asyncio
 async def test_call_tool_handles_auth_required_error():
-    from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import AuthRequiredError
 
+    from robin_stocks_mcp.server import call_tool
+
     with patch("robin_stocks_mcp.server.market_service") as mock_service:
         mock_service.get_current_price.side_effect = AuthRequiredError("Auth required")
 
@@ -326,9 +598,10 @@ async def test_call_tool_handles_auth_required_error():
 
 @pytest.mark.asyncio
 async def test_call_tool_handles_invalid_argument_error():
-    from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import InvalidArgumentError
 
+    from robin_stocks_mcp.server import call_tool
+
     with patch("robin_stocks_mcp.server.market_service") as mock_service:
         mock_service.get_current_price.side_effect = InvalidArgumentError(
             "Invalid argument"
@@ -342,9 +615,10 @@ async def test_call_tool_handles_invalid_argument_error():
 
 @pytest.mark.asyncio
 async def test_call_tool_handles_robinhood_api_error():
-    from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import RobinhoodAPIError
 
+    from robin_stocks_mcp.server import call_tool
+
     with patch("robin_stocks_mcp.server.market_service") as mock_service:
         mock_service.get_current_price.side_effect = RobinhoodAPIError("API error")
 
@@ -358,9 +632,10 @@ async def test_call_tool_handles_robinhood_api_error():
 
 @pytest.mark.asyncio
 async def test_call_tool_handles_network_error():
-    from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import NetworkError
 
+    from robin_stocks_mcp.server import call_tool
+
     with patch("robin_stocks_mcp.server.market_service") as mock_service:
         mock_service.get_current_price.side_effect = NetworkError("Network error")
 